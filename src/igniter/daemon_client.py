@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""Thin client of QuadPype warm-start daemon.
+
+Client does not import anything from QuadPype so it can be used by bootstrap
+code or executed directly by any Python 3.9+ interpreter, e.g. from farm
+pre-job hooks:
+
+    python igniter/daemon_client.py extractenvironments <path> --project ...
+
+Command is executed by a worker forked from the daemon started with
+`quadpype daemon`. Standard streams of the client are passed to the worker
+and the client exits with the worker exit code.
+
+Socket is created in a directory accessible only by the user. Client sends
+its environment only to a socket owned by the same user, so a socket
+created by another user is never used.
+"""
+import os
+import sys
+import json
+import stat
+import socket
+import struct
+import tempfile
+
+DAEMON_SOCKET_ENV_KEY = "QUADPYPE_DAEMON_SOCKET"
+DAEMON_SOCKET_FILENAME = "quadpype-daemon.sock"
+
+# Global options of command line followed by a value
+_VALUE_OPTIONS = (
+    "--use-version",
+    "--validate-version",
+    "--verbose",
+    "--additional-env-file",
+)
+
+# Daemon response to a request
+REQUEST_ACCEPTED = b"1"
+REQUEST_REJECTED = b"0"
+
+
+def is_daemon_supported():
+    """Daemon needs unix sockets with passing of file descriptors."""
+    return hasattr(socket, "AF_UNIX") and hasattr(socket, "send_fds")
+
+
+def get_daemon_socket_dir():
+    """Default directory of daemon socket.
+
+    Returns:
+        str: 'XDG_RUNTIME_DIR' if set, otherwise directory of the user in
+            temp directory.
+    """
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return runtime_dir
+    user_id = getattr(os, "getuid", lambda: "user")()
+    return os.path.join(
+        tempfile.gettempdir(), "quadpype-daemon-{}".format(user_id)
+    )
+
+
+def get_daemon_socket_path():
+    """Path to unix socket of the daemon.
+
+    Returns:
+        str: Path from 'QUADPYPE_DAEMON_SOCKET' environment variable or
+            default path in user's socket directory.
+    """
+    socket_path = os.getenv(DAEMON_SOCKET_ENV_KEY)
+    if socket_path:
+        return socket_path
+    return os.path.join(get_daemon_socket_dir(), DAEMON_SOCKET_FILENAME)
+
+
+def is_socket_dir_private(socket_dir):
+    """Directory is owned by the user and other users can't access it.
+
+    Args:
+        socket_dir (str): Path to directory.
+
+    Returns:
+        bool: Directory can hold daemon socket.
+    """
+    try:
+        dir_stat = os.lstat(socket_dir)
+    except OSError:
+        return False
+    return (
+        stat.S_ISDIR(dir_stat.st_mode)
+        and dir_stat.st_uid == os.getuid()
+        and not dir_stat.st_mode & 0o077
+    )
+
+
+def is_daemon_socket_trusted(socket_path):
+    """Socket is owned by the user and is in a private directory.
+
+    Args:
+        socket_path (str): Path to daemon socket.
+
+    Returns:
+        bool: Requests can be sent to the socket.
+    """
+    if not is_socket_dir_private(os.path.dirname(socket_path) or "."):
+        return False
+    try:
+        socket_stat = os.lstat(socket_path)
+    except OSError:
+        return False
+    return (
+        stat.S_ISSOCK(socket_stat.st_mode)
+        and socket_stat.st_uid == os.getuid()
+    )
+
+
+def get_peer_uid(sock):
+    """User id of process on the other side of connected unix socket.
+
+    Returns:
+        Union[int, None]: User id or None if platform does not provide
+            credentials of peer.
+    """
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    creds = sock.getsockopt(
+        socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")
+    )
+    _pid, uid, _gid = struct.unpack("3i", creds)
+    return uid
+
+
+def get_command_name(argv):
+    """Name of QuadPype command in command line arguments.
+
+    Values of global options are skipped, so they're never taken as
+    the command.
+
+    Args:
+        argv (list[str]): QuadPype command line arguments.
+
+    Returns:
+        Union[str, None]: Command name or None if command is not passed.
+    """
+    args = iter(argv)
+    for arg in args:
+        if arg in _VALUE_OPTIONS:
+            next(args, None)
+        elif not arg.startswith("-"):
+            return arg
+    return None
+
+
+def recv_exact(sock, size):
+    """Receive exact number of bytes from socket.
+
+    Returns:
+        Union[bytes, None]: Received data or None if socket was closed.
+    """
+    chunks = []
+    while size:
+        chunk = sock.recv(size)
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def run_in_daemon(argv, env=None, cwd=None, socket_path=None):
+    """Run QuadPype command in a worker of the daemon.
+
+    Args:
+        argv (list[str]): QuadPype command line arguments.
+        env (Optional[dict[str, str]]): Environment of the command.
+            Current environment is used if not passed.
+        cwd (Optional[str]): Working directory of the command.
+            Current working directory is used if not passed.
+        socket_path (Optional[str]): Path to daemon socket.
+
+    Returns:
+        Union[int, None]: Exit code of the command or None if daemon is
+            not available or rejected the request.
+    """
+    if not is_daemon_supported():
+        return None
+
+    if socket_path is None:
+        socket_path = get_daemon_socket_path()
+    if not is_daemon_socket_trusted(socket_path):
+        return None
+
+    request = json.dumps({
+        "argv": list(argv),
+        "env": dict(os.environ if env is None else env),
+        "cwd": cwd or os.getcwd(),
+    }).encode("utf-8")
+
+    # Worker writes directly to the same streams
+    for stream in (sys.stdout, sys.stderr):
+        if stream is not None:
+            stream.flush()
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    with sock:
+        try:
+            sock.connect(socket_path)
+            # Environment is sent only to daemon of the same user
+            peer_uid = get_peer_uid(sock)
+            if peer_uid is not None and peer_uid != os.getuid():
+                return None
+            socket.send_fds(
+                sock, [struct.pack("!I", len(request))], [0, 1, 2]
+            )
+            sock.sendall(request)
+            if recv_exact(sock, 1) != REQUEST_ACCEPTED:
+                return None
+        except OSError:
+            return None
+
+        try:
+            exit_code = recv_exact(sock, 4)
+        except OSError:
+            exit_code = None
+
+    # Worker died without reporting exit code
+    if exit_code is None:
+        return 1
+    return struct.unpack("!i", exit_code)[0]
+
+
+def main(argv):
+    exit_code = run_in_daemon(argv)
+    if exit_code is None:
+        sys.stderr.write(
+            "!!! QuadPype daemon is not available at \"{}\".\n".format(
+                get_daemon_socket_path()
+            )
+        )
+        return 1
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
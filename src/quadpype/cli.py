@@ -71,6 +71,21 @@ def tray():
     PypeCommands().launch_tray()
 
 
+@main.command()
+@click.option("--socket", "socket_path", default=None,
+              envvar="QUADPYPE_DAEMON_SOCKET",
+              help="Path to unix socket of the daemon")
+def daemon(socket_path):
+    """Run QuadPype warm-start daemon.
+
+    Booted daemon serves commands sent by the thin client
+    ('igniter/daemon_client.py') or by QuadPype executable when
+    'QUADPYPE_DAEMON_SOCKET' environment variable is set. Each command runs
+    in a worker forked from the daemon so bootstrap is skipped.
+    """
+    PypeCommands.launch_daemon(socket_path)
+
+
 @PypeCommands.add_modules
 @main.group(help="Run command line arguments of QuadPype addons")
 @click.pass_context
@@ -150,7 +165,14 @@ def webpublisherwebserver(executable, upload_dir, host=None, port=None):
 @click.option(
     "--envgroup", help="Environment group (e.g. \"farm\")", default=None
 )
-def extractenvironments(output_json_path, project, asset, task, app, envgroup):
+@click.option(
+    "--snapshot",
+    help="Path where environment snapshot for other tasks is stored",
+    default=None
+)
+def extractenvironments(
+    output_json_path, project, asset, task, app, envgroup, snapshot
+):
     """Extract environment variables for entered context to a json file.
 
     Entered output filepath will be created if does not exists.
@@ -161,7 +183,7 @@ def extractenvironments(output_json_path, project, asset, task, app, envgroup):
     Context options are "project", "asset", "task", "app"
     """
     PypeCommands.extractenvironments(
-        output_json_path, project, asset, task, app, envgroup
+        output_json_path, project, asset, task, app, envgroup, snapshot
     )
 
 
@@ -171,14 +193,19 @@ def extractenvironments(output_json_path, project, asset, task, app, envgroup):
               multiple=True)
 @click.option("-g", "--gui", is_flag=True,
               help="Show Publish UI", default=False)
-def publish(paths, targets, gui):
+@click.option("-w", "--workers", type=int, default=None,
+              envvar="QUADPYPE_PUBLISH_WORKERS",
+              help="Number of threads processing instances in parallel")
+@click.option("--timeline", help="Path to json file with publish timeline",
+              default=None)
+def publish(paths, targets, gui, workers, timeline):
     """Start CLI publishing.
 
     Publish collects json from paths provided as an argument.
     More than one path is allowed.
     """
 
-    PypeCommands.publish(list(paths), targets, gui)
+    PypeCommands.publish(list(paths), targets, gui, workers, timeline)
 
 
 @main.command(context_settings={"ignore_unknown_options": True})
@@ -1,67 +1,96 @@
-from .mongo import (
-    QuadPypeMongoConnection,
-    get_quadpype_database,
-    get_quadpype_collection,
-    save_project_timestamp
-)
-
-from .mongo.entities import (
-    get_projects,
-    get_project,
-    get_whole_project,
-
-    get_projects_last_updates,
-    get_project_last_update,
-
-    get_asset_by_id,
-    get_asset_by_name,
-    get_assets,
-    get_archived_assets,
-    get_asset_ids_with_subsets,
-
-    get_subset_by_id,
-    get_subset_by_name,
-    get_subsets,
-    get_subset_families,
-
-    get_version_by_id,
-    get_version_by_name,
-    get_versions,
-    get_hero_version_by_id,
-    get_hero_version_by_subset_id,
-    get_hero_versions,
-    get_last_versions,
-    get_last_version_by_subset_id,
-    get_last_version_by_subset_name,
-    get_output_link_versions,
-
-    version_is_latest,
-
-    get_representation_by_id,
-    get_representation_by_name,
-    get_representations,
-    get_representation_parents,
-    get_representations_parents,
-    get_archived_representations,
-
-    get_thumbnail,
-    get_thumbnails,
-    get_thumbnail_id_from_source,
-
-    get_workfile_info
-)
-
-from .mongo.entity_links import (
-    get_linked_asset_ids,
-    get_casted_assets,
-    get_shots_in_seq,
-    get_linked_assets,
-    get_linked_representation_id,
-)
-
-from .operations import (
-    create_project,
-)
+import importlib
+
+# Exports are imported on first access, so importing a single helper does
+#   not import every entity function (and pymongo) with it.
+_LAZY_EXPORTS = {
+    ".mongo": (
+        "QuadPypeMongoConnection",
+        "get_quadpype_database",
+        "get_quadpype_collection",
+        "save_project_timestamp",
+    ),
+    ".mongo.entities": (
+        "get_projects",
+        "get_project",
+        "get_whole_project",
+
+        "get_projects_last_updates",
+        "get_project_last_update",
+
+        "get_asset_by_id",
+        "get_asset_by_name",
+        "get_assets",
+        "get_archived_assets",
+        "get_asset_ids_with_subsets",
+
+        "get_subset_by_id",
+        "get_subset_by_name",
+        "get_subsets",
+        "get_subset_families",
+
+        "get_version_by_id",
+        "get_version_by_name",
+        "get_versions",
+        "get_hero_version_by_id",
+        "get_hero_version_by_subset_id",
+        "get_hero_versions",
+        "get_last_versions",
+        "get_last_version_by_subset_id",
+        "get_last_version_by_subset_name",
+        "get_output_link_versions",
+
+        "version_is_latest",
+
+        "get_representation_by_id",
+        "get_representation_by_name",
+        "get_representations",
+        "get_representation_parents",
+        "get_representations_parents",
+        "get_archived_representations",
+
+        "get_thumbnail",
+        "get_thumbnails",
+        "get_thumbnail_id_from_source",
+
+        "get_workfile_info",
+    ),
+    ".mongo.entity_links": (
+        "get_linked_asset_ids",
+        "get_casted_assets",
+        "get_shots_in_seq",
+        "get_linked_assets",
+        "get_linked_representation_id",
+    ),
+    ".operations": (
+        "create_project",
+    ),
+}
+_LAZY_EXPORTS_MODULES = {
+    name: module_name
+    for module_name, names in _LAZY_EXPORTS.items()
+    for name in names
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS_MODULES.get(name)
+    if module_name is None:
+        try:
+            return importlib.import_module(".{}".format(name), __name__)
+        except ModuleNotFoundError as exc:
+            if exc.name != "{}.{}".format(__name__, name):
+                raise
+        raise AttributeError(
+            "module '{}' has no attribute '{}'".format(__name__, name)
+        )
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS_MODULES))
 
 
 __all__ = (
@@ -12,7 +12,7 @@ from quadpype.client.operations_base import (
     DeleteOperation,
     BaseOperationsSession
 )
-from .mongo import get_project_connection
+from .mongo import get_project_connection, save_project_timestamp
 from .entities import get_project
 
 
@@ -505,6 +505,12 @@ class MongoOperationsSession(BaseOperationsSession):
             if bulk_writes:
                 collection = get_project_connection(project_name)
                 collection.bulk_write(bulk_writes)
+                # Let asset hierarchy caches know that assets changed
+                if any(
+                    operation.entity_type == "asset"
+                    for operation in operations
+                ):
+                    save_project_timestamp(project_name)
 
     def create_entity(self, project_name, entity_type, data):
         """Fast access to 'MongoCreateOperation'.
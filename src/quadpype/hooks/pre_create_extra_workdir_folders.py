@@ -15,13 +15,13 @@ class CreateWorkdirExtraFolders(PreLaunchHook):
     # Execute after workfile template copy
     order = 15
     launch_types = {LaunchTypes.local}
+    dependencies = {"GlobalHostDataHook", "CopyTemplateWorkfile"}
 
     def execute(self):
         if not self.application.is_host:
             return
 
-        env = self.data.get("env") or {}
-        workdir = env.get("AVALON_WORKDIR")
+        workdir = self.env.get("AVALON_WORKDIR")
         if not workdir or not os.path.exists(workdir):
             return
 
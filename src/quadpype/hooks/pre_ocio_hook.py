@@ -23,6 +23,9 @@ class OCIOEnvHook(PreLaunchHook):
         "openrv"
     }
     launch_types = set()
+    # Config resolving may query OCIO in a subprocess, no other hook needs
+    #   the result
+    dependencies = {"GlobalHostDataHook"}
 
     def execute(self):
         """Hook entry method."""
@@ -41,7 +44,7 @@ class OCIOEnvHook(PreLaunchHook):
             project_settings=self.data[PROJECT_SETTINGS_KEY],
             anatomy_data=template_data,
             anatomy=self.data["anatomy"],
-            env=self.launch_context.env,
+            env=self.env,
         )
 
         if config_data:
@@ -53,6 +56,6 @@ class OCIOEnvHook(PreLaunchHook):
             self.log.info(
                 f"Setting OCIO environment to config path: {ocio_path}")
 
-            self.launch_context.env["OCIO"] = ocio_path
+            self.env["OCIO"] = ocio_path
         else:
             self.log.debug("OCIO not set or enabled")
@@ -11,7 +11,7 @@ from abc import ABC, abstractmethod
 import platform
 
 from quadpype.lib import Logger
-from quadpype.modules import ModulesManager
+from quadpype.modules import get_modules_manager
 from quadpype.settings import get_project_settings
 
 
@@ -46,7 +46,7 @@ class HostDirmap(ABC):
     def sync_module(self):
         if not self._sync_module_discovered:
             self._sync_module_discovered = True
-            manager = ModulesManager()
+            manager = get_modules_manager()
             self._sync_module = manager.get("sync_server")
         return self._sync_module
 
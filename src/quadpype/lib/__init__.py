@@ -5,6 +5,7 @@
 import sys
 import os
 import site
+import importlib
 from quadpype import PACKAGE_DIR
 
 # Add Python version specific vendor folder
@@ -16,46 +17,192 @@ sys.path.insert(0, python_version_dir)
 site.addsitedir(python_version_dir)
 
 
-from .events import (
-    emit_event,
-    register_event_callback
-)
-
-from .vendor_bin_utils import (
-    ToolNotFoundError,
-    find_executable,
-    get_vendor_bin_path,
-    get_oiio_tools_path,
-    get_oiio_tool_args,
-    get_ffmpeg_tool_path,
-    get_ffmpeg_tool_args,
-    is_oiio_supported
-)
-
-from .attribute_definitions import (
-    AbstractAttrDef,
-
-    UIDef,
-    UISeparatorDef,
-    UILabelDef,
-
-    UnknownDef,
-    NumberDef,
-    TextDef,
-    EnumDef,
-    BoolDef,
-    FileDef,
-    FileDefItem
-)
-
-from .env_tools import (
-    env_value_to_bool,
-    get_paths_from_environ
-)
-
+# Exports are imported on first access, except of submodules imported at
+#   the end of the file.
+_LAZY_EXPORTS = {
+    ".events": (
+        "emit_event",
+        "register_event_callback",
+    ),
+    ".vendor_bin_utils": (
+        "ToolNotFoundError",
+        "find_executable",
+        "get_vendor_bin_path",
+        "get_oiio_tools_path",
+        "get_oiio_tool_args",
+        "get_ffmpeg_tool_path",
+        "get_ffmpeg_tool_args",
+        "is_oiio_supported",
+    ),
+    ".attribute_definitions": (
+        "AbstractAttrDef",
+
+        "UIDef",
+        "UISeparatorDef",
+        "UILabelDef",
+
+        "UnknownDef",
+        "NumberDef",
+        "TextDef",
+        "EnumDef",
+        "BoolDef",
+        "FileDef",
+        "FileDefItem",
+    ),
+    ".env_tools": (
+        "env_value_to_bool",
+        "get_paths_from_environ",
+    ),
+    ".path_templates": (
+        "merge_dict",
+        "TemplateMissingKey",
+        "TemplateUnsolved",
+        "StringTemplate",
+        "TemplatesDict",
+        "FormatObject",
+    ),
+    ".dateutils": (
+        "get_datetime_data",
+        "get_timestamp_str",
+        "get_datetime_from_timestamp_str",
+        "get_formatted_current_time",
+    ),
+    ".python_module_tools": (
+        "import_filepath",
+        "modules_from_path",
+        "recursive_bases_from_class",
+        "classes_from_module",
+        "import_module_from_dirpath",
+        "is_func_signature_supported",
+    ),
+    ".profiles_filtering": (
+        "compile_list_of_regexes",
+        "filter_profiles",
+    ),
+    ".transcoding": (
+        "get_transcode_temp_directory",
+        "should_convert_for_ffmpeg",
+        "convert_for_ffmpeg",
+        "convert_input_paths_for_ffmpeg",
+        "get_ffprobe_data",
+        "get_ffprobe_streams",
+        "get_ffmpeg_codec_args",
+        "get_ffmpeg_format_args",
+        "convert_ffprobe_fps_value",
+        "convert_ffprobe_fps_to_float",
+        "get_rescaled_command_arguments",
+    ),
+    ".cache": (
+        "CacheValues",
+        "CoreSettingsCacheValues",
+        "GlobalSettingsCacheValues",
+        "UserSettingsCacheValues",
+        "ProjectSettingsCacheValues",
+        "ProjectAnatomyCacheValues",
+        "MaterializedSettingsCacheValues",
+    ),
+    ".registry": (
+        "IniSettingRegistry",
+        "JSONSettingRegistry",
+        "QuadPypeSecureRegistry",
+        "QuadPypeRegistry",
+        "get_app_registry",
+    ),
+    ".registry_ops": (
+        "change_quadpype_mongo_url",
+    ),
+    ".user": (
+        "get_user_id",
+        "get_local_site_id",
+        "get_quadpype_username",
+        "get_user_settings",
+        "save_user_settings",
+        "get_user_profile",
+        "get_all_user_profiles",
+        "get_user_workstation_info",
+    ),
+    ".applications": (
+        "ApplicationLaunchFailed",
+        "ApplicationExecutableNotFound",
+        "ApplicationNotFound",
+        "ApplicationManager",
+
+        "PreLaunchHook",
+        "PostLaunchHook",
+
+        "EnvironmentPrepData",
+        "prepare_app_environments",
+        "prepare_context_environments",
+        "get_app_environments_for_context",
+        "apply_project_environments_value",
+    ),
+    ".plugin_tools": (
+        "prepare_template_data",
+        "source_hash",
+    ),
+    ".path_tools": (
+        "format_file_size",
+        "collect_frames",
+        "create_hardlink",
+        "create_symlink",
+        "version_up",
+        "get_version_from_path",
+        "get_last_version_from_path",
+    ),
+    ".version_utils": (
+        "get_quadpype_version",
+        "get_build_version",
+        "get_expected_version",
+        "is_running_from_build",
+        "is_running_locally",
+        "is_running_staging",
+        "is_staging_enabled",
+        "is_current_version_studio_latest",
+        "is_current_version_higher_than_expected",
+    ),
+    ".pype_info": (
+        "get_all_current_info",
+        "get_quadpype_info",
+        "extract_pype_info_to_file",
+    ),
+    ".connections": (
+        "requests_get",
+        "requests_post",
+    ),
+}
+_LAZY_EXPORTS_MODULES = {
+    name: module_name
+    for module_name, names in _LAZY_EXPORTS.items()
+    for name in names
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS_MODULES.get(name)
+    if module_name is None:
+        # Submodules were available as attributes when imported eagerly
+        try:
+            return importlib.import_module(".{}".format(name), __name__)
+        except ModuleNotFoundError as exc:
+            if exc.name != "{}.{}".format(__name__, name):
+                raise
+        raise AttributeError(
+            "module '{}' has no attribute '{}'".format(__name__, name)
+        )
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS_MODULES))
+
+
+# Names of these submodules collide with exported names, so they can't be
+#   lazy (importing the submodule would replace the exported attribute).
 from .terminal import Terminal
 from .log import Logger
-
 from .execute import (
     get_quadpype_execute_args,
     get_linux_launcher_args,
@@ -69,136 +216,6 @@ from .execute import (
     CREATE_NO_WINDOW
 )
 
-from .path_templates import (
-    merge_dict,
-    TemplateMissingKey,
-    TemplateUnsolved,
-    StringTemplate,
-    TemplatesDict,
-    FormatObject
-)
-
-from .dateutils import (
-    get_datetime_data,
-    get_timestamp_str,
-    get_datetime_from_timestamp_str,
-    get_formatted_current_time
-)
-
-from .python_module_tools import (
-    import_filepath,
-    modules_from_path,
-    recursive_bases_from_class,
-    classes_from_module,
-    import_module_from_dirpath,
-    is_func_signature_supported
-)
-
-from .profiles_filtering import (
-    compile_list_of_regexes,
-    filter_profiles
-)
-
-from .transcoding import (
-    get_transcode_temp_directory,
-    should_convert_for_ffmpeg,
-    convert_for_ffmpeg,
-    convert_input_paths_for_ffmpeg,
-    get_ffprobe_data,
-    get_ffprobe_streams,
-    get_ffmpeg_codec_args,
-    get_ffmpeg_format_args,
-    convert_ffprobe_fps_value,
-    convert_ffprobe_fps_to_float,
-    get_rescaled_command_arguments
-)
-
-from .cache import (
-    CacheValues,
-    CoreSettingsCacheValues,
-    GlobalSettingsCacheValues,
-    UserSettingsCacheValues,
-    ProjectSettingsCacheValues,
-    ProjectAnatomyCacheValues
-)
-
-from .registry import (
-    IniSettingRegistry,
-    JSONSettingRegistry,
-    QuadPypeSecureRegistry,
-    QuadPypeRegistry,
-    get_app_registry
-)
-
-from .registry_ops import (
-    change_quadpype_mongo_url
-)
-
-from .user import (
-    get_user_id,
-    get_local_site_id,
-    get_quadpype_username,
-    get_user_settings,
-    save_user_settings,
-    get_user_profile,
-    get_all_user_profiles,
-    get_user_workstation_info
-)
-
-from .applications import (
-    ApplicationLaunchFailed,
-    ApplicationExecutableNotFound,
-    ApplicationNotFound,
-    ApplicationManager,
-
-    PreLaunchHook,
-    PostLaunchHook,
-
-    EnvironmentPrepData,
-    prepare_app_environments,
-    prepare_context_environments,
-    get_app_environments_for_context,
-    apply_project_environments_value
-)
-
-from .plugin_tools import (
-    prepare_template_data,
-    source_hash
-)
-
-from .path_tools import (
-    format_file_size,
-    collect_frames,
-    create_hardlink,
-    create_symlink,
-    version_up,
-    get_version_from_path,
-    get_last_version_from_path
-)
-
-from .version_utils import (
-    get_quadpype_version,
-    get_build_version,
-    get_expected_version,
-    is_running_from_build,
-    is_running_locally,
-    is_running_staging,
-    is_staging_enabled,
-    is_current_version_studio_latest,
-    is_current_version_higher_than_expected
-)
-
-from .pype_info import (
-    get_all_current_info,
-    get_quadpype_info,
-    extract_pype_info_to_file
-)
-
-from .connections import (
-    requests_get,
-    requests_post
-)
-
 terminal = Terminal
 
 __all__ = [
@@ -269,6 +286,7 @@ __all__ = [
     "UserSettingsCacheValues",
     "ProjectSettingsCacheValues",
     "ProjectAnatomyCacheValues",
+    "MaterializedSettingsCacheValues",
     "IniSettingRegistry",
     "JSONSettingRegistry",
     "QuadPypeSecureRegistry",
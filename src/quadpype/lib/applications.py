@@ -2,12 +2,16 @@ import os
 import sys
 import copy
 import json
+import time
+import hashlib
 import tempfile
 import platform
+import threading
 import collections
 import inspect
 import subprocess
 from abc import ABC, abstractmethod
+from concurrent import futures
 
 from quadpype import PACKAGE_DIR
 from quadpype.settings import (
@@ -792,6 +796,15 @@ class LaunchHook(ABC):
     # - if empty then is available for all launch types
     # - by default has 'local' which is most common reason for launc hooks
     launch_types = {LaunchTypes.local}
+    # Class names of hooks which must be finished before this hook
+    # - None means the hook is executed in the launching thread after
+    #   previous hooks without dependencies (by order)
+    # - hooks with defined dependencies are executed in a worker thread
+    #   concurrently with following hooks, so they must not use UI and
+    #   other hooks must not expect their result
+    # - they must use 'env' of the hook which is a copy of launch
+    #   environments, changes are applied when the hook is finished
+    dependencies = None
 
     def __init__(self, launch_context):
         """Constructor of launch hook.
@@ -801,6 +814,8 @@ class LaunchHook(ABC):
         self.log = Logger.get_logger(self.__class__.__name__)
 
         self.launch_context = launch_context
+        # Copy of environments used when executed in a worker thread
+        self._env = None
 
         is_valid = self.class_validation(launch_context)
         if is_valid:
@@ -849,6 +864,13 @@ class LaunchHook(ABC):
     def data(self):
         return self.launch_context.data
 
+    @property
+    def env(self):
+        """Launch environments which can be modified by the hook."""
+        if self._env is not None:
+            return self._env
+        return self.launch_context.env
+
     @property
     def application(self):
         return getattr(self.launch_context, "application", None)
@@ -919,6 +941,30 @@ class PostLaunchHook(LaunchHook):
         pass
 
 
+class _LaunchHooksCache:
+    lock = threading.Lock()
+    # Discovered hook classes by app group and hook paths
+    classes_by_key = {}
+
+
+def _get_launch_hook_paths_signature(paths):
+    """Modification times of hook files used to validate cached hooks."""
+    signature = []
+    for path in paths:
+        try:
+            entries = list(os.scandir(path))
+        except OSError:
+            signature.append((path, None))
+            continue
+
+        mtimes = [os.path.getmtime(path)]
+        for entry in entries:
+            if entry.name.endswith(".py"):
+                mtimes.append(entry.stat().st_mtime)
+        signature.append((path, max(mtimes)))
+    return tuple(signature)
+
+
 class ApplicationLaunchContext:
     """Context of launching application.
 
@@ -961,12 +1007,12 @@ class ApplicationLaunchContext:
         launch_type=None,
         **data
     ):
-        from quadpype.modules import ModulesManager
+        from quadpype.modules import get_modules_manager
 
         # Application object
         self.application = application
 
-        self.modules_manager = ModulesManager()
+        self.modules_manager = get_modules_manager()
 
         # Logger
         logger_name = "{}-{}".format(self.__class__.__name__,
@@ -1030,6 +1076,8 @@ class ApplicationLaunchContext:
 
         self.prelaunch_hooks = None
         self.postlaunch_hooks = None
+        # Execution time of launch hooks by class name
+        self.hook_timings = {}
 
         self.process = None
         self._prelaunch_hooks_executed = False
@@ -1167,25 +1215,7 @@ class ApplicationLaunchContext:
             "\n".join("- {}".format(path) for path in paths)
         ))
 
-        all_classes = {
-            "pre": [],
-            "post": []
-        }
-        for path in paths:
-            if not os.path.exists(path):
-                self.log.info(
-                    "Path to launch hooks does not exist: \"{}\"".format(path)
-                )
-                continue
-
-            modules, _crashed = modules_from_path(path)
-            for _filepath, module in modules:
-                all_classes["pre"].extend(
-                    classes_from_module(PreLaunchHook, module)
-                )
-                all_classes["post"].extend(
-                    classes_from_module(PostLaunchHook, module)
-                )
+        all_classes = self._get_launch_hook_classes(paths)
 
         for launch_type, classes in all_classes.items():
             hooks_with_order = []
@@ -1235,6 +1265,156 @@ class ApplicationLaunchContext:
             len(self.prelaunch_hooks), len(self.postlaunch_hooks)
         ))
 
+    def _get_launch_hook_classes(self, paths):
+        """Launch hook classes from paths.
+
+        Classes are cached by application group and paths, and are imported
+        again only when any hook file in the paths was changed.
+
+        Args:
+            paths (list[str]): Directory paths with launch hooks.
+
+        Returns:
+            dict[str, list[type[LaunchHook]]]: Pre and post launch hook
+                classes.
+        """
+        key = (self.app_group.name, tuple(paths))
+        signature = _get_launch_hook_paths_signature(paths)
+        with _LaunchHooksCache.lock:
+            cached = _LaunchHooksCache.classes_by_key.get(key)
+            if cached is not None and cached[0] == signature:
+                self.log.debug("Using cached launch hooks.")
+                return cached[1]
+
+            all_classes = {
+                "pre": [],
+                "post": []
+            }
+            for path in paths:
+                if not os.path.exists(path):
+                    self.log.info(
+                        "Path to launch hooks does not exist: \"{}\"".format(
+                            path
+                        )
+                    )
+                    continue
+
+                modules, _crashed = modules_from_path(path)
+                for _filepath, module in modules:
+                    all_classes["pre"].extend(
+                        classes_from_module(PreLaunchHook, module)
+                    )
+                    all_classes["post"].extend(
+                        classes_from_module(PostLaunchHook, module)
+                    )
+
+            _LaunchHooksCache.classes_by_key[key] = (signature, all_classes)
+        return all_classes
+
+    def _execute_hook(self, hook):
+        hook_name = hook.__class__.__name__
+        self.log.debug("Executing launch hook: {}".format(hook_name))
+        start = time.time()
+        try:
+            hook.execute()
+        finally:
+            self.hook_timings[hook_name] = time.time() - start
+
+    def _apply_hook_env_changes(self, hook, base_env):
+        """Apply environment changes of hook executed in worker thread."""
+        hook_env, hook._env = hook._env, None
+        for key, value in hook_env.items():
+            if base_env.get(key) != value:
+                self.env[key] = value
+
+        for key in base_env:
+            if key not in hook_env:
+                self.env.pop(key, None)
+
+    def _wait_for_hooks(self, running, finished, hook_names=None):
+        """Wait until hooks are finished.
+
+        Environment changes of finished hooks are applied to launch
+        environments.
+
+        Args:
+            running (dict[futures.Future, tuple[LaunchHook, dict]]): Running
+                hooks with environments they've started with by their
+                futures. Is updated.
+            finished (set[str]): Names of finished hooks. Is updated.
+            hook_names (Optional[set[str]]): Names of hooks to wait for,
+                all running hooks are awaited if not passed.
+        """
+        while running:
+            if hook_names is not None and hook_names.issubset(finished):
+                return
+            done, _ = futures.wait(
+                tuple(running), return_when=futures.FIRST_COMPLETED
+            )
+            for future in done:
+                hook, base_env = running.pop(future)
+                finished.add(hook.__class__.__name__)
+                # Re-raise first error of concurrent hook
+                future.result()
+                self._apply_hook_env_changes(hook, base_env)
+
+    def _run_prelaunch_hooks_in_order(self, hooks):
+        """Run prelaunch hooks in order.
+
+        Hooks without defined dependencies are executed one by one in the
+        current thread. Hooks with defined dependencies are executed in
+        worker threads as soon as their dependencies are finished and run
+        concurrently with following hooks. They work with a copy of
+        environments which is merged back in the current thread once they
+        are finished. All hooks are finished when the method returns.
+        """
+        running = {}
+        finished = set()
+        scheduled = set()
+        executor = None
+        try:
+            for hook in hooks:
+                hook_name = hook.__class__.__name__
+                if hook.dependencies is None:
+                    self._execute_hook(hook)
+                    finished.add(hook_name)
+
+                else:
+                    # Ignore dependencies which are not used in this launch
+                    dependencies = set(hook.dependencies) & scheduled
+                    self._wait_for_hooks(running, finished, dependencies)
+                    if executor is None:
+                        executor = futures.ThreadPoolExecutor(
+                            thread_name_prefix="LaunchHook"
+                        )
+                    base_env = dict(self.env)
+                    hook._env = dict(base_env)
+                    future = executor.submit(self._execute_hook, hook)
+                    running[future] = (hook, base_env)
+                scheduled.add(hook_name)
+
+            self._wait_for_hooks(running, finished)
+
+        finally:
+            if executor is not None:
+                # Let running hooks finish when a hook failed
+                executor.shutdown(wait=True)
+
+    def _log_hook_timings(self, hooks, label):
+        lines = []
+        total = 0.0
+        for hook in hooks:
+            hook_name = hook.__class__.__name__
+            duration = self.hook_timings.get(hook_name)
+            if duration is None:
+                continue
+            total += duration
+            lines.append("- {}: {:.3f}s".format(hook_name, duration))
+        if lines:
+            self.log.info("{} hooks timing (sum {:.3f}s):\n{}".format(
+                label, total, "\n".join(lines)
+            ))
+
     @property
     def app_name(self):
         return self.application.name
@@ -1316,11 +1496,12 @@ class ApplicationLaunchContext:
         self.discover_launch_hooks()
 
         # Execute prelaunch hooks
-        for prelaunch_hook in self.prelaunch_hooks:
-            self.log.debug("Executing prelaunch hook: {}".format(
-                str(prelaunch_hook.__class__.__name__)
-            ))
-            prelaunch_hook.execute()
+        start = time.time()
+        self._run_prelaunch_hooks_in_order(self.prelaunch_hooks)
+        self.log.info("Prelaunch hooks finished in {:.3f}s.".format(
+            time.time() - start
+        ))
+        self._log_hook_timings(self.prelaunch_hooks, "Prelaunch")
         self._prelaunch_hooks_executed = True
 
     def launch(self):
@@ -1359,20 +1540,17 @@ class ApplicationLaunchContext:
 
         # Process post launch hooks
         for postlaunch_hook in self.postlaunch_hooks:
-            self.log.debug("Executing postlaunch hook: {}".format(
-                str(postlaunch_hook.__class__.__name__)
-            ))
-
             # TODO how to handle errors?
             # - store to variable to let them accessible?
             try:
-                postlaunch_hook.execute()
+                self._execute_hook(postlaunch_hook)
 
             except Exception:
                 self.log.warning(
                     "After launch procedures were not successful.",
                     exc_info=True
                 )
+        self._log_hook_timings(self.postlaunch_hooks, "Postlaunch")
 
         self.log.debug("Launch of {} finished.".format(
             self.application.full_name
@@ -1494,6 +1672,99 @@ def get_app_environments_for_context(
     return context.env
 
 
+class _AppEnvironmentsCache:
+    lock = threading.Lock()
+    # Computed environments by hash of their inputs (least recently used
+    #   are removed first)
+    environments_by_key = collections.OrderedDict()
+    max_items = 32
+
+
+def _get_app_environments_key(
+    source_env, environments, local_envs, roots, project_name, env_group
+):
+    """Hash of all inputs of app environments computation.
+
+    Inputs contain environments of application and tools from settings so
+    key changes when settings of any of them are saved.
+    """
+    key_data = {
+        "source_env": source_env,
+        "environments": environments,
+        "local_envs": local_envs,
+        "roots": roots,
+        "project_name": project_name,
+        "env_group": env_group,
+        "platform": platform.system().lower(),
+    }
+    return hashlib.sha256(json.dumps(
+        key_data, sort_keys=True, default=str
+    ).encode("utf-8")).hexdigest()
+
+
+def _compute_app_environments(
+    source_env, environments, local_envs, roots, project_name, env_group
+):
+    import acre
+
+    env_values = {}
+    for _env_values in environments:
+        if not _env_values:
+            continue
+
+        # Choose right platform
+        tool_env = parse_environments(_env_values, env_group)
+
+        # Apply local environment variables
+        # - must happen between all values because they may be used during
+        #   merge
+        for key, value in local_envs.items():
+            if key in tool_env:
+                tool_env[key] = value
+
+        # Merge dictionaries
+        env_values = _merge_env(tool_env, env_values)
+
+    merged_env = _merge_env(env_values, source_env)
+
+    _format_paths_with_settings(
+        environments_variables=merged_env,
+        roots=roots,
+        project_name=project_name
+    )
+
+    return acre.compute(merged_env, cleanup=False)
+
+
+def _get_app_environments(
+    source_env, environments, local_envs, roots, project_name, env_group
+):
+    """Computed app environments from cache or compute them.
+
+    Returns:
+        tuple[dict[str, str], bool]: Copy of computed environments and
+            if environments were cached.
+    """
+    key = _get_app_environments_key(
+        source_env, environments, local_envs, roots, project_name, env_group
+    )
+    cache = _AppEnvironmentsCache.environments_by_key
+    with _AppEnvironmentsCache.lock:
+        cached_env = cache.get(key)
+        if cached_env is not None:
+            cache.move_to_end(key)
+            return dict(cached_env), True
+
+    env = _compute_app_environments(
+        source_env, environments, local_envs, roots, project_name, env_group
+    )
+    with _AppEnvironmentsCache.lock:
+        cache[key] = dict(env)
+        while len(cache) > _AppEnvironmentsCache.max_items:
+            cache.popitem(last=False)
+    return env, False
+
+
 def _merge_env(env, current_env):
     """Modified function(merge) from acre module."""
     import acre
@@ -1569,16 +1840,14 @@ def prepare_app_environments(
         data (EnvironmentPrepData): Dictionary where result and intermediate
             result will be stored.
     """
-    import acre
-
     app = data["app"]
     log = data["log"]
     source_env = data["env"].copy()
 
     if modules_manager is None:
-        from quadpype.modules import ModulesManager
+        from quadpype.modules import get_modules_manager
 
-        modules_manager = ModulesManager()
+        modules_manager = get_modules_manager()
 
     _add_python_version_paths(app, source_env, log, modules_manager)
 
@@ -1637,33 +1906,26 @@ def prepare_app_environments(
         )
     )
 
-    env_values = {}
-    for _env_values in environments:
-        if not _env_values:
-            continue
-
-        # Choose right platform
-        tool_env = parse_environments(_env_values, env_group)
-
-        # Apply local environment variables
-        # - must happen between all values because they may be used during
-        #   merge
-        for key, value in filtered_local_envs.items():
-            if key in tool_env:
-                tool_env[key] = value
-
-        # Merge dictionaries
-        env_values = _merge_env(tool_env, env_values)
-
-    merged_env = _merge_env(env_values, source_env)
-
-    _format_paths_with_settings(
-        environments_variables=merged_env,
-        roots=data['anatomy'].roots,
-        project_name=data['project_name']
+    # Environments of application and tools are the same for the same
+    #   settings, project and source environments
+    # - context specific environments are applied later
+    start = time.time()
+    loaded_env, cached = _get_app_environments(
+        source_env,
+        environments,
+        filtered_local_envs,
+        data["anatomy"].roots,
+        data["project_name"],
+        env_group
     )
-
-    loaded_env = acre.compute(merged_env, cleanup=False)
+    duration = time.time() - start
+    data["app_environments_timing"] = {
+        "duration": duration,
+        "cached": cached,
+    }
+    log.debug("Application environments {} in {:.3f}s".format(
+        "loaded from cache" if cached else "computed", duration
+    ))
 
     final_env = None
     # Add host specific environments
@@ -1855,11 +2117,11 @@ def _prepare_last_workfile(data, workdir, modules_manager):
         workdir (str): Path to folder where workfiles should be stored.
     """
 
-    from quadpype.modules import ModulesManager
+    from quadpype.modules import get_modules_manager
     from quadpype.pipeline import HOST_WORKFILE_EXTENSIONS
 
     if not modules_manager:
-        modules_manager = ModulesManager()
+        modules_manager = get_modules_manager()
 
     log = data["log"]
 
@@ -132,3 +132,21 @@ class ProjectAnatomyCacheValues(CacheValues):
         self.name = project_name if project_name else "project_default"
         self.entity = "anatomy"
         super().__init__(*args, **kwargs)
+
+
+class MaterializedSettingsCacheValues(CacheValues):
+    """Cache of materialized settings document.
+
+    Missing document is cached too so processes falling back to regular
+    settings resolution don't query the document on each call.
+    """
+    def __init__(self, name, *args, **kwargs):
+        self.name = name
+        self.entity = "settings"
+        super().__init__(*args, **kwargs)
+
+    @property
+    def is_outdated(self):
+        if not self.data:
+            return self._cache_is_expired()
+        return super().is_outdated
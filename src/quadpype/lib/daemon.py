@@ -0,0 +1,342 @@
+# -*- coding: utf-8 -*-
+"""Warm-start daemon of QuadPype command line.
+
+Cold start of QuadPype (bootstrap, version resolution, settings and heavy
+imports) takes seconds, which is paid again by every farm pre-job hook or
+short command. The daemon is a fully booted QuadPype process which listens
+on a unix socket and forks a worker for each request. Worker inherits
+already imported modules, applies environment and working directory of
+the client, takes over its standard streams and runs the command as
+`quadpype <args>` would.
+
+Requests are sent by the thin client in 'igniter.daemon_client'.
+
+Daemon rejects requests which it can't serve the same way as a cold start
+(different QuadPype version or database) and the client falls back to
+the regular boot.
+
+Socket is created in a directory accessible only by the user who started
+the daemon and connections of other users are rejected.
+
+Daemon requires 'fork' and unix sockets so it is not available on Windows.
+"""
+import os
+import sys
+import json
+import time
+import signal
+import socket
+import struct
+import importlib
+import traceback
+
+from .log import Logger
+
+# Modules imported before the daemon starts listening
+DEFAULT_PRELOAD_MODULES = (
+    "quadpype.lib",
+    "quadpype.lib.applications",
+    "quadpype.client",
+    "quadpype.settings",
+    "quadpype.pipeline",
+    "quadpype.modules",
+    "quadpype.pype_commands",
+    "quadpype.cli",
+    "pyblish.api",
+)
+
+# Environment variables which must match between client and daemon
+_MATCHING_ENV_KEYS = (
+    "QUADPYPE_VERSION",
+    "QUADPYPE_MONGO",
+    "QUADPYPE_DATABASE_NAME",
+)
+
+
+def _get_client_module():
+    # Igniter is available in both frozen and development builds
+    from igniter import daemon_client
+
+    return daemon_client
+
+
+class QuadPypeDaemon:
+    """Unix socket server forking workers for QuadPype commands.
+
+    Args:
+        socket_path (Optional[str]): Path to unix socket. Path from
+            'QUADPYPE_DAEMON_SOCKET' or default path is used if not passed.
+        preload_modules (Optional[Iterable[str]]): Modules imported before
+            listening for requests.
+    """
+    log = Logger.get_logger("QuadPypeDaemon")
+
+    def __init__(self, socket_path=None, preload_modules=None):
+        client = _get_client_module()
+        if not client.is_daemon_supported():
+            raise RuntimeError(
+                "QuadPype daemon is not supported on this platform."
+            )
+
+        if socket_path is None:
+            socket_path = client.get_daemon_socket_path()
+
+        if preload_modules is None:
+            preload_modules = DEFAULT_PRELOAD_MODULES
+
+        self._socket_path = socket_path
+        self._preload_modules = tuple(preload_modules)
+        self._workers = set()
+        self._client = client
+        self._boot_env = None
+
+    @property
+    def socket_path(self):
+        return self._socket_path
+
+    def preload(self):
+        """Import modules shared by workers."""
+        for module_name in self._preload_modules:
+            start = time.time()
+            try:
+                importlib.import_module(module_name)
+            except Exception:
+                self.log.warning(
+                    "Failed to preload module \"{}\"".format(module_name),
+                    exc_info=True
+                )
+                continue
+            self.log.debug("Preloaded \"{}\" in {:.3f}s".format(
+                module_name, time.time() - start
+            ))
+
+    def run(self):
+        """Listen for requests until the process is terminated."""
+        self.preload()
+        self._boot_env = dict(os.environ)
+
+        server = self._create_server_socket()
+        # Terminate gracefully so the socket file is removed
+        signal.signal(signal.SIGTERM, self._on_terminate)
+        # Accept timeout is used to reap finished workers
+        server.settimeout(1.0)
+        self.log.info(
+            "QuadPype daemon is listening on \"{}\"".format(self._socket_path)
+        )
+        try:
+            while True:
+                self._reap_workers()
+                try:
+                    conn, _ = server.accept()
+                except socket.timeout:
+                    continue
+                except InterruptedError:
+                    continue
+
+                try:
+                    self._process_connection(conn)
+                except Exception:
+                    self.log.warning(
+                        "Failed to process request", exc_info=True
+                    )
+                finally:
+                    conn.close()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.close()
+            self._remove_socket_file()
+
+    def _on_terminate(self, signum, frame):
+        raise KeyboardInterrupt()
+
+    def _create_server_socket(self):
+        socket_dir = os.path.dirname(self._socket_path) or "."
+        # Directory and socket are created accessible only by the user
+        old_umask = os.umask(0o077)
+        try:
+            os.makedirs(socket_dir, mode=0o700, exist_ok=True)
+        finally:
+            os.umask(old_umask)
+
+        if not self._client.is_socket_dir_private(socket_dir):
+            raise RuntimeError((
+                "Directory of QuadPype daemon socket \"{}\" must be owned by"
+                " the user and not accessible by other users."
+            ).format(socket_dir))
+
+        if os.path.exists(self._socket_path):
+            if self._is_socket_alive():
+                raise RuntimeError(
+                    "QuadPype daemon is already running on \"{}\"".format(
+                        self._socket_path
+                    )
+                )
+            # Left behind by a killed daemon
+            self._remove_socket_file()
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        old_umask = os.umask(0o077)
+        try:
+            server.bind(self._socket_path)
+        finally:
+            os.umask(old_umask)
+        server.listen(16)
+        return server
+
+    def _is_socket_alive(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        with sock:
+            try:
+                sock.connect(self._socket_path)
+            except OSError:
+                return False
+        return True
+
+    def _remove_socket_file(self):
+        try:
+            os.remove(self._socket_path)
+        except OSError:
+            pass
+
+    def _reap_workers(self):
+        for pid in tuple(self._workers):
+            try:
+                finished_pid, _ = os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                finished_pid = pid
+            if finished_pid:
+                self._workers.discard(pid)
+
+    def _receive_request(self, conn):
+        conn.settimeout(10.0)
+        msg, fds, _, _ = socket.recv_fds(conn, 4, 3)
+        if len(fds) != 3 or len(msg) != 4:
+            for fd in fds:
+                os.close(fd)
+            raise ValueError("Invalid request header")
+
+        size = struct.unpack("!I", msg)[0]
+        data = self._client.recv_exact(conn, size)
+        if data is None:
+            for fd in fds:
+                os.close(fd)
+            raise ValueError("Connection closed before request was sent")
+        conn.settimeout(None)
+        return json.loads(data.decode("utf-8")), fds
+
+    def _get_reject_reason(self, request):
+        if "--use-version" in request["argv"]:
+            return "Argument '--use-version' requires regular start."
+
+        if self._client.get_command_name(request["argv"]) == "daemon":
+            return "Daemon can't be started from daemon."
+
+        client_env = request["env"]
+        for key in _MATCHING_ENV_KEYS:
+            value = client_env.get(key)
+            if value and value != self._boot_env.get(key):
+                return "Environment variable '{}' does not match.".format(
+                    key
+                )
+        return None
+
+    def _process_connection(self, conn):
+        # Workers run commands as the user who started the daemon
+        peer_uid = self._client.get_peer_uid(conn)
+        if peer_uid is not None and peer_uid != os.getuid():
+            raise ValueError(
+                "Connection of other user ({}) rejected".format(peer_uid)
+            )
+
+        request, fds = self._receive_request(conn)
+        try:
+            reject_reason = self._get_reject_reason(request)
+            if reject_reason:
+                self.log.info("Request rejected: {}".format(reject_reason))
+                conn.sendall(self._client.REQUEST_REJECTED)
+                return
+
+            conn.sendall(self._client.REQUEST_ACCEPTED)
+
+            # Don't duplicate buffered output in the worker
+            sys.stdout.flush()
+            sys.stderr.flush()
+            pid = os.fork()
+            if pid == 0:
+                self._run_worker(conn, request, fds)
+            self._workers.add(pid)
+
+        finally:
+            for fd in fds:
+                os.close(fd)
+
+    def _run_worker(self, conn, request, fds):
+        """Run command in forked process. Never returns."""
+        exit_code = 1
+        try:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.default_int_handler)
+
+            for target_fd, fd in enumerate(fds):
+                os.dup2(fd, target_fd)
+
+            # Client environment on top of environment of booted daemon
+            env = dict(self._boot_env)
+            env.update(request["env"])
+            os.environ.clear()
+            os.environ.update(env)
+
+            os.chdir(request["cwd"])
+
+            # Connections of daemon must not be shared with the worker
+            from quadpype.client.mongo import QuadPypeMongoConnection
+
+            QuadPypeMongoConnection.mongo_clients = {}
+
+            exit_code = self._run_command(request["argv"])
+
+        except BaseException:
+            traceback.print_exc()
+
+        finally:
+            try:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                conn.sendall(struct.pack("!i", exit_code))
+            except BaseException:
+                pass
+            os._exit(exit_code)
+
+    @staticmethod
+    def _run_command(argv):
+        from quadpype import cli
+
+        sys.argv = [sys.argv[0]] + list(argv)
+        try:
+            cli.main(args=list(argv), obj={}, prog_name="quadpype")
+        except SystemExit as exc:
+            code = exc.code
+            if code is None:
+                return 0
+            if isinstance(code, int):
+                return code
+            print(code, file=sys.stderr)
+            return 1
+
+        except Exception:
+            print("!!! QuadPype crashed:", file=sys.stderr)
+            traceback.print_exc()
+            return 1
+        return 0
+
+
+def run_daemon(socket_path=None, preload_modules=None):
+    """Start QuadPype daemon and block until it is terminated.
+
+    Args:
+        socket_path (Optional[str]): Path to unix socket.
+        preload_modules (Optional[Iterable[str]]): Modules imported before
+            listening for requests.
+    """
+    QuadPypeDaemon(socket_path, preload_modules).run()
@@ -1,7 +1,29 @@
 # -*- coding: utf-8 -*-
-"""Provide profiling decorator."""
+"""Provide profiling decorator and startup phase profiler.
+
+Phase profiler measures named phases of QuadPype and DCC startup. It is
+enabled by 'QUADPYPE_BOOT_PROFILE' environment variable which contains
+directory where reports are written ('1' to use temp directory). Each
+process writes JSON report 'boot_<process>_<pid>.json' with its phases and,
+if 'QUADPYPE_BOOT_PROFILE_TRACE' is set to '1', also Chrome trace file
+'boot_<process>_<pid>.trace.json' which can be opened in
+'chrome://tracing' or Perfetto.
+
+Environment variables are inherited, so launched DCCs write their reports
+too.
+
+Module uses only standard library so it can be loaded by bootstrap code
+before QuadPype is importable.
+"""
 import os
+import sys
+import json
+import time
+import atexit
 import cProfile
+import tempfile
+import threading
+import functools
 
 
 def do_profile(fn, to_file=None):
@@ -27,3 +49,304 @@ def do_profile(fn, to_file=None):
                 profiler.dump_stats(to_file)
             else:
                 profiler.print_stats()
+
+
+BOOT_PROFILE_ENV_KEY = "QUADPYPE_BOOT_PROFILE"
+BOOT_PROFILE_TRACE_ENV_KEY = "QUADPYPE_BOOT_PROFILE_TRACE"
+
+_PHASE_PROFILER = None
+
+
+class PhaseProfiler:
+    """Collect durations of named phases.
+
+    Phases can be nested, nesting is stored as depth of the phase in its
+    thread.
+
+    Args:
+        enabled (bool): Phases are recorded only if enabled.
+        output_dir (Optional[str]): Directory where reports are written.
+        write_trace (bool): Write Chrome trace file next to JSON report.
+    """
+
+    def __init__(self, enabled, output_dir=None, write_trace=False):
+        self._enabled = enabled
+        self._output_dir = output_dir
+        self._write_trace = write_trace
+        self._lock = threading.Lock()
+        self._thread_data = threading.local()
+        self._phases = []
+        # Wall clock time of perf counter zero
+        self._perf_start = time.perf_counter()
+        self._time_start = time.time()
+        self._atexit_registered = False
+
+    @classmethod
+    def from_env(cls):
+        output_dir = os.getenv(BOOT_PROFILE_ENV_KEY)
+        if not output_dir:
+            return cls(False)
+
+        if output_dir == "1":
+            output_dir = tempfile.gettempdir()
+        write_trace = os.getenv(BOOT_PROFILE_TRACE_ENV_KEY) == "1"
+        return cls(True, output_dir, write_trace)
+
+    @property
+    def enabled(self):
+        return self._enabled
+
+    @property
+    def phases(self):
+        with self._lock:
+            return list(self._phases)
+
+    @property
+    def perf_start(self):
+        return self._perf_start
+
+    @property
+    def time_start(self):
+        return self._time_start
+
+    def merge(self, profiler):
+        """Add phases recorded by other profiler of this process.
+
+        Bootstrap code records phases with profiler loaded before QuadPype
+        modules are reloaded from the running version. Start of the
+        other profiler is used if it was created earlier. The other
+        profiler is disabled so it doesn't overwrite the report.
+
+        Args:
+            profiler (PhaseProfiler): Other profiler.
+        """
+        if not self._enabled:
+            return
+
+        with self._lock:
+            self._phases[0:0] = [dict(phase) for phase in profiler.phases]
+            if profiler.perf_start < self._perf_start:
+                self._perf_start = profiler.perf_start
+                self._time_start = profiler.time_start
+        profiler.disable()
+        self._register_atexit()
+
+    def disable(self):
+        self._enabled = False
+
+    def start_phase(self, name):
+        """Start phase.
+
+        Returns:
+            Union[dict[str, Any], None]: Started phase data which is passed
+                to 'end_phase'. None if profiler is disabled.
+        """
+        if not self._enabled:
+            return None
+
+        stack = getattr(self._thread_data, "stack", None)
+        if stack is None:
+            stack = self._thread_data.stack = []
+
+        phase = {
+            "name": name,
+            "thread": threading.current_thread().name,
+            "thread_id": threading.get_ident(),
+            "depth": len(stack),
+            "start": time.perf_counter(),
+            "duration": None,
+        }
+        stack.append(phase)
+        return phase
+
+    def end_phase(self, phase, failed=False):
+        if phase is None:
+            return
+
+        phase["duration"] = time.perf_counter() - phase["start"]
+        if failed:
+            phase["failed"] = True
+
+        stack = self._thread_data.stack
+        for index in reversed(range(len(stack))):
+            if stack[index] is phase:
+                del stack[index]
+                break
+
+        with self._lock:
+            self._phases.append(phase)
+        self._register_atexit()
+
+    def phase(self, name):
+        """Context manager measuring a phase."""
+        return _ProfiledPhase(self, name)
+
+    def _get_relative_phases(self):
+        phases = []
+        for phase in sorted(self.phases, key=lambda item: item["start"]):
+            phase = dict(phase)
+            phase["start"] -= self._perf_start
+            phases.append(phase)
+        return phases
+
+    def get_report(self):
+        """Report of process and its phases.
+
+        Start of phases is in seconds since the profiler was created.
+        """
+        phases = self._get_relative_phases()
+        return {
+            "pid": os.getpid(),
+            "process": _get_process_name(),
+            "executable": sys.executable,
+            "argv": list(sys.argv),
+            "host": os.getenv("AVALON_APP"),
+            "started": self._time_start,
+            "total": time.perf_counter() - self._perf_start,
+            "phases": phases,
+        }
+
+    def get_chrome_trace(self):
+        """Phases in Chrome trace event format."""
+        pid = os.getpid()
+        events = [{
+            "name": "process_name",
+            "ph": "M",
+            "pid": pid,
+            "tid": 0,
+            "args": {"name": _get_process_name()},
+        }]
+        for phase in self._get_relative_phases():
+            events.append({
+                "name": phase["name"],
+                "cat": "boot",
+                "ph": "X",
+                "pid": pid,
+                "tid": phase["thread_id"],
+                "ts": int((self._time_start + phase["start"]) * 1000000),
+                "dur": int(phase["duration"] * 1000000),
+                "args": {"thread": phase["thread"]},
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_report(self):
+        """Write reports of phases recorded so far.
+
+        Report is written again when the process exits, so it contains
+        also phases recorded later.
+
+        Returns:
+            list[str]: Paths to written files.
+        """
+        if not self._enabled or not self._output_dir:
+            return []
+
+        os.makedirs(self._output_dir, exist_ok=True)
+        basename = "boot_{}_{}".format(_get_process_name(), os.getpid())
+        output = [(basename + ".json", self.get_report())]
+        if self._write_trace:
+            output.append((basename + ".trace.json", self.get_chrome_trace()))
+
+        filepaths = []
+        for filename, data in output:
+            filepath = os.path.join(self._output_dir, filename)
+            tmp_filepath = filepath + ".tmp"
+            with open(tmp_filepath, "w") as stream:
+                json.dump(data, stream, indent=4)
+            os.replace(tmp_filepath, filepath)
+            filepaths.append(filepath)
+        return filepaths
+
+    def _register_atexit(self):
+        if self._atexit_registered:
+            return
+        self._atexit_registered = True
+        atexit.register(self._write_report_at_exit)
+
+    def _write_report_at_exit(self):
+        try:
+            self.write_report()
+        except Exception:  # noqa
+            pass
+
+
+class _ProfiledPhase:
+    """Context manager and decorator measuring a phase.
+
+    Each use creates new phase, so the same object can decorate a function
+    called from multiple threads or recursively.
+    """
+
+    def __init__(self, profiler, name):
+        self._profiler = profiler
+        self._name = name
+        self._thread_data = threading.local()
+
+    def __enter__(self):
+        stack = getattr(self._thread_data, "stack", None)
+        if stack is None:
+            stack = self._thread_data.stack = []
+        stack.append(self._profiler.start_phase(self._name))
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        phase = self._thread_data.stack.pop()
+        self._profiler.end_phase(phase, failed=exc_type is not None)
+        return False
+
+    def __call__(self, func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with self:
+                return func(*args, **kwargs)
+        return wrapper
+
+
+class _LazyProfiledPhase(_ProfiledPhase):
+    """Phase of global profiler which is created on first use."""
+
+    def __init__(self, name):
+        super().__init__(None, name)
+
+    def __enter__(self):
+        self._profiler = get_phase_profiler()
+        return super().__enter__()
+
+
+def _get_process_name():
+    host_name = os.getenv("AVALON_APP")
+    if host_name:
+        return host_name
+    return os.path.splitext(os.path.basename(sys.executable))[0] or "python"
+
+
+def get_phase_profiler():
+    """Phase profiler of the process configured from environment.
+
+    Returns:
+        PhaseProfiler: Global phase profiler.
+    """
+    global _PHASE_PROFILER
+    if _PHASE_PROFILER is None:
+        _PHASE_PROFILER = PhaseProfiler.from_env()
+    return _PHASE_PROFILER
+
+
+def profile_phase(name):
+    """Measure a phase with global phase profiler.
+
+    Can be used as context manager or as decorator. Overhead is a function
+    call when profiling is disabled.
+
+    Example:
+        >>> @profile_phase("install_host")
+        ... def install_host(host):
+        ...     ...
+
+        >>> with profile_phase("boot.settings"):
+        ...     ...
+
+    Args:
+        name (str): Name of the phase.
+    """
+    return _LazyProfiledPhase(name)
@@ -1,5 +1,7 @@
 import os
 import re
+import math
+import time
 import logging
 import json
 import collections
@@ -22,6 +24,13 @@ MAX_FFMPEG_STRING_LEN = 8196
 # Not allowed symbols in attributes for ffmpeg
 NOT_ALLOWED_FFMPEG_CHARS = ("\"", )
 
+# Frame range of image sequence in oiiotool format (e.g. 'file.1-3#.exr')
+OIIO_FRAME_RANGE_REGEX = re.compile(r"\.(\d+)-(\d+)#\.")
+# Colorspace conversion chunks per worker to balance slower frames
+COLORSPACE_CHUNKS_PER_WORKER = 4
+# Minimum frames in chunk to not waste time on oiiotool process startup
+COLORSPACE_MIN_CHUNK_SIZE = 2
+
 # OIIO known xml tags
 STRING_TAGS = {
     "format"
@@ -1148,6 +1157,42 @@ def convert_ffprobe_fps_to_float(value):
     return dividend / divisor
 
 
+def get_colorspace_conversion_chunks(frame_start, frame_end, workers=None):
+    """Split frame range into chunks for parallel colorspace conversion.
+
+    Chunk size is derived from frame count and number of workers. Each
+    worker gets roughly 'COLORSPACE_CHUNKS_PER_WORKER' chunks so slower
+    frames do not leave other workers idle at the end of the conversion.
+
+    Args:
+        frame_start (int): First frame of the sequence.
+        frame_end (int): Last frame of the sequence.
+        workers (Optional[int]): Number of workers that will process
+            the chunks. Number of CPU cores is used if not passed.
+
+    Returns:
+        list[tuple[int, int]]: Inclusive frame ranges of chunks.
+    """
+    frame_count = frame_end - frame_start + 1
+    if frame_count < 1:
+        return []
+
+    if not workers:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, frame_count))
+
+    chunk_size = math.ceil(
+        frame_count / (workers * COLORSPACE_CHUNKS_PER_WORKER)
+    )
+    chunk_size = max(COLORSPACE_MIN_CHUNK_SIZE, chunk_size)
+
+    chunks = []
+    for chunk_start in range(frame_start, frame_end + 1, chunk_size):
+        chunk_end = min(chunk_start + chunk_size - 1, frame_end)
+        chunks.append((chunk_start, chunk_end))
+    return chunks
+
+
 def convert_colorspace(
     input_path,
     output_path,
@@ -1158,9 +1203,14 @@ def convert_colorspace(
     display=None,
     additional_command_args=None,
     logger=None,
+    workers=None,
 ):
     """Convert source file from one color space to another.
 
+    Sequences are split into chunks of frames which are converted in
+    parallel. Input is probed only once per sequence, the first failed
+    chunk raises an error after all running chunks finished.
+
     Args:
         input_path (str): Path that should be converted. It is expected that
             contains single file or image sequence of same type
@@ -1180,30 +1230,60 @@ def convert_colorspace(
         additional_command_args (list): arguments for oiiotool (like binary
             depth for .dpx)
         logger (logging.Logger): Logger used for logging.
+        workers (Optional[int]): Maximum number of parallel oiiotool
+            processes. Number of CPU cores is used if not passed.
+
+    Returns:
+        list[dict[str, Any]]: Timing of each converted chunk with keys
+            'frame_start', 'frame_end' and 'duration' (in seconds).
+            Frames are 'None' for single files.
+
     Raises:
         ValueError: if misconfigured
+        RuntimeError: if conversion of any chunk failed
     """
     if logger is None:
         logger = logging.getLogger(__name__)
 
-    def chunk_list(frame_start, frame_end, chunk_size):
-        """Chunk the frame numbers into groups."""
-        numbers = list(range(frame_start, frame_end + 1))
-        chunked_list = [numbers[i:i + chunk_size] for i in range(0, len(numbers), chunk_size)]
-        return chunked_list
+    if all([target_colorspace, view, display]):
+        raise ValueError("Colorspace and both screen and display"
+                         " cannot be set together."
+                         "Choose colorspace or screen and display")
+    if not target_colorspace and not all([view, display]):
+        raise ValueError("Both screen and display must be set.")
 
-    def process_frame_group(frame_group, input_path, output_path):
-        """Process a group of frames."""
-        if '-' in input_path:
-            frame_group = f'.{frame_group[0]}-{frame_group[-1]}#.'
-            frame_regex = r'\.\d+-\d+#\.'
-            input_path = re.sub(frame_regex, frame_group, input_path)
-            output_path = re.sub(frame_regex, frame_group, output_path)
+    def replace_frame_range(path, frame_start, frame_end):
+        return OIIO_FRAME_RANGE_REGEX.sub(
+            ".{}-{}#.".format(frame_start, frame_end), path
+        )
 
-        input_info = get_oiio_info_for_input(input_path, logger=logger)
+    frame_range_match = OIIO_FRAME_RANGE_REGEX.search(input_path)
+    if frame_range_match:
+        frame_start = int(frame_range_match.group(1))
+        frame_end = int(frame_range_match.group(2))
+        chunks = get_colorspace_conversion_chunks(
+            frame_start, frame_end, workers
+        )
+        # Probe only first frame, all frames of the sequence
+        #   are expected to have same channels
+        probe_path = replace_frame_range(input_path, frame_start, frame_start)
+    else:
+        chunks = [(None, None)]
+        probe_path = input_path
 
-        # Collect channels to export
-        input_arg, channels_arg = get_oiio_input_and_channel_args(input_info)
+    input_info = get_oiio_info_for_input(probe_path, logger=logger)
+
+    # Collect channels to export
+    input_arg, channels_arg = get_oiio_input_and_channel_args(input_info)
+
+    def process_chunk(chunk_start, chunk_end):
+        chunk_input_path = input_path
+        chunk_output_path = output_path
+        if chunk_start is not None:
+            chunk_input_path = replace_frame_range(
+                input_path, chunk_start, chunk_end)
+            chunk_output_path = replace_frame_range(
+                output_path, chunk_start, chunk_end)
 
         # Prepare subprocess arguments
         oiio_cmd = get_oiio_tool_args(
@@ -1213,7 +1293,7 @@ def convert_colorspace(
             "--colorconfig", config_path
         )
         oiio_cmd.extend([
-            input_arg, input_path,
+            input_arg, chunk_input_path,
             # Tell oiiotool which channels should be put to top stack
             #   (and output)
             "--ch", channels_arg,
@@ -1221,13 +1301,6 @@ def convert_colorspace(
             "--subimage", "0"
         ])
 
-        if all([target_colorspace, view, display]):
-            raise ValueError("Colorspace and both screen and display"
-                             " cannot be set together."
-                             "Choose colorspace or screen and display")
-        if not target_colorspace and not all([view, display]):
-            raise ValueError("Both screen and display must be set.")
-
         if additional_command_args:
             oiio_cmd.extend(additional_command_args)
 
@@ -1239,23 +1312,56 @@ def convert_colorspace(
             oiio_cmd.extend(["--iscolorspace", source_colorspace])
             oiio_cmd.extend(["--ociodisplay", display, view])
 
-        oiio_cmd.extend(["-o", output_path])
+        oiio_cmd.extend(["-o", chunk_output_path])
 
         logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
+        start_time = time.time()
         run_subprocess(oiio_cmd, logger=logger)
+        return {
+            "frame_start": chunk_start,
+            "frame_end": chunk_end,
+            "duration": time.time() - start_time,
+        }
+
+    if len(chunks) == 1:
+        return [process_chunk(*chunks[0])]
+
+    pool = ThreadPool(
+        processes=min(len(chunks), workers or os.cpu_count() or 1)
+    )
+    try:
+        async_results = [
+            pool.apply_async(process_chunk, chunk)
+            for chunk in chunks
+        ]
+    finally:
+        pool.close()
+        pool.join()
+
+    timings = []
+    failed_chunks = []
+    for chunk, async_result in zip(chunks, async_results):
+        try:
+            timings.append(async_result.get())
+        except Exception as exc:
+            logger.error(
+                "Conversion of frames {}-{} failed: {}".format(
+                    chunk[0], chunk[1], exc
+                )
+            )
+            failed_chunks.append((chunk, exc))
+
+    if failed_chunks:
+        chunk, exc = failed_chunks[0]
+        raise RuntimeError((
+            "Colorspace conversion of \"{}\" failed"
+            " for {} of {} frame chunks (first failed frames {}-{})."
+        ).format(
+            input_path, len(failed_chunks), len(chunks), chunk[0], chunk[1]
+        )) from exc
+
+    return timings
 
-    frame_data = input_path.split('.')[-2]
-    if '-' in frame_data:
-        frame_start, frame_end = frame_data[:-1].split('-')
-    else:
-        frame_start = frame_end = frame_data
-
-    frame_groups = chunk_list(int(frame_start), int(frame_end), 10)
-    pool = ThreadPool()
-    for frame_group in frame_groups:
-        pool.apply_async(process_frame_group, (frame_group, input_path, output_path))
-    pool.close()
-    pool.join()
 
 def split_cmd_args(in_args):
     """Makes sure all entered arguments are separated in individual items.
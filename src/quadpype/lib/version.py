@@ -1,10 +1,13 @@
 import os
 import re
 import sys
+import json
 import shutil
 import hashlib
 import platform
 import tempfile
+import threading
+from concurrent import futures
 
 import semver
 import requests
@@ -29,6 +32,15 @@ VERSION_REGEX = re.compile(r"(?P<major>0|[1-9]\d*)\.(?P<minor>0|[1-9]\d*)\.(?P<p
 
 _PACKAGE_MANAGER = None
 
+# Index of validated archives written next to them on deploy
+VERSIONS_INDEX_FILENAME = "versions_index.json"
+# Maximum number of threads validating versions in one directory
+VERSIONS_SCAN_MAX_WORKERS = 8
+# Maximum number of threads extracting members of an archive
+ARCHIVE_EXTRACT_MAX_WORKERS = min(16, (os.cpu_count() or 1) + 4)
+# Archive members which are not listed in the checksums file
+_CHECKSUMS_EXCLUDED_MEMBERS = {"checksums", "LICENSE"}
+
 
 class SourceURL(str):
     """Simple subclass of the str class to detect type with ease"""
@@ -197,6 +209,16 @@ def sha256sum(filename):
     return h.hexdigest()
 
 
+class _ArchivesCache:
+    """Content versions of archives validated by this process.
+
+    Key is archive path with its size and mtime, so modified archive is
+    validated again.
+    """
+    lock = threading.Lock()
+    content_versions = {}
+
+
 class ZipFileLongPaths(ZipFile):
     def _extract_member(self, member, target_path, pwd):
         return ZipFile._extract_member(
@@ -204,6 +226,127 @@ class ZipFileLongPaths(ZipFile):
         )
 
 
+def _read_archive_checksums(zip_file: ZipFile) -> Union[Dict[str, str], None]:
+    try:
+        checksums_data = zip_file.read("checksums").decode("utf-8")
+    except KeyError:
+        return None
+
+    checksums = {}
+    for line in checksums_data.splitlines():
+        if not line:
+            continue
+        file_checksum, file_name = line.split(":", 1)
+        checksums[file_name.replace("\\", "/")] = file_checksum
+    return checksums
+
+
+def _extract_archive_member(zip_file: ZipFile, member: str, dest_path: Path) -> str:
+    """Extract single member and return sha256 of its content."""
+    h = hashlib.sha256()
+    os.makedirs(sanitize_long_path(str(dest_path.parent)), exist_ok=True)
+    with zip_file.open(member) as src_stream, open(sanitize_long_path(str(dest_path)), "wb") as dst_stream:
+        for chunk in iter(lambda: src_stream.read(1024 * 1024), b""):
+            h.update(chunk)
+            dst_stream.write(chunk)
+    return h.hexdigest()
+
+
+def extract_archive(archive_path: Path, destination_path: Path,
+                    max_workers: Optional[int] = None) -> None:
+    """Extract archive of package version and validate its checksums.
+
+    Members are extracted by a pool of threads and their sha256 is computed
+    while they are written, so the content is not read again to validate it.
+    Checksums are validated against the 'checksums' file shipped in the
+    archive (if there is one).
+
+    Archive is extracted into a temporary directory next to the destination
+    which is then renamed, so the destination never contains a partially
+    extracted or invalid version.
+
+    Args:
+        archive_path (Path): Path to the zip archive.
+        destination_path (Path): Directory where the content is extracted.
+            Existing directory is replaced.
+        max_workers (Optional[int]): Number of extracting threads.
+
+    Throws:
+        PackageVersionInvalid: if the archive content doesn't match
+            its checksums.
+    """
+    archive_path = Path(archive_path)
+    destination_path = Path(destination_path)
+    if max_workers is None:
+        max_workers = ARCHIVE_EXTRACT_MAX_WORKERS
+
+    destination_path.parent.mkdir(parents=True, exist_ok=True)
+    staging_path = destination_path.parent.joinpath(
+        f".{destination_path.name}.{os.getpid()}.extracting")
+    if staging_path.exists():
+        shutil.rmtree(staging_path)
+    staging_path.mkdir()
+
+    try:
+        with ZipFile(archive_path, "r") as zip_file:
+            checksums = _read_archive_checksums(zip_file)
+
+            members = []
+            for zip_info in zip_file.infolist():
+                member = zip_info.filename
+                member_parts = Path(member).parts
+                if Path(member).is_absolute() or ".." in member_parts:
+                    raise PackageVersionInvalid(f"Invalid member path \"{member}\" in {archive_path}")
+
+                if zip_info.is_dir():
+                    staging_path.joinpath(member).mkdir(parents=True, exist_ok=True)
+                    continue
+
+                if (
+                    checksums is not None
+                    and member not in checksums
+                    and member not in _CHECKSUMS_EXCLUDED_MEMBERS
+                ):
+                    raise PackageVersionInvalid(f"Missing checksum of \"{member}\" in {archive_path}")
+                members.append(member)
+
+            if checksums is not None:
+                missing_members = set(checksums).difference(members)
+                if missing_members:
+                    raise PackageVersionInvalid(f"Missing files {missing_members} in {archive_path}")
+
+            # Zip file object is shared, reads of compressed data are
+            #   serialized but decompression, hashing and writing are not
+            with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures_by_member = {
+                    executor.submit(
+                        _extract_archive_member, zip_file, member, staging_path.joinpath(member)
+                    ): member
+                    for member in members
+                }
+                for future in futures.as_completed(futures_by_member):
+                    member = futures_by_member[future]
+                    file_checksum = future.result()
+                    if checksums is not None and member in checksums and checksums[member] != file_checksum:
+                        for pending_future in futures_by_member:
+                            pending_future.cancel()
+                        raise PackageVersionInvalid(f"Invalid checksum on {member} in {archive_path}")
+
+        # Swap the extracted content into place
+        previous_path = None
+        if destination_path.exists():
+            previous_path = destination_path.parent.joinpath(
+                f".{destination_path.name}.{os.getpid()}.previous")
+            os.replace(destination_path, previous_path)
+        os.replace(staging_path, destination_path)
+        if previous_path is not None:
+            shutil.rmtree(previous_path, ignore_errors=True)
+
+    except BaseException:
+        shutil.rmtree(staging_path, ignore_errors=True)
+        raise
+
+
 class PackageHandler:
     """Class for handling a package."""
     type = "package"
@@ -475,6 +618,27 @@ class PackageHandler:
                            "doesn't match. Skipping.")
         return True, "Versions match"
 
+    @classmethod
+    def get_package_version_from_zip(cls, pkg_name: str, zip_path: Path) -> str:
+        """Get version of Package stored in the given archive.
+
+        Args:
+            pkg_name (str):  Package name.
+            zip_path (Path): Path to the archive containing the package.
+
+        Returns:
+            str: version string.
+
+        Throws:
+            BadZipFile: if the file is not a zip archive.
+            KeyError: if the archive does not contain the package version file.
+        """
+        with ZipFile(zip_path, "r") as zip_file:
+            with zip_file.open(f"{pkg_name}/version.py") as version_file:
+                zip_version = {}
+                exec(version_file.read(), zip_version)
+        return zip_version["__version__"]
+
     @classmethod
     def compare_version_with_package_zip(cls, pkg_name: str, zip_path: Path, version_obj) -> Tuple[bool, str]:
         if not zip_path or not isinstance(zip_path, Path) or not zip_path.exists() or not zip_path.is_file():
@@ -485,28 +649,152 @@ class PackageHandler:
             return False, "Not a ZIP file."
 
         try:
-            with ZipFile(zip_path, "r") as zip_file:
-                with zip_file.open(
-                        f"{pkg_name}/version.py") as version_file:
-                    zip_version = {}
-                    exec(version_file.read(), zip_version)
-                    try:
-                        version_check = PackageVersion(
-                            version=zip_version["__version__"])
-                    except ValueError as e:
-                        return False, str(e)
-
-                    if not version_check.compare_major_minor_patch(version_obj):
-                        return False, (f"zip version ({version_obj}) "
-                                       f"and its content version "
-                                       f"({version_check}) "
-                                       "doesn't match. Skipping.")
+            content_version_str = cls.get_package_version_from_zip(pkg_name, zip_path)
         except BadZipFile:
             return False, f"{zip_path} is not a zip file"
         except KeyError:
             return False, "Zip does not contain QuadPype"
+
+        return cls._compare_content_version(content_version_str, version_obj, "zip")
+
+    @staticmethod
+    def _compare_content_version(content_version_str, version_obj, source_type) -> Tuple[bool, str]:
+        try:
+            version_check = PackageVersion(version=content_version_str)
+        except (TypeError, ValueError) as e:
+            return False, str(e)
+
+        if not version_check.compare_major_minor_patch(version_obj):
+            return False, (f"{source_type} version ({version_obj}) "
+                           f"and its content version "
+                           f"({version_check}) "
+                           "doesn't match. Skipping.")
         return True, "Versions match"
 
+    @staticmethod
+    def _get_archive_signature(stat_result) -> Tuple[int, int]:
+        # Whole seconds, sub-second precision differs between SMB clients
+        return stat_result.st_size, int(stat_result.st_mtime)
+
+    @staticmethod
+    def _get_index_archives(pkg_name: str, index_data: Any) -> Dict[str, dict]:
+        if not isinstance(index_data, dict) or index_data.get("package") != pkg_name:
+            return {}
+
+        archives = index_data.get("archives")
+        if not isinstance(archives, dict):
+            return {}
+        return archives
+
+    @classmethod
+    def read_versions_index(cls, pkg_name: str, dir_path: Path) -> Dict[str, dict]:
+        """Read index of archives written on deploy in the directory.
+
+        Args:
+            pkg_name (str): Name of the package.
+            dir_path (Path): Directory containing the archives.
+
+        Returns:
+            Dict[str, dict]: Size, mtime and content version of archives
+                by their file name. Empty if the index is missing or invalid.
+        """
+        index_path = dir_path.joinpath(VERSIONS_INDEX_FILENAME)
+        try:
+            with index_path.open("r") as stream:
+                index_data = json.load(stream)
+        except (OSError, ValueError):
+            return {}
+
+        return cls._get_index_archives(pkg_name, index_data)
+
+    @classmethod
+    def write_versions_index(cls, pkg_name: str, dir_path: Path) -> Dict[str, dict]:
+        """Write index of archives in the directory.
+
+        Should be called after a version is deployed to a versions location.
+        Index is written in nested 'major.minor' directories too. Archives
+        which are already indexed with the same size and mtime are not opened.
+
+        Args:
+            pkg_name (str): Name of the package.
+            dir_path (Path): Directory containing the archives.
+
+        Returns:
+            Dict[str, dict]: Written index of archives in the directory.
+        """
+        dir_path = Path(dir_path)
+        previous_archives = cls.read_versions_index(pkg_name, dir_path)
+        archives = {}
+        for item in dir_path.iterdir():
+            if item.is_dir():
+                if re.match(r"^v?\d+\.\d+.*$", item.name):
+                    cls.write_versions_index(pkg_name, item)
+                continue
+
+            if item.suffix.lower() != ".zip" or not cls.get_version_from_str(item.stem):
+                continue
+
+            size, mtime = cls._get_archive_signature(item.stat())
+            archive_data = previous_archives.get(item.name)
+            if (
+                not archive_data
+                or archive_data.get("size") != size
+                or archive_data.get("mtime") != mtime
+            ):
+                try:
+                    content_version_str = cls.get_package_version_from_zip(pkg_name, item)
+                except (BadZipFile, KeyError):
+                    # Empty version marks archive without the package
+                    content_version_str = ""
+                archive_data = {
+                    "size": size,
+                    "mtime": mtime,
+                    "version": content_version_str
+                }
+            archives[item.name] = archive_data
+
+        # Write to temporary file first so readers never get a partial index
+        index_path = dir_path.joinpath(VERSIONS_INDEX_FILENAME)
+        tmp_index_path = dir_path.joinpath(f".{VERSIONS_INDEX_FILENAME}.{os.getpid()}")
+        with tmp_index_path.open("w") as stream:
+            json.dump({"package": pkg_name, "archives": archives}, stream, indent=4)
+        os.replace(tmp_index_path, index_path)
+        return archives
+
+    @classmethod
+    def _read_versions_index_from_url(cls, pkg_name: str, source_url: str) -> Dict[str, dict]:
+        try:
+            response = cls._request_session.get(f"{source_url}{VERSIONS_INDEX_FILENAME}")
+            if response.status_code != 200:
+                return {}
+            index_data = response.json()
+        except Exception:  # noqa
+            return {}
+
+        return cls._get_index_archives(pkg_name, index_data)
+
+    @classmethod
+    def _validate_version_candidate(cls, pkg_name: str, item: Path, version_obj,
+                                    cache_key: Optional[tuple], content_version_str: Optional[str]) -> bool:
+        if cache_key is None:
+            try:
+                return cls.compare_version_with_package_dir(pkg_name, item, version_obj)[0]
+            except ValueError:
+                # Directory was removed during the scan
+                return False
+
+        if content_version_str is None:
+            try:
+                content_version_str = cls.get_package_version_from_zip(pkg_name, item)
+            except (OSError, BadZipFile, KeyError):
+                content_version_str = ""
+            with _ArchivesCache.lock:
+                _ArchivesCache.content_versions[cache_key] = content_version_str
+
+        if not content_version_str:
+            return False
+        return cls._compare_content_version(content_version_str, version_obj, "zip")[0]
+
     def get_available_versions(self, from_local: bool = None, from_remote: bool = None) -> List:
         """Get all available versions."""
         if from_local is None and from_remote is None:
@@ -569,10 +857,22 @@ class PackageHandler:
         if not source_path or not source_path.exists() or not source_path.is_dir():
             return versions
 
+        # Archives are validated by their content only if they are not in
+        #   the index written on deploy or were modified since
+        index_archives = cls.read_versions_index(pkg_name, source_path)
+
+        # Items to validate (path, version, archive cache key, content version)
+        candidates = []
+
         # Iterate over directory at the first level
-        for item in source_path.iterdir():
+        with os.scandir(source_path) as dir_entries:
+            dir_entries = list(dir_entries)
+
+        for dir_entry in dir_entries:
+            item = Path(dir_entry.path)
+            is_dir = dir_entry.is_dir()
             # If the item is a directory with a major.minor version format, dive deeper
-            if item.is_dir() and re.match(r"^v?\d+\.\d+.*$", item.name) and parent_version is None:
+            if is_dir and re.match(r"^v?\d+\.\d+.*$", item.name) and parent_version is None:
                 parent_version_str = f"{item.name.removeprefix('v')}.0"
                 detected_versions = cls.get_versions_from_dir(
                     pkg_name,
@@ -588,24 +888,58 @@ class PackageHandler:
                 continue
 
             # If it's a file, process its name (stripped of extension)
-            name = item.name if item.is_dir() else item.stem
+            name = item.name if is_dir else item.stem
             version = cls.get_version_from_str(name)
 
             if not version or (parent_version and (
                     version.major != parent_version.major or version.minor != parent_version.minor)):
                 continue
 
-            # If it's a directory, check if version is valid within it
-            if item.is_dir() and not cls.compare_version_with_package_dir(pkg_name, item, version)[0]:
+            if str(version) in excluded_str_versions:
+                continue
+
+            if is_dir:
+                candidates.append((item, version, None, None))
                 continue
 
-            # If it's a file, check if version is valid within the zip
-            if item.is_file() and not cls.compare_version_with_package_zip(pkg_name, item, version)[0]:
+            if item.suffix.lower() != ".zip":
                 continue
 
+            signature = cls._get_archive_signature(dir_entry.stat())
+            cache_key = (dir_entry.path, signature)
+            with _ArchivesCache.lock:
+                content_version_str = _ArchivesCache.content_versions.get(cache_key)
+
+            if content_version_str is None:
+                archive_data = index_archives.get(dir_entry.name)
+                if archive_data and (archive_data.get("size"), archive_data.get("mtime")) == signature:
+                    content_version_str = archive_data.get("version")
+
+            candidates.append((item, version, cache_key, content_version_str))
+
+        # Directories and not indexed archives are read in parallel,
+        #   latency of the network share is the bottleneck
+        pending_count = sum(
+            1 for candidate in candidates
+            if candidate[2] is None or candidate[3] is None
+        )
+
+        def _validate(candidate):
+            return cls._validate_version_candidate(pkg_name, *candidate)
+
+        if pending_count > 1:
+            max_workers = min(pending_count, VERSIONS_SCAN_MAX_WORKERS)
+            with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(_validate, candidates))
+        else:
+            results = list(map(_validate, candidates))
+
+        for candidate, is_valid in zip(candidates, results):
+            if not is_valid:
+                continue
+            item, version = candidate[:2]
             version.set_location(item.resolve())
-            if str(version) not in excluded_str_versions:
-                versions.append(version)
+            versions.append(version)
 
         # Correlation dict (key is version str, value is version obj)
         versions_correlation = {}
@@ -672,6 +1006,12 @@ class PackageHandler:
         if not source_url.endswith("/"):
             source_url = source_url + "/"
 
+        # Archives listed in the index written on deploy don't need to be checked
+        index_archives = cls._read_versions_index_from_url(pkg_name, source_url)
+
+        # Archives to check (url, version)
+        candidates = []
+
         # Iterate over webpage at the first level
         for item in listing:
             item_full_url = SourceURL(f"{source_url}{item.name}")
@@ -692,14 +1032,6 @@ class PackageHandler:
 
                 continue
 
-            try:
-                response = cls._request_session.head(item_full_url)
-            except Exception:  # noqa
-                continue
-
-            if response.status_code != 200 or response.headers.get("content-type") not in allowed_content_type:
-                continue
-
             # If it's a file, process its name (stripped of extension)
             name = Path(item.name).stem
             version = cls.get_version_from_str(name)
@@ -708,8 +1040,35 @@ class PackageHandler:
                     version.major != parent_version.major or version.minor != parent_version.minor)):
                 continue
 
-            version.set_location(item_full_url)
-            if str(version) not in excluded_str_versions:
+            if str(version) in excluded_str_versions:
+                continue
+
+            archive_data = index_archives.get(item.name)
+            if archive_data is not None:
+                if cls._compare_content_version(archive_data.get("version"), version, "zip")[0]:
+                    version.set_location(item_full_url)
+                    versions.append(version)
+                continue
+
+            candidates.append((item_full_url, version))
+
+        def _is_archive_url(candidate):
+            try:
+                response = cls._request_session.head(candidate[0])
+            except Exception:  # noqa
+                return False
+            return response.status_code == 200 and response.headers.get("content-type") in allowed_content_type
+
+        if len(candidates) > 1:
+            max_workers = min(len(candidates), VERSIONS_SCAN_MAX_WORKERS)
+            with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(_is_archive_url, candidates))
+        else:
+            results = list(map(_is_archive_url, candidates))
+
+        for (item_full_url, version), is_valid in zip(candidates, results):
+            if is_valid:
+                version.set_location(item_full_url)
                 versions.append(version)
 
         # Correlation dict (key is version str, value is version obj)
@@ -840,7 +1199,7 @@ class PackageHandler:
 
         if response.status_code == 200:
             with open(dest_archive_path, "wb") as file:
-                for chunk in response.iter_content(chunk_size=8192):
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
                     file.write(chunk)
         else:
             raise Exception(f"Failed to download {remote_version.location}. HTTP status code: {response.status_code}")
@@ -868,7 +1227,7 @@ class PackageHandler:
 
         destination_dir = self.local_dir_path.joinpath(f"{remote_version.major}.{remote_version.minor}")
         destination_path = destination_dir.joinpath(str(remote_version))
-        destination_path.mkdir(parents=True, exist_ok=True)
+        destination_dir.mkdir(parents=True, exist_ok=True)
 
         if remote_version.download_required:
             archive_temp_path = Path(tempfile.gettempdir()).joinpath(f"{str(remote_version)}.zip")
@@ -884,8 +1243,7 @@ class PackageHandler:
                 shutil.copy2(remote_version.location, destination_dir, follow_symlinks=True)
 
             # Unzip the local copy
-            with ZipFile(archive_local_path, 'r') as zip_ref:
-                zip_ref.extractall(destination_path)
+            extract_archive(archive_local_path, destination_path)
         else:
             shutil.copytree(remote_version.location, destination_path, dirs_exist_ok=True)
 
@@ -969,8 +1327,7 @@ class PackageHandler:
 
         # Unzip
         destination_path = version_obj.location.parent.joinpath(str(version_obj))
-        with ZipFile(version_obj.location, 'r') as zip_ref:
-            zip_ref.extractall(destination_path)
+        extract_archive(version_obj.location, destination_path)
 
         version_obj.set_location(destination_path)
         return version_obj
@@ -16,9 +16,11 @@ from .base import (
     AddOnPriority,
 
     load_modules,
+    load_host_module,
 
     ModulesManager,
     TrayModulesManager,
+    get_modules_manager,
 
     BaseModuleSettingsDef,
     ModuleSettingsDef,
@@ -44,9 +46,11 @@ __all__ = (
     "AddOnPriority",
 
     "load_modules",
+    "load_host_module",
 
     "ModulesManager",
     "TrayModulesManager",
+    "get_modules_manager",
 
     "BaseModuleSettingsDef",
     "ModuleSettingsDef",
@@ -41,6 +41,7 @@ from quadpype.lib import (
     get_user_settings
 )
 
+from quadpype.lib.profiling import profile_phase
 from quadpype.lib.version import (
     retrieve_package_manager,
     get_package,
@@ -180,6 +181,107 @@ class _LoadCache:
     modules_lock = threading.Lock()
     interfaces_loaded = False
     modules_loaded = False
+    # Import time of python modules by their name in 'quadpype_modules'
+    import_times = {}
+    # Host addons which were not imported by host name
+    deferred_host_modules = {}
+
+
+class _ModulesIndex:
+    """Persisted index of modules content.
+
+    Index stores names of module classes, implemented interfaces and host
+    names of each module path. Entry is valid until modification time of
+    the module path (or of any file directly in it) changes.
+
+    Index is used to skip import of host addons of other hosts when
+    running inside a host.
+    """
+
+    def __init__(self):
+        self._path = os.path.join(
+            user_data_dir("quadpype", "quad"), "modules_index.json"
+        )
+        self._data = None
+        self._changed = False
+
+    @property
+    def data(self):
+        if self._data is None:
+            self._data = {}
+            try:
+                with open(self._path, "r") as stream:
+                    self._data = json.load(stream)
+            except (OSError, ValueError):
+                pass
+        return self._data
+
+    @staticmethod
+    def get_mtime(path):
+        mtime = os.path.getmtime(path)
+        if os.path.isdir(path):
+            for entry in os.scandir(path):
+                mtime = max(mtime, entry.stat().st_mtime)
+        return mtime
+
+    def get_entry(self, path):
+        entry = self.data.get(path)
+        if entry is None:
+            return None
+        try:
+            mtime = self.get_mtime(path)
+        except OSError:
+            return None
+        if entry.get("mtime") != mtime:
+            return None
+        return entry
+
+    def set_entry(self, path, python_module):
+        try:
+            mtime = self.get_mtime(path)
+        except OSError:
+            return
+
+        class_names = []
+        interfaces = set()
+        host_names = []
+        for module_class in _get_module_classes(python_module):
+            class_names.append(module_class.__name__)
+            for base in inspect.getmro(module_class):
+                if (
+                    base is not QuadPypeInterface
+                    and issubclass(base, QuadPypeInterface)
+                ):
+                    interfaces.add(base.__name__)
+            if issubclass(module_class, IHostAddon):
+                host_name = module_class.host_name
+                if isinstance(host_name, str):
+                    host_names.append(host_name)
+
+        entry = {
+            "mtime": mtime,
+            "classes": class_names,
+            "interfaces": list(sorted(interfaces)),
+            "host_names": host_names,
+        }
+        if self.data.get(path) != entry:
+            self.data[path] = entry
+            self._changed = True
+
+    def save(self):
+        if not self._changed:
+            return
+        try:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            tmp_path = "{}.{}.tmp".format(self._path, os.getpid())
+            with open(tmp_path, "w") as stream:
+                json.dump(self.data, stream, indent=4)
+            os.replace(tmp_path, self._path)
+            self._changed = False
+        except OSError:
+            Logger.get_logger("ModulesLoader").debug(
+                "Failed to store modules index.", exc_info=True
+            )
 
 
 def get_default_modules_dir():
@@ -383,6 +485,12 @@ def _load_modules():
 
     ignored_current_dir_filenames = set(IGNORED_DEFAULT_FILENAMES)
 
+    # Host addons of other hosts are not imported when running in a host
+    current_host_name = os.getenv("AVALON_APP")
+    modules_index = _ModulesIndex()
+    _LoadCache.import_times = {}
+    _LoadCache.deferred_host_modules = {}
+
     processed_paths = set()
     for dir_path in frozenset(module_dirs):
         # Skip already processed paths
@@ -430,50 +538,172 @@ def _load_modules():
             elif ext not in (".py", ):
                 continue
 
-            # TODO add more logic how to define if folder is module or not
-            # - check manifest and content of manifest
-            try:
-                # Don't import dynamically current directory modules
-                if is_in_current_dir:
-                    import_str = "quadpype.modules.{}".format(basename)
-                    new_import_str = "{}.{}".format(modules_key, basename)
-                    default_module = __import__(import_str, fromlist=("", ))
-                    sys.modules[new_import_str] = default_module
-                    setattr(quadpype_modules, basename, default_module)
-
-                elif is_in_host_dir:
-                    import_str = "quadpype.hosts.{}".format(basename)
-                    new_import_str = "{}.{}".format(modules_key, basename)
-                    # Until all hosts are converted to be able to use them as
-                    #   modules is this error check needed
-                    try:
-                        default_module = __import__(
-                            import_str, fromlist=("", )
+            if is_in_host_dir and current_host_name:
+                # Import other host addons only when they are requested
+                entry = modules_index.get_entry(fullpath)
+                if (
+                    entry is not None
+                    and entry["host_names"]
+                    and current_host_name not in entry["host_names"]
+                    and set(entry["interfaces"]) == {"IHostAddon"}
+                ):
+                    for host_name in entry["host_names"]:
+                        _LoadCache.deferred_host_modules[host_name] = (
+                            fullpath
                         )
-                        sys.modules[new_import_str] = default_module
-                        setattr(quadpype_modules, basename, default_module)
+                    continue
 
-                    except Exception:
-                        log.warning(
-                            "Failed to import host folder {}".format(basename),
-                            exc_info=True
-                        )
+            import_start = time.time()
+            python_module = _import_module_path(
+                fullpath, is_in_current_dir, is_in_host_dir,
+                quadpype_modules, log
+            )
+            if python_module is None:
+                continue
+            _LoadCache.import_times[basename] = time.time() - import_start
+            modules_index.set_entry(fullpath, python_module)
+
+    modules_index.save()
+
+
+def _import_module_path(
+    fullpath, is_in_current_dir, is_in_host_dir, quadpype_modules, log
+):
+    modules_key = quadpype_modules.name
+    dir_path, filename = os.path.split(fullpath)
+    basename = os.path.splitext(filename)[0]
+
+    # TODO add more logic how to define if folder is module or not
+    # - check manifest and content of manifest
+    try:
+        # Don't import dynamically current directory modules
+        if is_in_current_dir:
+            import_str = "quadpype.modules.{}".format(basename)
+            new_import_str = "{}.{}".format(modules_key, basename)
+            default_module = __import__(import_str, fromlist=("", ))
+            sys.modules[new_import_str] = default_module
+            setattr(quadpype_modules, basename, default_module)
+            return default_module
+
+        if is_in_host_dir:
+            import_str = "quadpype.hosts.{}".format(basename)
+            new_import_str = "{}.{}".format(modules_key, basename)
+            # Until all hosts are converted to be able to use them as
+            #   modules is this error check needed
+            try:
+                default_module = __import__(
+                    import_str, fromlist=("", )
+                )
+                sys.modules[new_import_str] = default_module
+                setattr(quadpype_modules, basename, default_module)
+                return default_module
 
-                elif os.path.isdir(fullpath):
-                    import_module_from_dirpath(dir_path, filename, modules_key)
+            except Exception:
+                log.warning(
+                    "Failed to import host folder {}".format(basename),
+                    exc_info=True
+                )
+                return None
 
-                else:
-                    module = import_filepath(fullpath)
-                    setattr(quadpype_modules, basename, module)
+        if os.path.isdir(fullpath):
+            return import_module_from_dirpath(dir_path, filename, modules_key)
 
-            except Exception:
-                if is_in_current_dir:
-                    msg = "Failed to import default module '{}'.".format(
-                        basename
-                    )
-                else:
-                    msg = "Failed to import module '{}'.".format(fullpath)
-                log.error(msg, exc_info=True)
+        module = import_filepath(fullpath)
+        setattr(quadpype_modules, basename, module)
+        return module
+
+    except Exception:
+        if is_in_current_dir:
+            msg = "Failed to import default module '{}'.".format(
+                basename
+            )
+        else:
+            msg = "Failed to import module '{}'.".format(fullpath)
+        log.error(msg, exc_info=True)
+    return None
+
+
+def load_host_module(host_name):
+    """Import host addon which was not imported by 'load_modules'.
+
+    Host addons of other hosts are not imported when modules are loaded
+    inside a host (based on modules index).
+
+    Args:
+        host_name (str): Name of host.
+
+    Returns:
+        Union[ModuleType, None]: Imported python module or None if host addon
+            was not deferred or failed to import.
+    """
+    load_modules()
+    with _LoadCache.modules_lock:
+        fullpath = _LoadCache.deferred_host_modules.get(host_name)
+        if fullpath is None:
+            return None
+
+        for key, value in tuple(_LoadCache.deferred_host_modules.items()):
+            if value == fullpath:
+                _LoadCache.deferred_host_modules.pop(key)
+
+        import quadpype_modules
+
+        log = Logger.get_logger("ModulesLoader")
+        import_start = time.time()
+        python_module = _import_module_path(
+            fullpath, False, True, quadpype_modules, log
+        )
+        if python_module is not None:
+            basename = os.path.basename(fullpath)
+            _LoadCache.import_times[basename] = time.time() - import_start
+        return python_module
+
+
+def _get_module_classes(python_module, log=None):
+    """Module classes defined or imported in python module.
+
+    Args:
+        python_module (ModuleType): Imported python module.
+        log (Optional[logging.Logger]): Logger to report abstract classes.
+
+    Returns:
+        list[type[QuadPypeModule]]: Module classes.
+    """
+    module_classes = []
+    for name in dir(python_module):
+        modules_item = getattr(python_module, name, None)
+        # Filter globals that are not classes which inherit from
+        #   QuadPypeModule
+        if (
+            not inspect.isclass(modules_item)
+            or modules_item is QuadPypeModule
+            or modules_item is QuadPypeAddOn
+            or not issubclass(modules_item, QuadPypeModule)
+        ):
+            continue
+
+        # Check if class is abstract (Developing purpose)
+        if inspect.isabstract(modules_item):
+            if log is None:
+                continue
+            # Find abstract attributes by convention on `abc` module
+            not_implemented = []
+            for attr_name in dir(modules_item):
+                attr = getattr(modules_item, attr_name, None)
+                abs_method = getattr(
+                    attr, "__isabstractmethod__", None
+                )
+                if attr and abs_method:
+                    not_implemented.append(attr_name)
+
+            # Log missing implementations
+            log.warning((
+                "Skipping abstract Class: {}."
+                " Missing implementations: {}"
+            ).format(name, ", ".join(not_implemented)))
+            continue
+        module_classes.append(modules_item)
+    return module_classes
 
 
 class QuadPypeModule(ABC):
@@ -644,6 +874,7 @@ class ModulesManager:
         self.modules = []
         self.modules_by_id = {}
         self.modules_by_name = {}
+        self._modules_settings = None
         # For report of time consumption
         self._report = {}
 
@@ -686,10 +917,16 @@ class ModulesManager:
             return module
         return default
 
+    @profile_phase("ModulesManager.initialize_modules")
     def initialize_modules(self):
         """Import and initialize modules."""
         # Make sure modules are loaded
+        load_start = time.time()
         load_modules()
+        if self._report is not None:
+            self._report["Load modules"] = {
+                self._report_total_key: time.time() - load_start
+            }
 
         import quadpype_modules
 
@@ -700,50 +937,35 @@ class ModulesManager:
             global_settings = get_global_settings()
 
         modules_settings = global_settings[ADDONS_SETTINGS_KEY]
+        self._modules_settings = modules_settings
+
+        import_report = {}
+        module_classes = []
+        for python_module_name, python_module in quadpype_modules.items():
+            for module_class in _get_module_classes(python_module, self.log):
+                module_classes.append(module_class)
+                import_time = _LoadCache.import_times.get(python_module_name)
+                if import_time is not None:
+                    import_report[module_class.__name__] = import_time
+
+        if self._report is not None and import_report:
+            import_report[self._report_total_key] = sum(
+                _LoadCache.import_times.values()
+            )
+            self._report["Import"] = import_report
+
+        self._initialize_module_classes(module_classes, "Initialization")
 
+    def _initialize_module_classes(self, module_classes, report_label):
+        modules_settings = self._modules_settings
         report = {}
         time_start = time.time()
         prev_start_time = time_start
 
-        module_classes = []
-        for module in quadpype_modules:
-            # Go through globals in `pype.modules`
-            for name in dir(module):
-                modules_item = getattr(module, name, None)
-                # Filter globals that are not classes which inherit from
-                #   QuadPypeModule
-                if (
-                    not inspect.isclass(modules_item)
-                    or modules_item is QuadPypeModule
-                    or modules_item is QuadPypeModule
-                    or modules_item is QuadPypeAddOn
-                    or not issubclass(modules_item, QuadPypeModule)
-                ):
-                    continue
-
-                # Check if class is abstract (Developing purpose)
-                if inspect.isabstract(modules_item):
-                    # Find abstract attributes by convention on `abc` module
-                    not_implemented = []
-                    for attr_name in dir(modules_item):
-                        attr = getattr(modules_item, attr_name, None)
-                        abs_method = getattr(
-                            attr, "__isabstractmethod__", None
-                        )
-                        if attr and abs_method:
-                            not_implemented.append(attr_name)
-
-                    # Log missing implementations
-                    self.log.warning((
-                        "Skipping abstract Class: {}."
-                        " Missing implementations: {}"
-                    ).format(name, ", ".join(not_implemented)))
-                    continue
-                module_classes.append(modules_item)
-
         # Sort the modules by priority
         module_classes.sort(key=lambda module_class: module_class.priority)
 
+        initialized_modules = []
         for modules_item in module_classes:
             settings = modules_settings
             name = modules_item.__name__
@@ -754,6 +976,7 @@ class ModulesManager:
                 self.modules.append(module)
                 self.modules_by_id[module.id] = module
                 self.modules_by_name[module.name] = module
+                initialized_modules.append(module)
                 enabled_str = "X"
                 if not module.enabled:
                     enabled_str = " "
@@ -771,7 +994,45 @@ class ModulesManager:
 
         if self._report is not None:
             report[self._report_total_key] = time.time() - time_start
-            self._report["Initialization"] = report
+            self._report.setdefault(report_label, {}).update(report)
+        return initialized_modules
+
+    def _load_host_module(self, host_name):
+        """Import and initialize host addon which was not imported yet.
+
+        Args:
+            host_name (str): Name of host.
+
+        Returns:
+            bool: New modules were initialized.
+        """
+        python_module = load_host_module(host_name)
+        if python_module is None:
+            return False
+
+        module_classes = [
+            module_class
+            for module_class in _get_module_classes(python_module, self.log)
+            if module_class.__name__ not in {
+                module.__class__.__name__
+                for module in self.modules
+            }
+        ]
+        new_modules = self._initialize_module_classes(
+            module_classes, "Deferred initialization"
+        )
+        enabled_modules = self.get_enabled_modules()
+        for module in new_modules:
+            if not module.enabled:
+                continue
+            try:
+                module.connect_with_modules(enabled_modules)
+            except Exception:
+                self.log.error(
+                    "BUG: Module failed on connection with other modules.",
+                    exc_info=True
+                )
+        return bool(new_modules)
 
     def connect_modules(self):
         """Trigger connection with other enabled modules.
@@ -1016,6 +1277,10 @@ class ModulesManager:
                 and module.host_name == host_name
             ):
                 return module
+
+        # Host addon may not be imported yet
+        if self._load_host_module(host_name):
+            return self.get_host_module(host_name)
         return None
 
     def get_host_names(self):
@@ -1026,6 +1291,9 @@ class ModulesManager:
                 inheriting 'IHostAddon'.
         """
 
+        for host_name in tuple(_LoadCache.deferred_host_modules):
+            self._load_host_module(host_name)
+
         return {
             module.host_name
             for module in self.get_enabled_modules()
@@ -1149,6 +1417,72 @@ class ModulesManager:
         print(output)
 
 
+class _ModulesManagerCache:
+    lock = threading.Lock()
+    manager = None
+    settings_version = None
+    # Global settings version is validated at most once per interval
+    check_interval = 10
+    last_check = 0
+
+
+def _get_global_settings_version():
+    from quadpype.settings.lib import get_global_settings_last_saved_info
+
+    last_saved_info = get_global_settings_last_saved_info()
+    if last_saved_info is None:
+        return None
+    return last_saved_info.timestamp
+
+
+def get_modules_manager(refresh=False):
+    """Modules manager shared by the whole process.
+
+    Manager is initialized on first call and reused until global settings
+    are saved (version is compared to last saved timestamp of global
+    settings) or 'refresh' is requested.
+
+    Managers created with custom settings or modules which hold a manager
+    for their lifetime (tray, services) should use 'ModulesManager' directly.
+
+    Args:
+        refresh (Optional[bool]): Force initialization of new manager.
+
+    Returns:
+        ModulesManager: Initialized and connected modules manager.
+    """
+    with _ModulesManagerCache.lock:
+        manager = _ModulesManagerCache.manager
+        now = time.time()
+        if (
+            not refresh
+            and manager is not None
+            and now - _ModulesManagerCache.last_check
+            < _ModulesManagerCache.check_interval
+        ):
+            return manager
+
+        settings_version = _ModulesManagerCache.settings_version
+        try:
+            settings_version = _get_global_settings_version()
+        except Exception:
+            # Keep current manager if settings are not available
+            log = Logger.get_logger("ModulesManager")
+            log.warning(
+                "Failed to get global settings version.", exc_info=True
+            )
+        _ModulesManagerCache.last_check = now
+        if (
+            refresh
+            or manager is None
+            or settings_version != _ModulesManagerCache.settings_version
+        ):
+            manager = ModulesManager()
+            _ModulesManagerCache.manager = manager
+            _ModulesManagerCache.settings_version = settings_version
+        return manager
+
+
 class TrayModulesManager(ModulesManager):
     # Define order of modules in menu
     modules_menu_order = (
@@ -24,6 +24,12 @@ from quadpype.pipeline.publish import (
 from quadpype.pipeline.publish.lib import (
     replace_with_published_scene_path
 )
+from quadpype.pipeline.farm.environment_snapshot import (
+    ENV_SNAPSHOT_DIR_KEY,
+    ENV_SNAPSHOT_KEY_KEY,
+    get_environment_snapshot_dir,
+    get_environment_snapshot_key,
+)
 
 JSONDecodeError = getattr(json.decoder, "JSONDecodeError", ValueError)
 
@@ -603,6 +609,7 @@ class AbstractSubmitDeadline(pyblish.api.InstancePlugin,
 
         """
         job = job_info if job_info is not None else self.job_info
+        self.add_environment_snapshot_key(job)
         serialized_job = job.serialize()
         job_dependency_id = self._instance.data.get('jobDependency', {}).get(job_info.BatchName, None)
         if job_dependency_id:
@@ -615,6 +622,38 @@ class AbstractSubmitDeadline(pyblish.api.InstancePlugin,
             "AuxFiles": aux_files if aux_files is not None else self.aux_files
         }
 
+    def add_environment_snapshot_key(self, job_info):
+        """Add key of environment snapshot shared by tasks of the job.
+
+        Tasks of the job will compute environments only once per platform
+        and reuse them from snapshot directory. Nothing is added if snapshot
+        directory is not set or job does not have full context.
+
+        Args:
+            job_info (DeadlineJobInfo): Deadline JobInfo.
+        """
+        snapshot_dir = get_environment_snapshot_dir()
+        if not snapshot_dir:
+            return
+
+        job_env = job_info.EnvironmentKeyValue
+        context_values = [
+            job_env.get(key)
+            for key in (
+                "AVALON_PROJECT",
+                "AVALON_ASSET",
+                "AVALON_TASK",
+                "AVALON_APP_NAME",
+            )
+        ]
+        if not all(context_values):
+            return
+
+        job_env[ENV_SNAPSHOT_DIR_KEY] = snapshot_dir
+        job_env[ENV_SNAPSHOT_KEY_KEY] = get_environment_snapshot_key(
+            *context_values, env_group="farm"
+        )
+
     def submit(self, payload):
         """Submit payload to Deadline API end-point.
 
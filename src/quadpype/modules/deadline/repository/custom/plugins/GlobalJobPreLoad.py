@@ -286,6 +286,49 @@ def get_requested_quadpype_executable(
     return FileUtils.SearchFileList(";".join(exe_list))
 
 
+def get_environment_snapshot_path(job):
+    """Path to environment snapshot shared by tasks of the job.
+
+    Snapshot key is created on submission, see
+    'quadpype.pipeline.farm.environment_snapshot'.
+
+    Returns:
+        Union[str, None]: Path to snapshot or None if snapshots are not used.
+    """
+    snapshot_key = job.GetJobEnvironmentKeyValue("QUADPYPE_ENV_SNAPSHOT_KEY")
+    snapshot_dir = (
+        job.GetJobEnvironmentKeyValue("QUADPYPE_ENV_SNAPSHOT_DIR")
+        or os.getenv("QUADPYPE_ENV_SNAPSHOT_DIR")
+    )
+    if not snapshot_key or not snapshot_dir:
+        return None
+    return os.path.join(
+        snapshot_dir,
+        "{}_{}.json".format(snapshot_key, platform.system().lower())
+    )
+
+
+def set_quadpype_environment(deadlinePlugin, job, contents):
+    """Set extracted QuadPype environments to rendering process."""
+    for key, value in contents.items():
+        deadlinePlugin.SetProcessEnvironmentVariable(key, value)
+
+    if "PATH" in contents:
+        # Set os.environ[PATH] so studio settings' path entries
+        # can be used to define search path for executables.
+        print(f">>> Setting 'PATH' Environment to: {contents['PATH']}")
+        os.environ["PATH"] = contents["PATH"]
+
+    script_url = job.GetJobPluginInfoKeyValue("ScriptFilename")
+    if script_url:
+        # Snapshot contains only environments changed by QuadPype
+        format_data = dict(os.environ)
+        format_data.update(contents)
+        script_url = script_url.format(**format_data).replace("\\", "/")
+        print(">>> Setting script path {}".format(script_url))
+        job.SetJobPluginInfoKeyValue("ScriptFilename", script_url)
+
+
 def inject_quadpype_environment(deadlinePlugin):
     """ Pull env vars from QuadPype and push them to rendering process.
 
@@ -321,6 +364,19 @@ def inject_quadpype_environment(deadlinePlugin):
 
         print("--- QuadPype executable: {}".format(exe))
 
+        snapshot_path = get_environment_snapshot_path(job)
+        if snapshot_path and os.path.exists(snapshot_path):
+            print(">>> Loading environment snapshot {}".format(snapshot_path))
+            try:
+                with open(snapshot_path) as fp:
+                    contents = json.load(fp)
+            except (OSError, ValueError):
+                print(">>> Failed to load snapshot, extracting environments")
+            else:
+                set_quadpype_environment(deadlinePlugin, job, contents)
+                print(">> Injection end.")
+                return
+
         # tempfile.TemporaryFile cannot be used because of locking
         temp_file_name = "{}_{}.json".format(
             datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S%f'),
@@ -349,6 +405,8 @@ def inject_quadpype_environment(deadlinePlugin):
         if all(add_kwargs.values()):
             for key, value in add_kwargs.items():
                 args.extend(["--{}".format(key), value])
+            if snapshot_path:
+                args.extend(["--snapshot", snapshot_path])
         else:
             raise RuntimeError((
                 "Missing required env vars: AVALON_PROJECT, AVALON_ASSET,"
@@ -382,20 +440,7 @@ def inject_quadpype_environment(deadlinePlugin):
         with open(export_url) as fp:
             contents = json.load(fp)
 
-        for key, value in contents.items():
-            deadlinePlugin.SetProcessEnvironmentVariable(key, value)
-
-        if "PATH" in contents:
-            # Set os.environ[PATH] so studio settings' path entries
-            # can be used to define search path for executables.
-            print(f">>> Setting 'PATH' Environment to: {contents['PATH']}")
-            os.environ["PATH"] = contents["PATH"]
-
-        script_url = job.GetJobPluginInfoKeyValue("ScriptFilename")
-        if script_url:
-            script_url = script_url.format(**contents).replace("\\", "/")
-            print(">>> Setting script path {}".format(script_url))
-            job.SetJobPluginInfoKeyValue("ScriptFilename", script_url)
+        set_quadpype_environment(deadlinePlugin, job, contents)
 
         print(">>> Removing temporary file")
         os.remove(export_url)
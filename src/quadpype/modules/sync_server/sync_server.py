@@ -18,7 +18,7 @@ from quadpype.lib import (
     get_user_settings,
 )
 
-from quadpype.modules.base import ModulesManager
+from quadpype.modules.base import get_modules_manager
 from quadpype.pipeline import Anatomy
 from quadpype.pipeline.load.utils import get_representation_path_with_anatomy
 from quadpype.widgets.message_notification import notify_message
@@ -231,7 +231,7 @@ def download_last_published_workfile(
         anatomy = Anatomy(project_name)
 
     # Get sync server module
-    sync_server = ModulesManager().modules_by_name.get("sync_server")
+    sync_server = get_modules_manager().modules_by_name.get("sync_server")
     if not sync_server or not sync_server.enabled:
         print("Sync server module is disabled or unavailable.")
         return
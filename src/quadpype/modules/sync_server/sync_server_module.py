@@ -9,6 +9,7 @@ from datetime import datetime, timezone
 from collections import deque, defaultdict
 
 from bson.objectid import ObjectId
+from pymongo import UpdateOne, ReturnDocument
 
 from quadpype.client import (
     get_projects,
@@ -54,6 +55,9 @@ from .utils import (
 
 log = Logger.get_logger("SyncServer")
 
+# Key of precomputed availability on representation and version documents
+SITES_AVAILABILITY_KEY = "sites_availability"
+
 
 class SyncServerModule(QuadPypeModule, ITrayAction, IPluginPaths):
     """
@@ -1298,7 +1302,13 @@ class SyncServerModule(QuadPypeModule, ITrayAction, IPluginPaths):
 
     def get_repre_info_for_versions(self, project_name, version_ids,
                                     active_site, remote_site):
-        """Returns representation documents for versions and sites combi
+        """Returns availability of versions for sites combi
+
+        Availability is read from counters stored on version documents.
+        Counters are updated when sync of representation files finishes or
+        their sites change, and are removed when representations of the
+        version are integrated. Counters of versions which don't have them
+        are calculated and stored.
 
         Args:
             project_name (str)
@@ -1306,84 +1316,50 @@ class SyncServerModule(QuadPypeModule, ITrayAction, IPluginPaths):
             active_site (string): 'local', 'studio' etc
             remote_site (string): dtto
         Returns:
-
+            list[dict]: Availability of versions with representations on
+                sites. Contains version id '_id', number of representations
+                'repre_count' and sum of availability ratios of
+                representations 'avail_repre_local', 'avail_repre_remote'.
         """
         self.connection.Session["AVALON_PROJECT"] = project_name
-        query = [
-            {"$match": {"parent": {"$in": version_ids},
-                        "type": "representation",
-                        "files.sites.name": {"$exists": 1}}},
-            {"$unwind": "$files"},
-            {'$addFields': {
-                'order_local': {
-                    '$filter': {
-                        'input': '$files.sites', 'as': 'p',
-                        'cond': {'$eq': ['$$p.name', active_site]}
-                    }
-                }
-            }},
-            {'$addFields': {
-                'order_remote': {
-                    '$filter': {
-                        'input': '$files.sites', 'as': 'p',
-                        'cond': {'$eq': ['$$p.name', remote_site]}
-                    }
-                }
-            }},
-            {'$addFields': {
-                'progress_local': {"$arrayElemAt": [{
-                    '$cond': [
-                        {'$size': "$order_local.progress"},
-                        "$order_local.progress",
-                        # if exists created_dt count is as available
-                        {'$cond': [
-                            {'$size': "$order_local.created_dt"},
-                            [1],
-                            [0]
-                        ]}
-                    ]},
-                    0
-                ]}
-            }},
-            {'$addFields': {
-                'progress_remote': {"$arrayElemAt": [{
-                    '$cond': [
-                        {'$size': "$order_remote.progress"},
-                        "$order_remote.progress",
-                        # if exists created_dt count is as available
-                        {'$cond': [
-                            {'$size': "$order_remote.created_dt"},
-                            [1],
-                            [0]
-                        ]}
-                    ]},
-                    0
-                ]}
-            }},
-            {'$group': {  # first group by repre
-                '_id': '$_id',
-                'parent': {'$first': '$parent'},
-                'avail_ratio_local': {
-                    '$first': {
-                        '$divide': [{'$sum': "$progress_local"}, {'$sum': 1}]
-                    }
-                },
-                'avail_ratio_remote': {
-                    '$first': {
-                        '$divide': [{'$sum': "$progress_remote"}, {'$sum': 1}]
-                    }
-                }
-            }},
-            {'$group': {  # second group by parent, eg version_id
-                '_id': '$parent',
-                'repre_count': {'$sum': 1},  # total representations
-                # fully available representation for site
-                'avail_repre_local': {'$sum': "$avail_ratio_local"},
-                'avail_repre_remote': {'$sum': "$avail_ratio_remote"},
-            }},
-        ]
+        collection = self.connection.database[project_name]
 
-        return self.connection.aggregate(query)
+        availability_by_version_id = {}
+        version_docs = collection.find(
+            {
+                "_id": {"$in": list(version_ids)},
+                SITES_AVAILABILITY_KEY: {"$exists": True}
+            },
+            {SITES_AVAILABILITY_KEY: True}
+        )
+        for version_doc in version_docs:
+            availability_by_version_id[version_doc["_id"]] = (
+                version_doc[SITES_AVAILABILITY_KEY]
+            )
+
+        missing_version_ids = (
+            set(version_ids) - set(availability_by_version_id.keys())
+        )
+        if missing_version_ids:
+            availability_by_version_id.update(
+                self._update_versions_availability(
+                    project_name, missing_version_ids
+                )
+            )
+
+        output = []
+        for version_id, availability in availability_by_version_id.items():
+            repre_count = availability.get("repre_count")
+            if not repre_count:
+                continue
+            sites = availability.get("sites") or {}
+            output.append({
+                "_id": version_id,
+                "repre_count": repre_count,
+                "avail_repre_local": sites.get(active_site, 0),
+                "avail_repre_remote": sites.get(remote_site, 0),
+            })
+        return output
 
     """ End of Public API """
 
@@ -1923,16 +1899,21 @@ class SyncServerModule(QuadPypeModule, ITrayAction, IPluginPaths):
         if file_id:
             arr_filter.append({'f._id': ObjectId(file_id)})
 
-        self.connection.database[project_name].update_one(
-            query,
-            update,
-            upsert=True,
-            array_filters=arr_filter
-        )
-
         if progress is not None or priority is not None:
+            # Availability is updated when transfer succeeds or fails, not on
+            #   each progress change
+            self.connection.database[project_name].update_one(
+                query,
+                update,
+                upsert=True,
+                array_filters=arr_filter
+            )
             return
 
+        self._update_representation_sites(
+            project_name, query, update, arr_filter
+        )
+
         status = 'failed'
         error_str = 'with error {}'.format(error)
         if new_file_id:
@@ -2075,12 +2056,142 @@ class SyncServerModule(QuadPypeModule, ITrayAction, IPluginPaths):
             "_id": ObjectId(representation_id)
         }
 
-        self.connection.database[project_name].update_one(
+        self._update_representation_sites(
+            project_name, query, update, arr_filter
+        )
+
+    def _update_representation_sites(
+        self, project_name, query, update, arr_filter
+    ):
+        """Update sites of representation files and their availability.
+
+        Args:
+            project_name (str): Project name.
+            query (dict): Query of representation document.
+            update (dict): Update of representation document.
+            arr_filter (list[dict]): Array filters of update.
+        """
+        collection = self.connection.database[project_name]
+        repre_doc = collection.find_one_and_update(
             query,
             update,
+            projection={"parent": True, "files.sites": True},
             upsert=True,
-            array_filters=arr_filter
+            array_filters=arr_filter,
+            return_document=ReturnDocument.AFTER
+        )
+        if not repre_doc or "parent" not in repre_doc:
+            return
+
+        collection.update_one(
+            {"_id": repre_doc["_id"]},
+            {"$set": {
+                SITES_AVAILABILITY_KEY: self._get_sites_availability(
+                    repre_doc
+                )
+            }}
+        )
+        self._update_versions_availability(
+            project_name, [repre_doc["parent"]]
+        )
+
+    @staticmethod
+    def _get_sites_availability(repre_doc):
+        """Availability of representation files on sites.
+
+        Site record with progress counts as partially available, record with
+        'created_dt' as available.
+
+        Args:
+            repre_doc (dict): Representation document with 'files.sites'.
+
+        Returns:
+            dict[str, float]: Ratio of available files by site name.
+        """
+        files = repre_doc.get("files") or []
+        if not files:
+            return {}
+
+        progress_by_site = defaultdict(float)
+        for repre_file in files:
+            processed_sites = set()
+            for site in repre_file.get("sites") or []:
+                site_name = site.get("name")
+                if not site_name or site_name in processed_sites:
+                    continue
+                processed_sites.add(site_name)
+
+                if "progress" in site:
+                    progress = site["progress"]
+                    if not isinstance(progress, (int, float)):
+                        progress = 0
+                elif site.get("created_dt"):
+                    progress = 1
+                else:
+                    progress = 0
+                progress_by_site[site_name] += progress
+
+        return {
+            site_name: progress / len(files)
+            for site_name, progress in progress_by_site.items()
+        }
+
+    def _update_versions_availability(self, project_name, version_ids):
+        """Calculate and store availability of versions on sites.
+
+        Availability of representations which don't have it stored yet is
+        calculated and stored too.
+
+        Args:
+            project_name (str): Project name.
+            version_ids (Iterable[ObjectId]): Version ids.
+
+        Returns:
+            dict[ObjectId, dict]: Availability by version id. Contains
+                number of representations 'repre_count' and sum of
+                representation availability ratios by site name 'sites'.
+        """
+        collection = self.connection.database[project_name]
+        availability_by_version_id = {
+            version_id: {"repre_count": 0, "sites": defaultdict(float)}
+            for version_id in version_ids
+        }
+        repre_docs = collection.find(
+            {
+                "type": "representation",
+                "parent": {"$in": list(availability_by_version_id.keys())},
+                "files.sites.name": {"$exists": True}
+            },
+            {"parent": True, "files.sites": True, SITES_AVAILABILITY_KEY: True}
         )
+        repre_operations = []
+        for repre_doc in repre_docs:
+            repre_availability = repre_doc.get(SITES_AVAILABILITY_KEY)
+            if repre_availability is None:
+                repre_availability = self._get_sites_availability(repre_doc)
+                repre_operations.append(UpdateOne(
+                    {"_id": repre_doc["_id"]},
+                    {"$set": {SITES_AVAILABILITY_KEY: repre_availability}}
+                ))
+
+            availability = availability_by_version_id[repre_doc["parent"]]
+            availability["repre_count"] += 1
+            for site_name, ratio in repre_availability.items():
+                availability["sites"][site_name] += ratio
+
+        version_operations = []
+        for version_id, availability in availability_by_version_id.items():
+            availability["sites"] = dict(availability["sites"])
+            version_operations.append(UpdateOne(
+                {"_id": version_id},
+                {"$set": {SITES_AVAILABILITY_KEY: availability}}
+            ))
+
+        if repre_operations:
+            collection.bulk_write(repre_operations)
+        if version_operations:
+            collection.bulk_write(version_operations)
+        return availability_by_version_id
 
     def _reset_site_for_file(self, project_name, representation_id,
                              elem, file_id, site_name):
@@ -1,139 +1,168 @@
-from .constants import (
-    AVALON_CONTAINER_ID,
-    HOST_WORKFILE_EXTENSIONS,
-)
-
-from .mongodb import (
-    AvalonMongoDB
-)
-from .anatomy import Anatomy
-
-from .create import (
-    BaseCreator,
-    Creator,
-    AutoCreator,
-    HiddenCreator,
-    CreatedInstance,
-    CreatorError,
-
-    LegacyCreator,
-    legacy_create,
-
-    discover_creator_plugins,
-    discover_legacy_creator_plugins,
-    register_creator_plugin,
-    deregister_creator_plugin,
-    register_creator_plugin_path,
-    deregister_creator_plugin_path
-)
-
-from .load import (
-    HeroVersionType,
-    IncompatibleLoaderError,
-    LoaderPlugin,
-    SubsetLoaderPlugin,
-
-    discover_loader_plugins,
-    register_loader_plugin,
-    deregister_loader_plugin_path,
-    register_loader_plugin_path,
-    deregister_loader_plugin,
-
-    load_container,
-    remove_container,
-    update_container,
-    switch_container,
-
-    loaders_from_representation,
-    get_representation_path,
-    get_representation_context,
-    get_repres_contexts
-)
-
-from .publish import (
-    PublishValidationError,
-    PublishXmlValidationError,
-    KnownPublishError,
-    QuadPypePyblishPluginMixin,
-    OptionalPyblishPluginMixin
-)
-
-from .actions import (
-    LauncherAction,
-    LauncherTaskAction,
-
-    ApplicationAction,
-
-    InventoryAction,
-
-    discover_launcher_actions,
-    register_launcher_action,
-    register_launcher_action_path,
-
-    discover_inventory_actions,
-    register_inventory_action,
-    register_inventory_action_path,
-    deregister_inventory_action,
-    deregister_inventory_action_path
-)
-
-from .context_tools import (
-    install_quadpype_plugins,
-    install_host,
-    uninstall_host,
-    is_installed,
-
-    register_root,
-    registered_root,
-
-    register_host,
-    registered_host,
-    deregister_host,
-    get_process_id,
-
-    get_global_context,
-    get_current_context,
-    get_current_host_name,
-    get_current_project_name,
-    get_current_asset_name,
-    get_current_task_name
-)
-
-from .action import (
-    BuilderAction,
-
-    discover_builder_plugins,
-    register_builder_action,
-    register_builder_action_path,
-    deregister_builder_action,
-    deregister_builder_action_path,
-
-    get_actions_by_name,
-    action_with_repre_context
-)
-
-from .templates import (
-    get_load_naming_template,
-    get_loaded_naming_finder_template,
-    get_task_hierarchy_templates,
-    get_workfile_build_template,
-    get_resolved_name,
-    format_data,
-    get_parent_data,
-    split_hierarchy,
-    is_current_asset_shot,
-    extract_sequence_and_shot,
-    get_family_hierarchy_templates,
-    get_create_build_template
-)
-
-from .settings import (
-    get_available_resolutions,
-    extract_width_and_height
-)
-
-install = install_host
-uninstall = uninstall_host
+import importlib
+
+# Exports are imported on first access, so hosts and tools don't import
+#   creators, loaders, actions and templates unless they use them.
+_LAZY_EXPORTS = {
+    ".constants": (
+        "AVALON_CONTAINER_ID",
+        "HOST_WORKFILE_EXTENSIONS",
+    ),
+    ".mongodb": (
+        "AvalonMongoDB",
+    ),
+    ".anatomy": (
+        "Anatomy",
+    ),
+    ".create": (
+        "BaseCreator",
+        "Creator",
+        "AutoCreator",
+        "HiddenCreator",
+        "CreatedInstance",
+        "CreatorError",
+
+        "LegacyCreator",
+        "legacy_create",
+
+        "discover_creator_plugins",
+        "discover_legacy_creator_plugins",
+        "register_creator_plugin",
+        "deregister_creator_plugin",
+        "register_creator_plugin_path",
+        "deregister_creator_plugin_path",
+    ),
+    ".load": (
+        "HeroVersionType",
+        "IncompatibleLoaderError",
+        "LoaderPlugin",
+        "SubsetLoaderPlugin",
+
+        "discover_loader_plugins",
+        "register_loader_plugin",
+        "deregister_loader_plugin_path",
+        "register_loader_plugin_path",
+        "deregister_loader_plugin",
+
+        "load_container",
+        "remove_container",
+        "update_container",
+        "switch_container",
+
+        "loaders_from_representation",
+        "get_representation_path",
+        "get_representation_context",
+        "get_repres_contexts",
+    ),
+    ".publish": (
+        "PublishValidationError",
+        "PublishXmlValidationError",
+        "KnownPublishError",
+        "QuadPypePyblishPluginMixin",
+        "OptionalPyblishPluginMixin",
+    ),
+    ".actions": (
+        "LauncherAction",
+        "LauncherTaskAction",
+
+        "ApplicationAction",
+
+        "InventoryAction",
+
+        "discover_launcher_actions",
+        "register_launcher_action",
+        "register_launcher_action_path",
+
+        "discover_inventory_actions",
+        "register_inventory_action",
+        "register_inventory_action_path",
+        "deregister_inventory_action",
+        "deregister_inventory_action_path",
+    ),
+    ".context_tools": (
+        "install_quadpype_plugins",
+        "install_host",
+        "uninstall_host",
+        "is_installed",
+
+        "register_root",
+        "registered_root",
+
+        "register_host",
+        "registered_host",
+        "deregister_host",
+        "get_process_id",
+
+        "get_global_context",
+        "get_current_context",
+        "get_current_host_name",
+        "get_current_project_name",
+        "get_current_asset_name",
+        "get_current_task_name",
+    ),
+    ".action": (
+        "BuilderAction",
+
+        "discover_builder_plugins",
+        "register_builder_action",
+        "register_builder_action_path",
+        "deregister_builder_action",
+        "deregister_builder_action_path",
+
+        "get_actions_by_name",
+        "action_with_repre_context",
+    ),
+    ".templates": (
+        "get_load_naming_template",
+        "get_loaded_naming_finder_template",
+        "get_task_hierarchy_templates",
+        "get_workfile_build_template",
+        "get_resolved_name",
+        "format_data",
+        "get_parent_data",
+        "split_hierarchy",
+        "is_current_asset_shot",
+        "extract_sequence_and_shot",
+        "get_family_hierarchy_templates",
+        "get_create_build_template",
+    ),
+    ".settings": (
+        "get_available_resolutions",
+        "extract_width_and_height",
+    ),
+}
+_LAZY_EXPORTS_MODULES = {
+    name: module_name
+    for module_name, names in _LAZY_EXPORTS.items()
+    for name in names
+}
+_LAZY_ALIASES = {
+    "install": "install_host",
+    "uninstall": "uninstall_host",
+}
+
+
+def __getattr__(name):
+    attr_name = _LAZY_ALIASES.get(name, name)
+    module_name = _LAZY_EXPORTS_MODULES.get(attr_name)
+    if module_name is None:
+        try:
+            return importlib.import_module(".{}".format(name), __name__)
+        except ModuleNotFoundError as exc:
+            if exc.name != "{}.{}".format(__name__, name):
+                raise
+        raise AttributeError(
+            "module '{}' has no attribute '{}'".format(__name__, name)
+        )
+
+    value = getattr(importlib.import_module(module_name, __name__), attr_name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(
+        set(globals()) | set(_LAZY_EXPORTS_MODULES) | set(_LAZY_ALIASES)
+    )
 
 
 __all__ = (
@@ -141,7 +170,7 @@ __all__ = (
     "HOST_WORKFILE_EXTENSIONS",
 
     # --- MongoDB ---
-    "AvalonMongoDB"
+    "AvalonMongoDB",
 
     # --- Anatomy ---
     "Anatomy",
@@ -20,7 +20,7 @@ from quadpype.lib.path_templates import (
     TemplatesDict,
     FormatObject,
 )
-from quadpype.modules import ModulesManager
+from quadpype.modules import get_modules_manager
 
 log = Logger.get_logger(__name__)
 
@@ -449,7 +449,7 @@ class Anatomy(BaseAnatomy):
     @classmethod
     def get_sync_server_addon(cls):
         if cls._sync_server_addon_cache.is_outdated:
-            manager = ModulesManager()
+            manager = get_modules_manager()
             cls._sync_server_addon_cache.update_data(
                 manager.get_enabled_module("sync_server")
             )
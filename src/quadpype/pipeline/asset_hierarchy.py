@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+"""Process wide cache of project asset hierarchies.
+
+Publisher, Loader, Workfiles and context dialogs show the same asset tree.
+Asset documents of a project are queried once per process and kept as
+compact nodes which are shared by all tools. Hierarchy is refreshed when
+project update timestamp is newer than the query.
+
+Nodes and hierarchies are shared, they must not be modified.
+"""
+import time
+import threading
+import collections
+
+from quadpype.client import get_assets, get_project_last_update
+
+
+class AssetNode(object):
+    """Asset in hierarchy.
+
+    Args:
+        asset_id (ObjectId): Asset id.
+        name (str): Asset name.
+        parent_id (Union[ObjectId, None]): Id of visual parent.
+        label (Union[str, None]): Label of asset.
+        icon (Union[str, None]): Name of asset icon.
+        color (Union[str, None]): Color of asset icon.
+        task_names (Tuple[str]): Names of asset tasks.
+    """
+    __slots__ = (
+        "id",
+        "name",
+        "parent_id",
+        "children_ids",
+        "label",
+        "icon",
+        "color",
+        "task_names",
+    )
+
+    def __init__(
+        self, asset_id, name, parent_id, label, icon, color, task_names
+    ):
+        self.id = asset_id
+        self.name = name
+        self.parent_id = parent_id
+        self.children_ids = ()
+        self.label = label
+        self.icon = icon
+        self.color = color
+        self.task_names = task_names
+
+    def __repr__(self):
+        return "<{} {}>".format(self.__class__.__name__, self.name)
+
+    @property
+    def has_children(self):
+        return bool(self.children_ids)
+
+    @classmethod
+    def from_doc(cls, asset_doc):
+        asset_data = asset_doc.get("data") or {}
+        return cls(
+            asset_doc["_id"],
+            asset_doc["name"],
+            asset_data.get("visualParent"),
+            asset_data.get("label"),
+            asset_data.get("icon"),
+            asset_data.get("color"),
+            tuple(asset_data.get("tasks") or ()),
+        )
+
+
+class AssetHierarchy(object):
+    """Asset nodes of a project.
+
+    Args:
+        project_name (str): Project name.
+        nodes (Iterable[AssetNode]): Asset nodes.
+    """
+
+    def __init__(self, project_name, nodes):
+        nodes_by_id = {}
+        nodes_by_name = {}
+        children_ids_by_parent_id = collections.defaultdict(list)
+        for node in nodes:
+            nodes_by_id[node.id] = node
+            nodes_by_name[node.name] = node
+            children_ids_by_parent_id[node.parent_id].append(node.id)
+
+        for parent_id, children_ids in children_ids_by_parent_id.items():
+            parent_node = nodes_by_id.get(parent_id)
+            if parent_node is not None:
+                parent_node.children_ids = tuple(children_ids)
+
+        self._project_name = project_name
+        self._nodes_by_id = nodes_by_id
+        self._nodes_by_name = nodes_by_name
+        self._root_ids = tuple(children_ids_by_parent_id.get(None) or ())
+
+    @classmethod
+    def from_docs(cls, project_name, asset_docs):
+        return cls(
+            project_name,
+            (AssetNode.from_doc(asset_doc) for asset_doc in asset_docs)
+        )
+
+    @property
+    def project_name(self):
+        return self._project_name
+
+    @property
+    def root_ids(self):
+        """Ids of top level assets."""
+        return self._root_ids
+
+    def __len__(self):
+        return len(self._nodes_by_id)
+
+    def __iter__(self):
+        return iter(self._nodes_by_id.values())
+
+    def get_node(self, asset_id):
+        return self._nodes_by_id.get(asset_id)
+
+    def get_node_by_name(self, asset_name):
+        return self._nodes_by_name.get(asset_name)
+
+    def get_children(self, asset_id=None):
+        """Children nodes of asset.
+
+        Args:
+            asset_id (Optional[ObjectId]): Asset id. Top level nodes are
+                returned if not passed.
+
+        Returns:
+            List[AssetNode]: Children nodes.
+        """
+        if asset_id is None:
+            children_ids = self._root_ids
+        else:
+            node = self._nodes_by_id.get(asset_id)
+            if node is None:
+                return []
+            children_ids = node.children_ids
+        return [self._nodes_by_id[child_id] for child_id in children_ids]
+
+
+class _ProjectHierarchyItem(object):
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.hierarchy = None
+        self.query_time = None
+        self.check_time = None
+
+
+class AssetHierarchyCache(object):
+    """Cache of asset hierarchies by project name.
+
+    Project update timestamp is checked at most once per 'check_interval'
+    seconds.
+    """
+    check_interval = 10
+    projection = {
+        "_id": True,
+        "name": True,
+        "data.visualParent": True,
+        "data.label": True,
+        "data.icon": True,
+        "data.color": True,
+        "data.tasks": True,
+    }
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._items_by_project_name = {}
+
+    def _get_item(self, project_name):
+        with self._lock:
+            item = self._items_by_project_name.get(project_name)
+            if item is None:
+                item = _ProjectHierarchyItem()
+                self._items_by_project_name[project_name] = item
+        return item
+
+    def _is_outdated(self, item):
+        if item.hierarchy is None:
+            return True
+
+        now = time.time()
+        if now - item.check_time < self.check_interval:
+            return False
+
+        item.check_time = now
+        last_update = get_project_last_update(name=item.hierarchy.project_name)
+        return bool(last_update) and last_update > item.query_time
+
+    def get_hierarchy(self, project_name, force=False):
+        """Asset hierarchy of project.
+
+        Args:
+            project_name (str): Project name.
+            force (Optional[bool]): Query assets even if cache is valid.
+
+        Returns:
+            AssetHierarchy: Asset hierarchy of project.
+        """
+        item = self._get_item(project_name)
+        with item.lock:
+            if force or self._is_outdated(item):
+                query_time = time.time()
+                item.hierarchy = AssetHierarchy.from_docs(
+                    project_name,
+                    get_assets(project_name, fields=self.projection.keys())
+                )
+                item.query_time = query_time
+                item.check_time = query_time
+            return item.hierarchy
+
+    def invalidate(self, project_name=None):
+        """Invalidate cached hierarchy.
+
+        Args:
+            project_name (Optional[str]): Project name. All projects are
+                invalidated if not passed.
+        """
+        with self._lock:
+            if project_name is None:
+                self._items_by_project_name = {}
+            else:
+                self._items_by_project_name.pop(project_name, None)
+
+
+_asset_hierarchy_cache = AssetHierarchyCache()
+
+
+def get_asset_hierarchy(project_name, force=False):
+    """Shared asset hierarchy of project.
+
+    Args:
+        project_name (str): Project name.
+        force (Optional[bool]): Query assets even if cache is valid.
+
+    Returns:
+        AssetHierarchy: Asset hierarchy of project.
+    """
+    return _asset_hierarchy_cache.get_hierarchy(project_name, force)
+
+
+def invalidate_asset_hierarchy(project_name=None):
+    """Invalidate shared asset hierarchy.
+
+    Args:
+        project_name (Optional[str]): Project name. All projects are
+            invalidated if not passed.
+    """
+    _asset_hierarchy_cache.invalidate(project_name)
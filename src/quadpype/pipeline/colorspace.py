@@ -1,11 +1,15 @@
 import re
 import os
 import json
+import queue
 import contextlib
 import functools
+import atexit
 import platform
 import tempfile
 import warnings
+import threading
+import subprocess
 from copy import deepcopy
 
 from quadpype import PACKAGE_DIR
@@ -13,6 +17,9 @@ from quadpype.settings import get_project_settings, PROJECT_SETTINGS_KEY
 from quadpype.lib import (
     StringTemplate,
     run_quadpype_process,
+    get_quadpype_execute_args,
+    clean_envs_for_quadpype_process,
+    is_running_locally,
     Logger
 )
 from quadpype.pipeline import Anatomy
@@ -252,22 +259,64 @@ def get_imageio_file_rules_colorspace_from_filepath(
         # in case global or host color management is not enabled
         return None
 
-    # match file rule from path
-    colorspace_name = None
-    for file_rule in file_rules.values():
-        pattern = file_rule["pattern"]
-        extension = file_rule["ext"].lower()
-        ext_match = re.match(
-            r".*(?=.{})".format(extension), filepath
+    return _match_compiled_file_rules(
+        _compile_file_rules(file_rules), filepath
+    )
+
+
+def _compile_file_rules(file_rules):
+    """Compile regexes of ImageIO file rules.
+
+    Compiled rules are cached by their definition, so the same rules are
+    compiled only once.
+
+    Args:
+        file_rules (dict[str, dict]): file rule data from settings.
+
+    Returns:
+        tuple[tuple[re.Pattern, re.Pattern, str]]: Extension regex, pattern
+            regex and colorspace name of each rule.
+    """
+    return _compile_file_rules_definitions(tuple(
+        (
+            file_rule["ext"].lower(),
+            file_rule["pattern"],
+            file_rule["colorspace"]
         )
-        file_match = re.search(
-            pattern, filepath
+        for file_rule in (file_rules or {}).values()
+    ))
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_file_rules_definitions(rule_definitions):
+    return tuple(
+        (
+            re.compile(r".*(?=.{})".format(extension)),
+            re.compile(pattern),
+            colorspace_name
         )
+        for extension, pattern, colorspace_name in rule_definitions
+    )
 
-        if ext_match and file_match:
-            colorspace_name = file_rule["colorspace"]
 
-    return colorspace_name
+def _match_compiled_file_rules(compiled_file_rules, filepath):
+    """Get colorspace of last file rule matching the filepath.
+
+    Args:
+        compiled_file_rules (tuple[tuple[re.Pattern, re.Pattern, str]]):
+            Output of '_compile_file_rules'.
+        filepath (str): path string, file rule pattern is tested on it
+
+    Returns:
+        Union[str, None]: name of colorspace
+    """
+    # last matching rule wins
+    for ext_regex, pattern_regex, colorspace_name in reversed(
+        compiled_file_rules
+    ):
+        if ext_regex.match(filepath) and pattern_regex.search(filepath):
+            return colorspace_name
+    return None
 
 
 def get_config_file_rules_colorspace_from_filepath(config_path, filepath):
@@ -293,6 +342,7 @@ def get_config_file_rules_colorspace_from_filepath(config_path, filepath):
         )
         if result_data:
             return result_data[0]
+        return None
 
     # TODO: refactor this so it is not imported but part of this file
     from quadpype.scripts.ocio_wrapper import _get_config_file_rules_colorspace_from_filepath  # noqa: E501
@@ -420,10 +470,163 @@ def get_data_subprocess(config_path, data_type):
     )
 
 
+class _OCIOHelperCommandError(RuntimeError):
+    """Helper process answered the query with an error."""
+    pass
+
+
+class _OCIOHelperProcess:
+    """Long-lived QuadPype process answering OCIO queries over a pipe.
+
+    Process is started on first query and kept running until the current
+    process exits. It runs 'server' command of `ocio_wrapper.py` which
+    keeps parsed configs cached by path and modification time.
+
+    Requests and responses are json lines, stdout lines not starting
+    with response prefix (e.g. QuadPype boot logs) are skipped. Responses
+    are read by a thread so a query can time out, the process is killed
+    and started again on next query when it does not respond in time.
+    """
+
+    response_prefix = "__OCIO_RESPONSE__"
+    # Seconds to wait for response of a query
+    response_timeout = 60
+
+    _process = None
+    _responses = None
+    _lock = threading.Lock()
+    _atexit_registered = False
+
+    @classmethod
+    def _start(cls):
+        args = get_quadpype_execute_args(
+            "run", get_ocio_config_script_path(), "server"
+        )
+        env = clean_envs_for_quadpype_process(os.environ)
+        # Only keep QuadPype version if we are running from build.
+        if is_running_locally():
+            env.pop("QUADPYPE_VERSION", None)
+
+        kwargs = {}
+        if platform.system().lower() == "windows":
+            kwargs["creationflags"] = getattr(
+                subprocess, "CREATE_NO_WINDOW", 0
+            )
+
+        log.debug("Starting OCIO helper process: {}".format(" ".join(args)))
+        process = subprocess.Popen(
+            args,
+            env={str(k): str(v) for k, v in env.items()},
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True,
+            encoding="utf-8",
+            bufsize=1,
+            **kwargs
+        )
+        responses = queue.Queue()
+        thread = threading.Thread(
+            target=cls._read_responses,
+            args=(process.stdout, responses),
+            name="OCIOHelperReader",
+            daemon=True
+        )
+        thread.start()
+
+        cls._process = process
+        cls._responses = responses
+        if not cls._atexit_registered:
+            atexit.register(cls.stop)
+            cls._atexit_registered = True
+
+    @classmethod
+    def _read_responses(cls, stdout, responses):
+        try:
+            for line in stdout:
+                if line.startswith(cls.response_prefix):
+                    responses.put(line[len(cls.response_prefix):])
+        except (OSError, ValueError):
+            pass
+        # Let waiting query know that process ended
+        responses.put(None)
+
+    @classmethod
+    def stop(cls, kill=False):
+        process = cls._process
+        cls._process = None
+        cls._responses = None
+        if process is None or process.poll() is not None:
+            return
+        if kill:
+            process.kill()
+            return
+        try:
+            process.stdin.close()
+            process.wait(timeout=5)
+        except Exception:
+            process.kill()
+
+    @classmethod
+    def query(cls, command_group, command, **kwargs):
+        """Send query to helper process and wait for response.
+
+        Args:
+            command_group (str): command group name
+            command (str): command name
+            **kwargs: command arguments
+
+        Returns:
+            Any: Result of the command.
+
+        Raises:
+            RuntimeError: Helper process failed or did not respond in time.
+            _OCIOHelperCommandError: Command raised an error.
+        """
+        request = json.dumps({
+            "command_group": command_group,
+            "command": command,
+            "kwargs": kwargs
+        })
+        with cls._lock:
+            if cls._process is None or cls._process.poll() is not None:
+                cls._start()
+
+            try:
+                cls._process.stdin.write(request + "\n")
+                cls._process.stdin.flush()
+                response = cls._responses.get(timeout=cls.response_timeout)
+            except OSError:
+                cls.stop(kill=True)
+                raise
+            except queue.Empty:
+                cls.stop(kill=True)
+                raise RuntimeError(
+                    "OCIO helper process did not respond in {}s.".format(
+                        cls.response_timeout
+                    )
+                )
+
+            if response is None:
+                cls.stop(kill=True)
+                raise RuntimeError("OCIO helper process exited unexpectedly.")
+
+        response = json.loads(response)
+        if "error" in response:
+            raise _OCIOHelperCommandError(
+                "OCIO helper failed to process \"{} {}\": {}".format(
+                    command_group, command, response["error"]
+                )
+            )
+        return response["result"]
+
+
 def _get_wrapped_with_subprocess(command_group, command, **kwargs):
     """Get data via subprocess
 
-    Wrapper for Python 2 hosts.
+    Wrapper for Python 2 hosts. Query is sent to long-lived OCIO helper
+    process, one-shot QuadPype process is used as fallback if the helper
+    is not available.
 
     Args:
         command_group (str): command group name
@@ -433,6 +636,17 @@ def _get_wrapped_with_subprocess(command_group, command, **kwargs):
     Returns:
         Any[dict, None]: data
     """
+    try:
+        return _OCIOHelperProcess.query(command_group, command, **kwargs)
+    except _OCIOHelperCommandError:
+        # One-shot process would fail the same way
+        raise
+    except (OSError, RuntimeError, ValueError):
+        log.warning(
+            "OCIO helper process failed, using one-shot process.",
+            exc_info=True
+        )
+
     with _make_temp_json_file() as tmp_json_path:
         # Prepare subprocess arguments
         args = [
@@ -1028,6 +1242,142 @@ def _get_imageio_settings(project_settings, host_name):
     return imageio_global, imageio_host
 
 
+class ImageIOResolver:
+    """Resolve ImageIO config and file rules of a project.
+
+    Settings are read once, config path is resolved once per host and task
+    and file rules are read once per host. Colorspaces of many file paths
+    can be matched by file rules in one call. Useful when many
+    representations are processed in the same context, e.g. during
+    publishing.
+
+    Args:
+        project_name (str): project name
+        project_settings (Optional[dict]): Project settings.
+        anatomy (Optional[Anatomy]): Anatomy object.
+        env (Optional[dict]): Environment variables used to format
+            config path templates.
+    """
+
+    def __init__(
+        self, project_name, project_settings=None, anatomy=None, env=None
+    ):
+        self._project_name = project_name
+        self._project_settings = project_settings
+        self._anatomy = anatomy
+        self._env = env
+
+        self._config_data_by_context = {}
+        self._file_rules_by_host = {}
+
+    @property
+    def project_name(self):
+        return self._project_name
+
+    @property
+    def project_settings(self):
+        if self._project_settings is None:
+            self._project_settings = get_project_settings(self._project_name)
+        return self._project_settings
+
+    @property
+    def anatomy(self):
+        if self._anatomy is None:
+            self._anatomy = Anatomy(self._project_name)
+        return self._anatomy
+
+    def get_config_data(self, host_name, anatomy_data=None):
+        """Config data resolved for host and task of anatomy data.
+
+        Args:
+            host_name (str): host name
+            anatomy_data (Optional[dict]): anatomy formatting data.
+
+        Returns:
+            dict: config path data or empty dict
+        """
+        task_name = None
+        if anatomy_data:
+            task_name = anatomy_data.get("task")
+            if isinstance(task_name, dict):
+                task_name = task_name.get("name")
+
+        key = (host_name, task_name)
+        if key not in self._config_data_by_context:
+            self._config_data_by_context[key] = get_imageio_config(
+                self._project_name, host_name,
+                project_settings=self.project_settings,
+                anatomy_data=anatomy_data,
+                anatomy=self.anatomy,
+                env=self._env
+            )
+        return self._config_data_by_context[key]
+
+    def get_file_rules(self, host_name):
+        """ImageIO file rules of host.
+
+        Args:
+            host_name (str): host name
+
+        Returns:
+            dict: file rules data
+        """
+        if host_name not in self._file_rules_by_host:
+            self._file_rules_by_host[host_name] = get_imageio_file_rules(
+                self._project_name, host_name,
+                project_settings=self.project_settings
+            )
+        return self._file_rules_by_host[host_name]
+
+    def get_colorspaces_from_filepaths(
+        self, filepaths, host_name, file_rules=None
+    ):
+        """Colorspace names of ImageIO file rules matching multiple filepaths.
+
+        File rules are compiled once and each filepath is matched only once.
+
+        Args:
+            filepaths (Iterable[str]): path strings
+            host_name (str): host name
+            file_rules (Optional[dict[str, dict]]): file rules used instead
+                of file rules of the host.
+
+        Returns:
+            dict[str, Union[str, None]]: Colorspace name by filepath.
+        """
+        if file_rules is None:
+            file_rules = self.get_file_rules(host_name)
+        compiled_file_rules = _compile_file_rules(file_rules)
+
+        output = {}
+        for filepath in filepaths:
+            if filepath not in output:
+                output[filepath] = _match_compiled_file_rules(
+                    compiled_file_rules, filepath
+                )
+        return output
+
+
+def get_imageio_resolver_from_publish_context(context_data):
+    """Returns ImageIO resolver shared by the publish context.
+
+    Args:
+        context_data (publish.Context.data): publishing context data
+
+    Returns:
+        ImageIOResolver: Resolver of the publish context.
+    """
+    resolver = context_data.get("imageioResolver")
+    if resolver is None:
+        resolver = ImageIOResolver(
+            context_data["projectName"],
+            project_settings=context_data[PROJECT_SETTINGS_KEY],
+            anatomy=context_data.get("anatomy")
+        )
+        context_data["imageioResolver"] = resolver
+    return resolver
+
+
 def get_colorspace_settings_from_publish_context(context_data):
     """Returns solved settings for the host context.
 
@@ -1040,24 +1390,16 @@ def get_colorspace_settings_from_publish_context(context_data):
     if "imageioSettings" in context_data and context_data["imageioSettings"]:
         return context_data["imageioSettings"]
 
-    project_name = context_data["projectName"]
     host_name = context_data["hostName"]
     anatomy_data = context_data["anatomyData"]
-    project_settings_ = context_data[PROJECT_SETTINGS_KEY]
+    resolver = get_imageio_resolver_from_publish_context(context_data)
 
-    config_data = get_imageio_config(
-        project_name, host_name,
-        project_settings=project_settings_,
-        anatomy_data=anatomy_data
-    )
+    config_data = resolver.get_config_data(host_name, anatomy_data)
 
     # caching invalid state, so it's not recalculated all the time
     file_rules = None
     if config_data:
-        file_rules = get_imageio_file_rules(
-            project_name, host_name,
-            project_settings=project_settings_
-        )
+        file_rules = resolver.get_file_rules(host_name)
 
     # caching settings for future instance processing
     context_data["imageioSettings"] = (config_data, file_rules)
@@ -1093,15 +1435,44 @@ def set_colorspace_data_to_representation(
         ```
 
     """
+    set_colorspace_data_to_representations(
+        [representation], context_data, colorspace, log
+    )
+
+
+def set_colorspace_data_to_representations(
+    representations, context_data,
+    colorspace=None,
+    log=None
+):
+    """Sets colorspace data to multiple representations.
+
+    Colorspaces of all representations are matched by file rules in one
+    call. Data are the same as in 'set_colorspace_data_to_representation'.
+
+    Args:
+        representations (Iterable[dict]): publishing representations
+        context_data (publish.Context.data): publishing context data
+        colorspace (str, optional): colorspace name used for all
+            representations. Defaults to None.
+        log (logging.Logger, optional): logger instance. Defaults to None.
+    """
     log = log or Logger.get_logger(__name__)
 
-    file_ext = representation["ext"]
+    filtered_representations = []
+    for representation in representations:
+        file_ext = representation["ext"]
 
-    # check if `file_ext` in lower case is in CachedData.allowed_exts
-    if file_ext.lstrip(".").lower() not in CachedData.allowed_exts:
-        log.debug(
-            "Extension '{}' is not in allowed extensions.".format(file_ext)
-        )
+        # check if `file_ext` in lower case is in CachedData.allowed_exts
+        if file_ext.lstrip(".").lower() not in CachedData.allowed_exts:
+            log.debug(
+                "Extension '{}' is not in allowed extensions.".format(
+                    file_ext)
+            )
+            continue
+        filtered_representations.append(representation)
+
+    if not filtered_representations:
         return
 
     # get colorspace settings
@@ -1115,32 +1486,33 @@ def set_colorspace_data_to_representation(
 
     log.debug("Config data is: `{}`".format(config_data))
 
-    project_name = context_data["projectName"]
-    host_name = context_data["hostName"]
-    project_settings = context_data[PROJECT_SETTINGS_KEY]
-
-    # get one filename
-    filename = representation["files"]
-    if isinstance(filename, list):
-        filename = filename[0]
-
-    # get matching colorspace from rules
-    colorspace = colorspace or get_imageio_colorspace_from_filepath(
-        filename, host_name, project_name,
-        config_data=config_data,
-        file_rules=file_rules,
-        project_settings=project_settings
-    )
+    # get one filename of each representation
+    filenames = []
+    for representation in filtered_representations:
+        filename = representation["files"]
+        if isinstance(filename, list):
+            filename = filename[0]
+        filenames.append(filename)
+
+    # get matching colorspaces from rules
+    colorspaces_by_filename = {}
+    if not colorspace:
+        resolver = get_imageio_resolver_from_publish_context(context_data)
+        colorspaces_by_filename = resolver.get_colorspaces_from_filepaths(
+            filenames, context_data["hostName"], file_rules
+        )
 
-    # infuse data to representation
-    if colorspace:
-        colorspace_data = {
-            "colorspace": colorspace,
-            "config": config_data
-        }
+    for representation, filename in zip(filtered_representations, filenames):
+        repre_colorspace = colorspace or colorspaces_by_filename.get(filename)
+        # infuse data to representation
+        if repre_colorspace:
+            colorspace_data = {
+                "colorspace": repre_colorspace,
+                "config": config_data
+            }
 
-        # update data key
-        representation["colorspaceData"] = colorspace_data
+            # update data key
+            representation["colorspaceData"] = colorspace_data
 
 
 def get_display_view_colorspace_name(config_path, display, view):
@@ -1181,6 +1553,17 @@ def get_display_view_colorspace_subprocess(config_path, display, view):
 
     """
 
+    try:
+        return _OCIOHelperProcess.query(
+            "config", "get_display_view_colorspace_name",
+            in_path=config_path, display=display, view=view
+        )
+    except (OSError, RuntimeError, ValueError):
+        log.warning(
+            "OCIO helper process failed, using one-shot process.",
+            exc_info=True
+        )
+
     with _make_temp_json_file() as tmp_json_path:
         # Prepare subprocess arguments
         args = [
@@ -19,7 +19,11 @@ from quadpype.client import (
     version_is_latest
 )
 from quadpype.lib.events import emit_event
-from quadpype.modules import load_modules, ModulesManager
+from quadpype.lib.profiling import profile_phase
+from quadpype.modules import (
+    load_modules,
+    get_modules_manager as _get_shared_modules_manager
+)
 from quadpype.settings import get_project_settings
 from quadpype.tests.lib import is_in_tests
 
@@ -76,7 +80,7 @@ def _get_modules_manager():
 
     global _modules_manager
     if _modules_manager is None:
-        _modules_manager = ModulesManager()
+        _modules_manager = _get_shared_modules_manager()
     return _modules_manager
 
 
@@ -105,6 +109,7 @@ def registered_root():
     return _registered_root["_"]
 
 
+@profile_phase("install_host")
 def install_host(host):
     """Install `host` into the running Python session.
 
@@ -168,6 +173,7 @@ def install_host(host):
     install_quadpype_plugins(project_name, host_name)
 
 
+@profile_phase("install_quadpype_plugins")
 def install_quadpype_plugins(project_name=None, host_name=None):
     # Make sure modules are loaded
     load_modules()
@@ -19,6 +19,7 @@ from quadpype.settings import (
     get_global_settings,
     get_project_settings
 )
+from quadpype.lib.profiling import profile_phase
 from quadpype.lib.attribute_definitions import (
     UnknownDef,
     serialize_attr_defs,
@@ -1616,6 +1617,7 @@ class CreateContext:
             self._log = logging.getLogger(self.__class__.__name__)
         return self._log
 
+    @profile_phase("CreateContext.reset")
     def reset(self, discover_publish_plugins=True):
         """Reset context with all plugins and instances.
 
@@ -0,0 +1,126 @@
+"""Snapshots of application environments shared by farm tasks.
+
+Environment of a farm task is the same for all tasks of a job on the same
+platform as long as settings and QuadPype version did not change. Snapshot
+key is created on submission and stored to job environments. The first task
+computes environments with 'extractenvironments' and stores them to the
+snapshot directory, other tasks load them without starting QuadPype.
+
+Snapshot contains only variables changed by QuadPype and variables set by
+QuadPype on start, so environment of the machine which created the snapshot
+does not leak to other machines. Snapshot path is resolved by
+'GlobalJobPreLoad' in Deadline repository.
+"""
+import os
+import json
+import uuid
+import hashlib
+
+from quadpype.lib import get_quadpype_version
+
+# Shared directory where snapshots are stored (feature is disabled if empty)
+ENV_SNAPSHOT_DIR_KEY = "QUADPYPE_ENV_SNAPSHOT_DIR"
+# Key of snapshot created on submission
+ENV_SNAPSHOT_KEY_KEY = "QUADPYPE_ENV_SNAPSHOT_KEY"
+# Variables set by 'start.py' before environments are computed, they're
+#   already in base environments so they would be missing in the changes
+SNAPSHOT_START_ENV_KEYS = (
+    "QUADPYPE_VERSION",
+    "QUADPYPE_ROOT",
+    "QUADPYPE_MONGO",
+    "QUADPYPE_EXECUTABLE",
+    "PYTHONPATH",
+)
+
+
+def get_environment_snapshot_dir():
+    """Directory where environment snapshots are stored.
+
+    Returns:
+        Union[str, None]: Directory path or None if snapshots are disabled.
+    """
+    return os.getenv(ENV_SNAPSHOT_DIR_KEY) or None
+
+
+def _get_settings_timestamps(project_name):
+    from quadpype.settings.lib import (
+        get_global_settings_last_saved_info,
+        get_project_settings_last_saved_info,
+    )
+
+    timestamps = []
+    for last_saved_info in (
+        get_global_settings_last_saved_info(),
+        get_project_settings_last_saved_info(None),
+        get_project_settings_last_saved_info(project_name),
+    ):
+        timestamp = None
+        if last_saved_info is not None:
+            timestamp = last_saved_info.timestamp
+        timestamps.append(timestamp)
+    return timestamps
+
+
+def get_environment_snapshot_key(
+    project_name, asset_name, task_name, app_name, env_group=None
+):
+    """Key of environment snapshot for a context.
+
+    Key changes when any of settings is saved or QuadPype version changes.
+
+    Args:
+        project_name (str): Name of project.
+        asset_name (str): Name of asset.
+        task_name (str): Name of task.
+        app_name (str): Name of application.
+        env_group (Optional[str]): Name of environment group.
+
+    Returns:
+        str: Snapshot key.
+    """
+    key_data = {
+        "project": project_name,
+        "asset": asset_name,
+        "task": task_name,
+        "app": app_name,
+        "env_group": env_group,
+        "quadpype_version": get_quadpype_version(),
+        "settings_timestamps": _get_settings_timestamps(project_name),
+    }
+    return hashlib.sha256(
+        json.dumps(key_data, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+def save_environment_snapshot(snapshot_path, env, base_env=None):
+    """Store environments changed against base environments to snapshot.
+
+    Variables from 'SNAPSHOT_START_ENV_KEYS' are stored even if they did not
+    change. Snapshot is written to a temporary file first, so tasks running
+    in parallel never read partially written snapshot.
+
+    Args:
+        snapshot_path (str): Path to snapshot json file.
+        env (dict[str, str]): Computed environments.
+        base_env (Optional[dict[str, str]]): Environments before computation.
+            'os.environ' is used if not passed.
+    """
+    if base_env is None:
+        base_env = os.environ
+
+    snapshot_env = {
+        key: value
+        for key, value in env.items()
+        if key in SNAPSHOT_START_ENV_KEYS or base_env.get(key) != value
+    }
+
+    snapshot_dir = os.path.dirname(snapshot_path)
+    os.makedirs(snapshot_dir, exist_ok=True)
+    tmp_path = "{}.{}.tmp".format(snapshot_path, uuid.uuid4().hex)
+    try:
+        with open(tmp_path, "w") as stream:
+            json.dump(snapshot_env, stream, indent=4)
+        os.replace(tmp_path, snapshot_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
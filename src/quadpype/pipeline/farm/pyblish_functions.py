@@ -445,12 +445,11 @@ def prepare_representations(skeleton_data, exp_files, anatomy, aov_filter,
         if not already_there:
             representations.append(rep)
 
-    for rep in representations:
-        # inject colorspace data
-        color_managed_plugin.set_representation_colorspace(
-            rep, context,
-            colorspace=skeleton_data["colorspace"]
-        )
+    # inject colorspace data
+    color_managed_plugin.set_representations_colorspace(
+        representations, context,
+        colorspace=skeleton_data["colorspace"]
+    )
 
     return representations
 
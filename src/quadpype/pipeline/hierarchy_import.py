@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+"""Bulk import of asset hierarchy into a project.
+
+Import is meant for big hierarchies, e.g. all shots of an edit read from
+csv or edl. Assets are validated one by one when they're added, using an
+index of asset names, so the whole import is validated before anything is
+written. Ids of new assets are created on add, so children can reference
+parents which are not written yet, and all documents are written in chunks
+of unordered bulk writes. New documents are upserted by their id, so commit
+which failed in the middle can be called again without creating duplicates.
+
+Example:
+    ```python
+    hierarchy_import = AssetHierarchyImport("MyProject")
+    hierarchy_import.add_asset("sq010")
+    hierarchy_import.add_asset(
+        "sh010", "sq010", tasks={"comp": {"type": "Compositing"}}
+    )
+    hierarchy_import.commit(
+        progress_callback=lambda done, total: print(done, total)
+    )
+    ```
+"""
+import copy
+
+from pymongo import ReplaceOne
+
+from quadpype.client import (
+    get_project,
+    get_assets,
+    save_project_timestamp,
+)
+from quadpype.client.mongo import get_project_connection
+from quadpype.client.operations import new_asset_document
+
+# Number of operations sent in one bulk write
+DEFAULT_CHUNK_SIZE = 1000
+# Attributes which new assets inherit from their parent or project
+INHERITED_ATTRIBUTES = (
+    "fps",
+    "frameStart",
+    "frameEnd",
+    "handleStart",
+    "handleEnd",
+    "clipIn",
+    "clipOut",
+    "resolutionWidth",
+    "resolutionHeight",
+    "pixelAspect",
+    "tools_env",
+)
+
+
+class HierarchyImportError(ValueError):
+    """Asset can't be added to hierarchy import."""
+    pass
+
+
+def bulk_write_in_chunks(
+    collection, operations, chunk_size=None, progress_callback=None
+):
+    """Write operations in chunks of unordered bulk writes.
+
+    Operations in a chunk may be processed in any order by the server, they
+    must not depend on each other.
+
+    Args:
+        collection (pymongo.collection.Collection): Collection where
+            operations are written.
+        operations (List[Union[InsertOne, UpdateOne, DeleteOne]]): Bulk
+            write operations.
+        chunk_size (Optional[int]): Number of operations in one bulk write.
+        progress_callback (Optional[Callable[[int, int], None]]): Called
+            after each chunk with number of written and all operations.
+
+    Returns:
+        int: Number of written operations.
+    """
+    if not chunk_size or chunk_size < 1:
+        chunk_size = DEFAULT_CHUNK_SIZE
+
+    total = len(operations)
+    for start in range(0, total, chunk_size):
+        collection.bulk_write(
+            operations[start:start + chunk_size], ordered=False
+        )
+        if progress_callback is not None:
+            progress_callback(min(start + chunk_size, total), total)
+    return total
+
+
+class _AssetIndexItem(object):
+    __slots__ = ("id", "parents", "attributes")
+
+    def __init__(self, asset_id, parents, attributes):
+        self.id = asset_id
+        self.parents = parents
+        self.attributes = attributes
+
+
+class AssetHierarchyImport(object):
+    """Import of new assets into a project.
+
+    Existing assets of the project are queried once and indexed by name.
+    Each added asset is validated against the index and added to it, so
+    checks of duplicated names and missing parents don't depend on size of
+    the hierarchy. Parents must be added before their children.
+
+    Index can be built from passed asset documents instead, e.g. when
+    hierarchy is modified by a tool and database does not match it yet.
+
+    Args:
+        project_name (str): Project name.
+        chunk_size (Optional[int]): Number of documents in one bulk write.
+        asset_docs (Optional[Iterable[Dict[str, Any]]]): Existing asset
+            documents used for index. Assets are queried from database if
+            not passed.
+
+    Raises:
+        HierarchyImportError: When project does not exist.
+    """
+
+    def __init__(self, project_name, chunk_size=None, asset_docs=None):
+        project_doc = get_project(
+            project_name, fields=["_id", "data"]
+        )
+        if not project_doc:
+            raise HierarchyImportError(
+                "Project \"{}\" was not found".format(project_name)
+            )
+
+        self._project_name = project_name
+        self._project_id = project_doc["_id"]
+        self._project_attributes = self._get_attributes(
+            project_doc.get("data") or {}
+        )
+        self._chunk_size = chunk_size
+        self._new_docs = []
+
+        if asset_docs is None:
+            fields = ["_id", "name", "data.parents"]
+            fields.extend(
+                "data.{}".format(key)
+                for key in INHERITED_ATTRIBUTES
+            )
+            asset_docs = get_assets(project_name, fields=fields)
+
+        self._items_by_name = {}
+        for asset_doc in asset_docs:
+            asset_data = asset_doc.get("data") or {}
+            self._items_by_name[asset_doc["name"]] = _AssetIndexItem(
+                asset_doc["_id"],
+                list(asset_data.get("parents") or []),
+                self._get_attributes(asset_data, self._project_attributes)
+            )
+
+    @staticmethod
+    def _get_attributes(data, parent_attributes=None):
+        attributes = dict(parent_attributes or {})
+        for key in INHERITED_ATTRIBUTES:
+            value = data.get(key)
+            if value is not None:
+                attributes[key] = value
+        return attributes
+
+    @property
+    def project_name(self):
+        return self._project_name
+
+    @property
+    def new_docs(self):
+        """Asset documents which will be created on commit."""
+        return list(self._new_docs)
+
+    def __len__(self):
+        return len(self._new_docs)
+
+    def has_asset(self, name):
+        """Asset name is already used in project or in the import."""
+        return name in self._items_by_name
+
+    def add_asset(
+        self, name, parent_name=None, data=None, tasks=None, asset_id=None
+    ):
+        """Add new asset to import.
+
+        Args:
+            name (str): Asset name, must be unique in project.
+            parent_name (Optional[str]): Name of parent asset. Asset is added
+                to project root if not passed.
+            data (Optional[Dict[str, Any]]): Asset data. Missing attributes
+                are inherited from parent.
+            tasks (Optional[Dict[str, Dict[str, Any]]]): Asset tasks by name
+                with their data e.g. '{"comp": {"type": "Compositing"}}'.
+            asset_id (Optional[Union[str, ObjectId]]): Predefined id of the
+                asset. New id is created if not passed.
+
+        Returns:
+            ObjectId: Id of the new asset.
+
+        Raises:
+            HierarchyImportError: When name is empty or already used, or when
+                parent was not found.
+        """
+        if not name:
+            raise HierarchyImportError("Asset name is not set")
+
+        if name in self._items_by_name:
+            raise HierarchyImportError(
+                "Asset \"{}\" already exists".format(name)
+            )
+
+        if parent_name:
+            parent_item = self._items_by_name.get(parent_name)
+            if parent_item is None:
+                raise HierarchyImportError((
+                    "Parent \"{}\" of asset \"{}\" was not found"
+                ).format(parent_name, name))
+            parent_id = parent_item.id
+            parents = parent_item.parents + [parent_name]
+            parent_attributes = parent_item.attributes
+        else:
+            parent_id = None
+            parents = []
+            parent_attributes = self._project_attributes
+
+        asset_data = copy.deepcopy(data) if data else {}
+        for key, value in parent_attributes.items():
+            asset_data.setdefault(key, value)
+        asset_data["tasks"] = copy.deepcopy(tasks) if tasks else {}
+
+        asset_doc = new_asset_document(
+            name, self._project_id, parent_id, parents, asset_data, asset_id
+        )
+        self._new_docs.append(asset_doc)
+        self._items_by_name[name] = _AssetIndexItem(
+            asset_doc["_id"],
+            parents,
+            self._get_attributes(asset_data, parent_attributes)
+        )
+        return asset_doc["_id"]
+
+    def add_assets(self, items):
+        """Add multiple assets to import.
+
+        Args:
+            items (Iterable[Dict[str, Any]]): Assets with keys 'name' and
+                optional 'parent', 'data' and 'tasks'. Parents must be
+                before their children.
+
+        Returns:
+            List[ObjectId]: Ids of new assets.
+        """
+        return [
+            self.add_asset(
+                item["name"],
+                item.get("parent"),
+                item.get("data"),
+                item.get("tasks")
+            )
+            for item in items
+        ]
+
+    def commit(self, progress_callback=None, operations=None):
+        """Write added assets to database.
+
+        Added assets are kept until all chunks are written, commit can be
+        called again if writing failed.
+
+        Args:
+            progress_callback (Optional[Callable[[int, int], None]]): Called
+                after each chunk with number of written and all operations.
+            operations (Optional[List[Union[UpdateOne, DeleteOne]]]): Other
+                changes of existing assets written with new assets. They
+                must not depend on order of writing.
+
+        Returns:
+            List[ObjectId]: Ids of created assets.
+        """
+        new_docs = list(self._new_docs)
+        bulk_writes = [
+            ReplaceOne({"_id": asset_doc["_id"]}, asset_doc, upsert=True)
+            for asset_doc in new_docs
+        ]
+        if operations:
+            bulk_writes.extend(operations)
+
+        if not bulk_writes:
+            return []
+
+        bulk_write_in_chunks(
+            get_project_connection(self._project_name),
+            bulk_writes,
+            self._chunk_size,
+            progress_callback
+        )
+        self._new_docs = []
+        save_project_timestamp(self._project_name, "asset")
+        return [asset_doc["_id"] for asset_doc in new_docs]
+
+
+def import_asset_hierarchy(
+    project_name, items, chunk_size=None, progress_callback=None
+):
+    """Validate and create new assets in project.
+
+    Nothing is written if any of the assets is invalid.
+
+    Args:
+        project_name (str): Project name.
+        items (Iterable[Dict[str, Any]]): Assets with keys 'name' and
+            optional 'parent', 'data' and 'tasks'. Parents must be before
+            their children.
+        chunk_size (Optional[int]): Number of documents in one bulk write.
+        progress_callback (Optional[Callable[[int, int], None]]): Called
+            after each chunk with number of written and all assets.
+
+    Returns:
+        List[ObjectId]: Ids of created assets.
+
+    Raises:
+        HierarchyImportError: When any asset can't be imported.
+    """
+    hierarchy_import = AssetHierarchyImport(project_name, chunk_size)
+    hierarchy_import.add_assets(items)
+    return hierarchy_import.commit(progress_callback)
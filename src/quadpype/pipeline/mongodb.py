@@ -130,7 +130,8 @@ class AvalonCollectionWrapper:
 
         intercepted_methods = [
             'update_one', 'update_many', 'replace_one',
-            'delete_one', 'delete_many', 'insert_one', 'insert_many'
+            'delete_one', 'delete_many', 'insert_one', 'insert_many',
+            'bulk_write'
         ]
 
         if method_name in intercepted_methods and callable(attr):
@@ -41,6 +41,13 @@ from .lib import (
     get_publish_plugin_settings,
     get_publish_instance_label,
     get_publish_instance_families,
+    process_plugin_in_thread,
+)
+
+from .parallel_publish import (
+    PARALLEL_PUBLISH_TARGETS,
+    PublishTimeline,
+    parallel_publish_iter,
 )
 
 from .abstract_expected_files import ExpectedFiles
@@ -89,6 +96,11 @@ __all__ = (
     "get_publish_plugin_settings",
     "get_publish_instance_label",
     "get_publish_instance_families",
+    "process_plugin_in_thread",
+
+    "PARALLEL_PUBLISH_TARGETS",
+    "PublishTimeline",
+    "parallel_publish_iter",
 
     "ExpectedFiles",
 
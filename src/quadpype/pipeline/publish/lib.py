@@ -3,6 +3,7 @@ import sys
 import inspect
 import copy
 import tempfile
+import threading
 import xml.etree.ElementTree
 
 import pyblish.util
@@ -1008,6 +1009,32 @@ def get_publish_instance_label(instance):
     )
 
 
+def process_plugin_in_thread(plugin, context, instance=None):
+    """Process publish plugin in a thread other than main thread.
+
+    Pyblish captures all log records emitted while plugin is processed.
+    Records emitted by other threads are removed from the result, so results
+    of plugins processed in parallel don't contain logs of each other.
+
+    Args:
+        plugin (pyblish.api.Plugin): Plugin to process.
+        context (pyblish.api.Context): Publish context.
+        instance (Optional[pyblish.api.Instance]): Instance to process.
+
+    Returns:
+        dict[str, Any]: Result of pyblish plugin process.
+    """
+
+    thread_id = threading.get_ident()
+    result = pyblish.plugin.process(plugin, context, instance)
+    result["records"] = [
+        record
+        for record in result["records"]
+        if record.thread == thread_id
+    ]
+    return result
+
+
 def get_publish_instance_families(instance):
     """Get all families of the instance.
 
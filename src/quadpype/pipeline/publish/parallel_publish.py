@@ -0,0 +1,310 @@
+"""Headless publishing which processes independent instances in parallel.
+
+Plugins are processed in order as 'pyblish.util.publish' does. Consecutive
+instance plugins of the same order band (validation, extraction,
+integration) form a segment. Each instance goes through plugins of the
+segment in order in a worker thread, while other instances are processed
+concurrently. Collectors, context plugins and plugins with
+'parallel_instances = False' are processed one by one in the main thread.
+
+Results are yielded in the main thread in order of their completion.
+"""
+import math
+import time
+import queue
+import threading
+import collections
+from concurrent.futures import ThreadPoolExecutor
+
+import pyblish.api
+import pyblish.logic
+
+from .lib import get_publish_instance_label, process_plugin_in_thread
+
+# Targets of headless publishing which can use parallel publishing
+PARALLEL_PUBLISH_TARGETS = ("farm", "shell")
+
+
+class PublishTimeline:
+    """Timeline of processed plugins for each instance."""
+
+    def __init__(self):
+        self._start = time.time()
+        self._lock = threading.Lock()
+        self._items = []
+
+    def add(self, result, start, end):
+        instance = result["instance"]
+        if instance is None:
+            instance_id = None
+            instance_label = "Context"
+        else:
+            instance_id = instance.id
+            instance_label = get_publish_instance_label(instance)
+
+        with self._lock:
+            self._items.append({
+                "instance_id": instance_id,
+                "instance": instance_label,
+                "plugin": result["plugin"].__name__,
+                "order": result["plugin"].order,
+                "thread": threading.current_thread().name,
+                "start": start - self._start,
+                "end": end - self._start,
+                "success": result["success"],
+            })
+
+    def get_report(self):
+        """Timeline data grouped by instance.
+
+        Returns:
+            dict[str, Any]: Total duration and timeline items of instances.
+        """
+
+        with self._lock:
+            items = list(self._items)
+
+        items_by_instance = collections.OrderedDict()
+        for item in sorted(items, key=lambda i: i["start"]):
+            items_by_instance.setdefault(item["instance"], []).append(item)
+
+        instances = []
+        for instance_label, instance_items in items_by_instance.items():
+            start = min(item["start"] for item in instance_items)
+            end = max(item["end"] for item in instance_items)
+            instances.append({
+                "instance": instance_label,
+                "start": start,
+                "end": end,
+                "duration": end - start,
+                "items": instance_items,
+            })
+
+        return {
+            "duration": max((item["end"] for item in items), default=0.0),
+            "instances": instances,
+        }
+
+    def format_report(self):
+        """Human readable timeline of instances."""
+        report = self.get_report()
+        lines = ["Publish timeline ({:.2f}s):".format(report["duration"])]
+        for instance_item in report["instances"]:
+            lines.append("  {} {:>8.2f}s - {:>8.2f}s ({:.2f}s)".format(
+                instance_item["instance"],
+                instance_item["start"],
+                instance_item["end"],
+                instance_item["duration"],
+            ))
+            for item in instance_item["items"]:
+                lines.append("    {}{} {:.2f}s [{}]".format(
+                    item["plugin"],
+                    "" if item["success"] else " (failed)",
+                    item["end"] - item["start"],
+                    item["thread"],
+                ))
+        return "\n".join(lines)
+
+
+def _get_order_band(order):
+    return int(math.floor(order + 0.5))
+
+
+def _can_process_in_parallel(plugin):
+    return (
+        plugin.__instanceEnabled__
+        and _get_order_band(plugin.order) >= _get_order_band(
+            pyblish.api.ValidatorOrder
+        )
+        and getattr(plugin, "parallel_instances", True)
+    )
+
+
+def _split_plugins(plugins):
+    """Split plugins into segments.
+
+    Returns:
+        list[tuple[bool, list[pyblish.api.Plugin]]]: Segments with
+            information if plugins of segment can be processed in parallel.
+    """
+
+    segments = []
+    for plugin in plugins:
+        parallel = _can_process_in_parallel(plugin)
+        if (
+            parallel
+            and segments
+            and segments[-1][0]
+            and (
+                _get_order_band(segments[-1][1][-1].order)
+                == _get_order_band(plugin.order)
+            )
+        ):
+            segments[-1][1].append(plugin)
+        else:
+            segments.append((parallel, [plugin]))
+    return segments
+
+
+def _collect_active_families(context):
+    families = set()
+    for instance in context:
+        if instance.data.get("publish") is False:
+            continue
+        family = instance.data.get("family")
+        if family:
+            families.add(family)
+        families.update(instance.data.get("families") or [])
+    return list(families)
+
+
+def _stops_on_error(plugin):
+    # Errors of validators are collected, anything after validation stops
+    #   the publishing
+    return plugin.order >= pyblish.api.ValidatorOrder + 0.5
+
+
+class _ParallelPublish:
+    def __init__(self, context, max_workers, timeline):
+        self._context = context
+        self._max_workers = max_workers
+        self._timeline = timeline
+        self._stop_event = threading.Event()
+        self.orders_with_error = set()
+
+    @property
+    def stopped(self):
+        return self._stop_event.is_set()
+
+    def process(self, plugin, instance):
+        start = time.time()
+        result = process_plugin_in_thread(plugin, self._context, instance)
+        self._timeline.add(result, start, time.time())
+        if result["error"]:
+            self.orders_with_error.add(plugin.order)
+            if _stops_on_error(plugin):
+                self._stop_event.set()
+        return result
+
+    def process_serial(self, plugin):
+        if plugin.__instanceEnabled__:
+            for instance in pyblish.logic.instances_by_plugin(
+                self._context, plugin
+            ):
+                if instance.data.get("publish") is False:
+                    continue
+                yield self.process(plugin, instance)
+                if self.stopped:
+                    return
+            return
+
+        families = _collect_active_families(self._context)
+        if pyblish.logic.plugins_by_families([plugin], families):
+            yield self.process(plugin, None)
+
+    def process_parallel(self, plugins):
+        plugins_by_instance = collections.OrderedDict()
+        for plugin in plugins:
+            for instance in pyblish.logic.instances_by_plugin(
+                self._context, plugin
+            ):
+                if instance.data.get("publish") is False:
+                    continue
+                plugins_by_instance.setdefault(instance, []).append(plugin)
+
+        if not plugins_by_instance:
+            return
+
+        results = queue.Queue()
+        with ThreadPoolExecutor(
+            max_workers=self._max_workers,
+            thread_name_prefix="PublishInstance"
+        ) as executor:
+            futures = [
+                executor.submit(
+                    self._process_instance, instance_plugins, instance, results
+                )
+                for instance, instance_plugins in plugins_by_instance.items()
+            ]
+            while True:
+                try:
+                    yield results.get(timeout=0.1)
+                    continue
+                except queue.Empty:
+                    pass
+
+                if all(future.done() for future in futures):
+                    break
+
+            # Raise unexpected errors of workers
+            for future in futures:
+                future.result()
+
+        while not results.empty():
+            yield results.get()
+
+    def _process_instance(self, plugins, instance, results):
+        for plugin in plugins:
+            if self.stopped or instance.data.get("publish") is False:
+                return
+            result = self.process(plugin, instance)
+            results.put(result)
+            if result["error"]:
+                return
+
+
+def parallel_publish_iter(
+    context=None, plugins=None, targets=None, max_workers=None, timeline=None
+):
+    """Publish and yield results of processed plugins.
+
+    Args:
+        context (Optional[pyblish.api.Context]): Publish context.
+        plugins (Optional[list[pyblish.api.Plugin]]): Publish plugins.
+            Plugins are discovered if not passed.
+        targets (Optional[list[str]]): Publish targets. Registered targets
+            are used if not passed.
+        max_workers (Optional[int]): Number of threads processing instances.
+        timeline (Optional[PublishTimeline]): Timeline of processed plugins.
+
+    Yields:
+        dict[str, Any]: Result of pyblish plugin process.
+    """
+
+    if context is None:
+        context = pyblish.api.Context()
+
+    if plugins is None:
+        plugins = pyblish.api.discover()
+
+    if targets is None:
+        targets = ["default"] + pyblish.api.registered_targets()
+
+    if timeline is None:
+        timeline = PublishTimeline()
+
+    plugins = [
+        plugin
+        for plugin in pyblish.logic.plugins_by_targets(plugins, targets)
+        if plugin.active
+    ]
+
+    publish = _ParallelPublish(context, max_workers, timeline)
+    test = pyblish.logic.registered_test()
+    for parallel, segment_plugins in _split_plugins(plugins):
+        state = {
+            "nextOrder": segment_plugins[0].order,
+            "ordersWithError": publish.orders_with_error
+        }
+        if test(**state):
+            break
+
+        if parallel:
+            yield from publish.process_parallel(segment_plugins)
+        else:
+            yield from publish.process_serial(segment_plugins[0])
+
+        if publish.stopped:
+            break
+
+    pyblish.api.emit("published", context=context)
@@ -13,7 +13,8 @@ from .lib import (
 
 from quadpype.pipeline.colorspace import (
     get_colorspace_settings_from_publish_context,
-    set_colorspace_data_to_representation
+    set_colorspace_data_to_representation,
+    set_colorspace_data_to_representations,
 )
 
 
@@ -348,3 +349,24 @@ class ColormanagedPyblishPluginMixin(object):
             colorspace,
             log=self.log
         )
+
+    def set_representations_colorspace(
+        self, representations, context,
+        colorspace=None,
+    ):
+        """Sets colorspace data to multiple representations.
+
+        Colorspaces are matched by file rules for all representations at
+        once, see 'set_representation_colorspace'.
+
+        Args:
+            representations (list[dict]): publishing representations
+            context (publish.Context): publishing context
+            colorspace (str, optional): colorspace name used for all
+                representations. Defaults to None.
+        """
+        set_colorspace_data_to_representations(
+            representations, context.data,
+            colorspace,
+            log=self.log
+        )
@@ -1,12 +1,22 @@
 import os
+import io
 import copy
+import uuid
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import appdirs
 
 from quadpype.lib import (
     Logger,
     StringTemplate
 )
-from quadpype.client import get_project
+from quadpype.client import (
+    get_project,
+    get_thumbnail,
+    get_thumbnail_id_from_source,
+)
 from . import legacy_io
 from .anatomy import Anatomy
 from .plugin_discover import (
@@ -147,6 +157,293 @@ class ServerThumbnailResolver(ThumbnailResolver):
         return None
 
 
+def downscale_thumbnail(content, max_dimension):
+    """Downscale thumbnail content to JPEG fitting into max dimension.
+
+    Content is returned unchanged if it can't be decoded.
+
+    Args:
+        content (bytes): Binary content of thumbnail image.
+        max_dimension (int): Maximum width and height of output.
+
+    Returns:
+        bytes: JPEG binary content.
+    """
+    try:
+        from PIL import Image
+
+        with Image.open(io.BytesIO(content)) as image:
+            image.thumbnail((max_dimension, max_dimension))
+            if image.mode != "RGB":
+                image = image.convert("RGB")
+            output = io.BytesIO()
+            image.save(output, format="JPEG", quality=90)
+        return output.getvalue()
+
+    except Exception:
+        Logger.get_logger(__name__).debug(
+            "Failed to downscale thumbnail.", exc_info=True
+        )
+    return content
+
+
+class ThumbnailDiskCache(object):
+    """On-disk LRU cache of downscaled thumbnails keyed by thumbnail id.
+
+    Access time of a file is refreshed on each read, the least recently used
+    files are removed when size of the cache exceeds 'max_size'.
+
+    Args:
+        root (Optional[str]): Cache directory. User cache directory is used
+            if not passed.
+        max_size (Optional[int]): Maximum size of the cache in bytes.
+    """
+
+    default_max_size = 256 * 1024 * 1024
+
+    def __init__(self, root=None, max_size=None):
+        if root is None:
+            root = os.path.join(
+                appdirs.user_cache_dir("quadpype", "quad"), "thumbnails"
+            )
+        if max_size is None:
+            max_size = self.default_max_size
+        self._root = root
+        self._max_size = max_size
+        self._size = None
+        self._lock = threading.Lock()
+
+    @property
+    def root(self):
+        return self._root
+
+    def get_path(self, project_name, thumbnail_id):
+        return os.path.join(
+            self._root, project_name, "{}.jpg".format(thumbnail_id)
+        )
+
+    def get(self, project_name, thumbnail_id):
+        """Cached thumbnail content.
+
+        Returns:
+            Union[bytes, None]: Content or None if is not cached.
+        """
+        path = self.get_path(project_name, thumbnail_id)
+        try:
+            with open(path, "rb") as stream:
+                content = stream.read()
+            os.utime(path)
+        except OSError:
+            return None
+        return content
+
+    def set(self, project_name, thumbnail_id, content):
+        """Store thumbnail content to cache.
+
+        File is written to temporary path first so other processes never
+        read partially written thumbnail.
+        """
+        path = self.get_path(project_name, thumbnail_id)
+        tmp_path = "{}.{}.tmp".format(path, uuid.uuid4().hex)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "wb") as stream:
+                stream.write(content)
+            os.replace(tmp_path, path)
+
+        except OSError:
+            Logger.get_logger(__name__).debug(
+                "Failed to cache thumbnail \"{}\".".format(path),
+                exc_info=True
+            )
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._calculate_size()
+            else:
+                self._size += len(content)
+
+            if self._size > self._max_size:
+                self._trim()
+
+    def _iter_files(self):
+        for root, _, filenames in os.walk(self._root):
+            for filename in filenames:
+                if filename.endswith(".jpg"):
+                    yield os.path.join(root, filename)
+
+    def _calculate_size(self):
+        size = 0
+        for path in self._iter_files():
+            try:
+                size += os.path.getsize(path)
+            except OSError:
+                pass
+        return size
+
+    def _trim(self):
+        """Remove least recently used files until cache fits to half size.
+
+        Trimming to half of the size avoids walking the cache directory
+        on every write once the cache is full.
+        """
+        files_info = []
+        for path in self._iter_files():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            files_info.append((stat.st_mtime, stat.st_size, path))
+
+        files_info.sort()
+        size = sum(file_info[1] for file_info in files_info)
+        target_size = self._max_size // 2
+        for _, file_size, path in files_info:
+            if size <= target_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            size -= file_size
+        self._size = size
+
+
+class ThumbnailService(object):
+    """Resolve thumbnails on worker threads with on-disk cache.
+
+    Thumbnail content is resolved with 'get_thumbnail_binary', downscaled
+    and stored to 'ThumbnailDiskCache'. All methods return
+    'concurrent.futures.Future' so callers (e.g. UI) are never blocked by
+    database queries or file reads.
+
+    Args:
+        dbcon (Optional[AvalonMongoDB]): Connection passed to thumbnail
+            resolvers.
+        workers (Optional[int]): Number of worker threads.
+        cache (Optional[ThumbnailDiskCache]): Disk cache.
+        max_dimension (Optional[int]): Maximum width and height of cached
+            thumbnails.
+    """
+
+    default_workers = 4
+    default_max_dimension = 512
+
+    def __init__(
+        self, dbcon=None, workers=None, cache=None, max_dimension=None
+    ):
+        if cache is None:
+            cache = ThumbnailDiskCache()
+        self._dbcon = dbcon
+        self._cache = cache
+        self._max_dimension = max_dimension or self.default_max_dimension
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers or self.default_workers,
+            thread_name_prefix="ThumbnailService"
+        )
+        self._futures = {}
+        self._lock = threading.Lock()
+
+    @property
+    def cache(self):
+        return self._cache
+
+    def get_thumbnail(self, project_name, thumbnail_id):
+        """Thumbnail content by thumbnail id.
+
+        Returns:
+            Future: Future with content (bytes) or None.
+        """
+        key = (project_name, str(thumbnail_id))
+        with self._lock:
+            future = self._futures.get(key)
+            if future is not None:
+                return future
+            future = self._executor.submit(
+                self._get_thumbnail_content, project_name, thumbnail_id
+            )
+            self._futures[key] = future
+
+        # Callback must be added without lock, it is called right away
+        #   if the future is already done
+        future.add_done_callback(
+            lambda _future: self._on_future_done(key, _future)
+        )
+        return future
+
+    def get_source_thumbnail(self, project_name, src_type, src_id):
+        """Thumbnail content of source entity.
+
+        Args:
+            project_name (str): Project name.
+            src_type (str): Type of source entity ('asset', 'version').
+            src_id (Union[str, ObjectId]): Id of source entity.
+
+        Returns:
+            Future: Future with content (bytes) or None.
+        """
+        return self._executor.submit(
+            self._get_source_thumbnail_content,
+            project_name, src_type, src_id
+        )
+
+    def prefetch(self, project_name, thumbnail_ids):
+        """Resolve and cache thumbnails in background.
+
+        Already cached thumbnails are only marked as recently used.
+
+        Args:
+            project_name (str): Project name.
+            thumbnail_ids (Iterable[Union[str, ObjectId]]): Thumbnail ids.
+        """
+        for thumbnail_id in set(thumbnail_ids):
+            if thumbnail_id:
+                self.get_thumbnail(project_name, thumbnail_id)
+
+    def shutdown(self, wait=False):
+        """Stop worker threads, pending requests are cancelled."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+        with self._lock:
+            self._futures.clear()
+
+    def _on_future_done(self, key, future):
+        with self._lock:
+            if self._futures.get(key) is future:
+                self._futures.pop(key)
+
+    def _get_source_thumbnail_content(self, project_name, src_type, src_id):
+        thumbnail_id = get_thumbnail_id_from_source(
+            project_name, src_type, src_id
+        )
+        if not thumbnail_id:
+            return None
+        return self._get_thumbnail_content(project_name, thumbnail_id)
+
+    def _get_thumbnail_content(self, project_name, thumbnail_id):
+        content = self._cache.get(project_name, thumbnail_id)
+        if content is not None:
+            return content
+
+        thumbnail_entity = get_thumbnail(
+            project_name, thumbnail_id, None, None
+        )
+        if not thumbnail_entity:
+            return None
+
+        content = get_thumbnail_binary(
+            thumbnail_entity, "thumbnail", self._dbcon
+        )
+        if not content:
+            return None
+
+        content = downscale_thumbnail(content, self._max_dimension)
+        self._cache.set(project_name, thumbnail_id, content)
+        return content
+
+
 # Thumbnail resolvers
 def discover_thumbnail_resolvers():
     return discover(ThumbnailResolver)
@@ -343,7 +343,12 @@ class DeleteOldVersions(load.SubsetLoaderPlugin):
                 continue
 
             update_query = {"_id": version["_id"]}
-            update_data = {"$set": {"data.tags": version_tags}}
+            update_data = {
+                "$set": {"data.tags": version_tags},
+                # Availability on sites stored by sync server is calculated
+                #   again
+                "$unset": {"sites_availability": ""}
+            }
             mongo_changes_bulk.append(UpdateOne(update_query, update_data))
 
         if data["archive_subset"]:
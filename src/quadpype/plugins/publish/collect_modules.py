@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 """Collect QuadPype modules."""
-from quadpype.modules import ModulesManager
+from quadpype.modules import get_modules_manager
 import pyblish.api
 
 
@@ -11,5 +11,5 @@ class CollectModules(pyblish.api.ContextPlugin):
     label = "QuadPype Modules"
 
     def process(self, context):
-        manager = ModulesManager()
+        manager = get_modules_manager()
         context.data["quadpypeModules"] = manager.modules_by_name
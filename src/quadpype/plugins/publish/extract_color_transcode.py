@@ -149,17 +149,25 @@ class ExtractOIIOTranscode(publish.Extractor):
                     output_path = self._get_output_file_path(input_path,
                                                              new_staging_dir,
                                                              output_extension)
-                    convert_colorspace(
-                        input_path,
-                        output_path,
-                        config_path,
-                        source_colorspace,
-                        target_colorspace,
-                        view,
-                        display,
-                        additional_command_args,
-                        self.log
-                    )
+                    try:
+                        chunk_timings = convert_colorspace(
+                            input_path,
+                            output_path,
+                            config_path,
+                            source_colorspace,
+                            target_colorspace,
+                            view,
+                            display,
+                            additional_command_args,
+                            self.log
+                        )
+                    except RuntimeError as exc:
+                        raise publish.KnownPublishError(
+                            "Transcoding of \"{}\" failed.\n{}".format(
+                                file_name, exc
+                            )
+                        )
+                    self._log_chunk_timings(file_name, chunk_timings)
 
                 # cleanup temporary transcoded files
                 for file_name in new_repre["files"]:
@@ -301,6 +309,18 @@ class ExtractOIIOTranscode(publish.Extractor):
 
         return files_to_convert
 
+    def _log_chunk_timings(self, file_name, chunk_timings):
+        """Log duration of each converted chunk to the publish report."""
+        for chunk_timing in chunk_timings:
+            frames_label = ""
+            if chunk_timing["frame_start"] is not None:
+                frames_label = " frames {}-{}".format(
+                    chunk_timing["frame_start"], chunk_timing["frame_end"]
+                )
+            self.log.info("Transcoded \"{}\"{} in {:.2f}s".format(
+                file_name, frames_label, chunk_timing["duration"]
+            ))
+
     def _get_output_file_path(self, input_path, output_dir,
                               output_extension):
         """Create output file name path."""
@@ -16,6 +16,8 @@ from quadpype.lib import (
     filter_profiles,
     path_to_subprocess_arg,
     run_subprocess,
+    create_hardlink,
+    create_symlink,
 )
 from quadpype.lib.transcoding import (
     IMAGE_EXTENSIONS,
@@ -77,6 +79,11 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
     # Preset attributes
     profiles = None
+    # How missing frames of sequence are filled
+    # - "link": hardlink (or symlink) nearest existing frame, copy it only
+    #       when linking is not possible
+    # - "copy": copy nearest existing frame
+    fill_gaps_mode = "link"
 
     def process(self, instance):
         self.log.debug(str(instance.data["representations"]))
@@ -879,9 +886,9 @@ class ExtractReview(pyblish.api.InstancePlugin):
         # type: (list, str, int, int) -> list
         """Fill missing files in sequence by duplicating existing ones.
 
-        This will take nearest frame file and copy it with so as to fill
-        gaps in sequence. Last existing file there is is used to for the
-        hole ahead.
+        This will take nearest frame file and link or copy it with so as to
+        fill gaps in sequence (based on 'fill_gaps_mode'). Last existing file
+        there is is used to for the hole ahead.
 
         Args:
             files (list): List of representation files.
@@ -925,11 +932,36 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 raise KnownPublishError(
                     "Missing previously detected file: {}".format(src_fpath))
 
-            speedcopy.copyfile(src_fpath, hole_fpath)
+            self._duplicate_frame_file(src_fpath, hole_fpath)
             added_files.append(hole_fpath)
 
         return added_files
 
+    def _duplicate_frame_file(self, src_fpath, dst_fpath):
+        """Duplicate frame file to fill hole in sequence.
+
+        Hardlink, then symlink are tried in 'link' mode so holes do not take
+        any disk space. File is copied if linking is not possible.
+
+        Args:
+            src_fpath (str): Path to existing frame file.
+            dst_fpath (str): Path to the missing frame file.
+        """
+        if self.fill_gaps_mode == "link":
+            for link_func in (create_hardlink, create_symlink):
+                try:
+                    link_func(src_fpath, dst_fpath)
+                    return
+                except (OSError, NotImplementedError):
+                    pass
+            self.log.debug(
+                "Linking is not possible, copying \"{}\" to \"{}\"".format(
+                    src_fpath, dst_fpath
+                )
+            )
+
+        speedcopy.copyfile(src_fpath, dst_fpath)
+
     def input_output_paths(self, new_repre, output_def, temp_data):
         """Deduce input nad output file paths based on entered data.
 
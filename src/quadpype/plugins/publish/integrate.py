@@ -11,6 +11,7 @@ import pyblish.api
 from quadpype.settings import PROJECT_SETTINGS_KEY
 from quadpype.client.operations import (
     OperationsSession,
+    REMOVED_VALUE,
     new_subset_document,
     new_version_doc,
     new_representation_doc,
@@ -23,6 +24,7 @@ from quadpype.client import (
     get_representations,
     get_subset_by_name,
     get_version_by_name,
+    get_versions,
 )
 from quadpype.lib import source_hash
 from quadpype.lib.file_transaction import (
@@ -307,7 +309,14 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         # Transaction to reduce the chances of another publish trying to
         # publish to the same version number since that chance can greatly
         # increase if the file transaction takes a long time.
+        version_created = any(
+            operation["operation"] == "create"
+            and operation["entity_type"] == "version"
+            for operation in op_session.to_data()
+        )
         op_session.commit()
+        if version_created:
+            self._validate_version_is_unique(project_name, version)
 
         self.log.info("Subset '{subset[name]}' version {version[name]} "
                       "written to database..".format(subset=subset,
@@ -386,6 +395,15 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
                         project_name, "representation", existing_repres["_id"]
                     )
 
+        # Availability of representations on sites stored by sync server is
+        #   calculated again when representations of the version change
+        op_session.update_entity(
+            project_name,
+            version["type"],
+            version["_id"],
+            {"sites_availability": REMOVED_VALUE}
+        )
+
         self.log.debug("{}".format(op_session.to_data()))
         op_session.commit()
 
@@ -527,6 +545,38 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
 
         return version_doc
 
+    def _validate_version_is_unique(self, project_name, version_doc):
+        """Make sure created version was not created by another publish.
+
+        Version number is used optimistically. Publishes running at the same
+        time may create the same version of a subset. Created version is
+        removed and publish fails before any file is transferred when any
+        other version with the same name exists. When both versions are
+        created at the same time both publishes fail.
+        """
+        other_versions = [
+            doc
+            for doc in get_versions(
+                project_name,
+                subset_ids=[version_doc["parent"]],
+                versions=[version_doc["name"]],
+                fields=["_id"]
+            )
+            if doc["_id"] != version_doc["_id"]
+        ]
+        if not other_versions:
+            return
+
+        op_session = OperationsSession()
+        op_session.delete_entity(
+            project_name, version_doc["type"], version_doc["_id"]
+        )
+        op_session.commit()
+        raise KnownPublishError((
+            "Version v{:03d} was published by another process at the same"
+            " time. Publish again to create a new version."
+        ).format(version_doc["name"]))
+
     def _validate_repre_files(self, files, is_sequence_representation):
         """Validate representation files before transfer preparation.
 
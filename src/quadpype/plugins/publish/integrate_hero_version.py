@@ -15,6 +15,7 @@ from quadpype.client import (
 )
 from quadpype.client.operations import (
     OperationsSession,
+    REMOVED_VALUE,
     new_hero_version_doc,
     prepare_hero_version_update_data,
     prepare_representation_update_data,
@@ -207,6 +208,9 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
             update_data = prepare_hero_version_update_data(
                 old_version, new_hero_version
             )
+            # Availability of representations on sites stored by sync
+            #   server is calculated again for new representations
+            update_data["sites_availability"] = REMOVED_VALUE
             op_session.update_entity(
                 project_name,
                 new_hero_version["type"],
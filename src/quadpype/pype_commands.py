@@ -34,9 +34,9 @@ class PypeCommands:
         """Modules/Addons can add their cli commands dynamically."""
 
         from quadpype.lib import Logger
-        from quadpype.modules import ModulesManager
+        from quadpype.modules import get_modules_manager
 
-        manager = ModulesManager()
+        manager = get_modules_manager()
         log = Logger.get_logger("CLI-AddModules")
         for module in manager.modules:
             try:
@@ -50,6 +50,12 @@ class PypeCommands:
                 )
         return click_func
 
+    @staticmethod
+    def launch_daemon(socket_path=None):
+        from quadpype.lib.daemon import run_daemon
+
+        run_daemon(socket_path)
+
     @staticmethod
     def launch_eventservercli(*args):
         from quadpype_modules.ftrack.ftrack_server.event_server_cli import (
@@ -69,16 +75,24 @@ class PypeCommands:
         traypublisher.main()
 
     @staticmethod
-    def publish(paths, targets=None, gui=False):
+    def publish(
+        paths, targets=None, gui=False, workers=None, timeline_path=None
+    ):
         """Start headless publishing.
 
         Publish use json from passed paths argument.
 
+        Instances are processed in parallel when more than one worker is
+        requested and all targets allow it.
+
         Args:
             paths (list): Paths to jsons.
             targets (string): What module should be targeted
                 (to choose validator for example)
             gui (bool): Show publish UI.
+            workers (Optional[int]): Number of threads processing instances.
+            timeline_path (Optional[str]): Path to json file where timeline
+                of processed plugins is stored.
 
         Raises:
             RuntimeError: When there is no path to process.
@@ -89,11 +103,16 @@ class PypeCommands:
             get_app_environments_for_context,
             LaunchTypes,
         )
-        from quadpype.modules import ModulesManager
+        from quadpype.modules import get_modules_manager
         from quadpype.pipeline import (
             install_quadpype_plugins,
             get_global_context,
         )
+        from quadpype.pipeline.publish import (
+            PARALLEL_PUBLISH_TARGETS,
+            PublishTimeline,
+            parallel_publish_iter,
+        )
 
         # Register target and host
         import pyblish.api
@@ -103,7 +122,7 @@ class PypeCommands:
 
         install_quadpype_plugins()
 
-        manager = ModulesManager()
+        manager = get_modules_manager()
 
         publish_paths = manager.collect_plugin_paths()["publish"]
 
@@ -154,20 +173,48 @@ class PypeCommands:
             error_format = ("Failed {plugin.__name__}: "
                             "{error} -- {error.traceback}")
 
-            for result in pyblish.util.publish_iter():
-                if result["error"]:
-                    log.error(error_format.format(**result))
-                    # uninstall()
-                    sys.exit(1)
+            timeline = PublishTimeline()
+            use_parallel = (
+                workers is not None
+                and workers > 1
+                and all(
+                    target in PARALLEL_PUBLISH_TARGETS
+                    for target in pyblish.api.registered_targets()
+                )
+            )
+            if use_parallel:
+                log.info(
+                    "Processing instances in {} threads".format(workers)
+                )
+                publish_iter = parallel_publish_iter(
+                    max_workers=workers, timeline=timeline
+                )
+            else:
+                publish_iter = pyblish.util.publish_iter()
+
+            try:
+                for result in publish_iter:
+                    if result["error"]:
+                        log.error(error_format.format(**result))
+                        # uninstall()
+                        sys.exit(1)
+            finally:
+                if use_parallel:
+                    log.info(timeline.format_report())
+                    if timeline_path:
+                        with open(timeline_path, "w") as stream:
+                            json.dump(timeline.get_report(), stream, indent=4)
 
         log.info("Publish finished.")
 
     @staticmethod
     def extractenvironments(output_json_path, project, asset, task, app,
-                            env_group):
+                            env_group, snapshot_path=None):
         """Produces json file with environment based on project and app.
 
         Called by Deadline plugin to propagate environment into render jobs.
+        Environments are also stored to 'snapshot_path' if passed so other
+        tasks of the job can reuse them.
         """
 
         from quadpype.lib.applications import (
@@ -184,6 +231,12 @@ class PypeCommands:
                 env_group=env_group,
                 launch_type=LaunchTypes.farm_render
             )
+            if snapshot_path:
+                from quadpype.pipeline.farm.environment_snapshot import (
+                    save_environment_snapshot
+                )
+
+                save_environment_snapshot(snapshot_path, env)
         else:
             env = os.environ.copy()
 
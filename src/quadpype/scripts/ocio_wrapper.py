@@ -17,12 +17,54 @@ Providing functionality:
 - _get_views_data - python 3 - module function
                  - returning all available viewers
                    found in input config path.
+- server - console command - long-lived helper process
+         - answering queries sent as json lines to stdin,
+           see `SERVER_COMMANDS`.
 """
-import click
+import os
+import sys
 import json
 from pathlib import Path
+
+import click
 import PyOpenColorIO as ocio
 
+# Prefix of lines with server responses, other lines on stdout
+#   (e.g. logs of QuadPype boot) are ignored by client
+SERVER_RESPONSE_PREFIX = "__OCIO_RESPONSE__"
+
+# Parsed configs by resolved path with modification time of the file
+_CONFIGS_CACHE = {}
+
+
+def _get_ocio_config(config_path):
+    """Get parsed OCIO config object.
+
+    Parsed configs are cached by path and modification time of the file so
+    a config is parsed again only when it changes on disk.
+
+    Args:
+        config_path (Union[str, Path]): path string leading to config.ocio
+
+    Raises:
+        IOError: Input config does not exist.
+
+    Returns:
+        PyOpenColorIO.Config: Parsed config.
+    """
+    config_path = Path(config_path).resolve()
+    if not config_path.is_file():
+        raise IOError(
+            "Input path `{}` should be `config.ocio` file".format(str(config_path)))
+
+    config_path = str(config_path)
+    mtime = os.path.getmtime(config_path)
+    cached = _CONFIGS_CACHE.get(config_path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, ocio.Config.CreateFromFile(config_path))
+        _CONFIGS_CACHE[config_path] = cached
+    return cached[1]
+
 
 @click.group()
 def main():
@@ -34,7 +76,7 @@ def config():
     """Config related commands group
 
     Example of use:
-    > pyton.exe ./ocio_wrapper.py config <command> *args
+    > python.exe ./ocio_wrapper.py config <command> *args
     """
     pass  # noqa: WPS100
 
@@ -44,7 +86,7 @@ def colorspace():
     """Colorspace related commands group
 
     Example of use:
-    > pyton.exe ./ocio_wrapper.py config <command> *args
+    > python.exe ./ocio_wrapper.py config <command> *args
     """
     pass  # noqa: WPS100
 
@@ -72,7 +114,7 @@ def get_colorspace(in_path, out_path):
         out_path (str): temp json file path string
 
     Example of use:
-    > pyton.exe ./ocio_wrapper.py config get_colorspace
+    > python.exe ./ocio_wrapper.py config get_colorspace
         --in_path=<path> --out_path=<path>
     """
     out_path = Path(out_path).resolve()
@@ -96,12 +138,7 @@ def _get_colorspace_data(config_path):
     Returns:
         dict: aggregated available colorspaces
     """
-    config_path = Path(config_path).resolve()
-    if not config_path.is_file():
-        raise IOError(
-            "Input path `{}` should be `config.ocio` file".format(str(config_path)))
-
-    ocio_config = ocio.Config().CreateFromFile(str(config_path))
+    ocio_config = _get_ocio_config(config_path)
 
     colorspace_data = {
         "roles": {},
@@ -167,7 +204,7 @@ def get_views(in_path, out_path):
         out_path (str): temp json file path string
 
     Example of use:
-    > pyton.exe ./ocio_wrapper.py config get_views \
+    > python.exe ./ocio_wrapper.py config get_views \
         --in_path=<path> --out_path=<path>
     """
     out_path = Path(out_path).resolve()
@@ -191,12 +228,7 @@ def _get_views_data(config_path):
     Returns:
         dict: aggregated available viewers
     """
-    config_path = Path(config_path).resolve()
-    if not config_path.is_file():
-        raise IOError(
-            "Input path `{}` should be `config.ocio` file".format(str(config_path)))
-
-    ocio_config = ocio.Config().CreateFromFile(str(config_path))
+    ocio_config = _get_ocio_config(config_path)
 
     data_ = {}
     for display in ocio_config.getDisplays():
@@ -240,7 +272,7 @@ def get_version(config_path, out_path):
         out_path (str): temp json file path string
 
     Example of use:
-    > pyton.exe ./ocio_wrapper.py config get_version \
+    > python.exe ./ocio_wrapper.py config get_version \
         --config_path=<path> --out_path=<path>
     """
     out_data = _get_version_data(config_path)
@@ -263,12 +295,7 @@ def _get_version_data(config_path):
     Returns:
         dict: minor and major keys with values
     """
-    config_path = Path(config_path).resolve()
-    if not config_path.is_file():
-        raise IOError(
-            "Input path `{}` should be `config.ocio` file".format(str(config_path)))
-
-    ocio_config = ocio.Config().CreateFromFile(str(config_path))
+    ocio_config = _get_ocio_config(config_path)
 
     return {
         "major": ocio_config.getMajorVersion(),
@@ -307,7 +334,7 @@ def get_config_file_rules_colorspace_from_filepath(
         out_path (str): temp json file path string
 
     Example of use:
-    > pyton.exe ./ocio_wrapper.py \
+    > python.exe ./ocio_wrapper.py \
         colorspace get_config_file_rules_colorspace_from_filepath \
         --config_path=<path> --filepath=<path> --out_path=<path>
     """
@@ -334,12 +361,7 @@ def _get_config_file_rules_colorspace_from_filepath(config_path, filepath):
     Returns:
         dict: aggregated available colorspaces
     """
-    config_path = Path(config_path).resolve()
-    if not config_path.is_file():
-        raise IOError(
-            "Input path `{}` should be `config.ocio` file".format(str(config_path)))
-
-    ocio_config = ocio.Config().CreateFromFile(str(config_path))
+    ocio_config = _get_ocio_config(config_path)
 
     # TODO: use `parseColorSpaceFromString` instead if ocio v1
     colorspace_data = ocio_config.getColorSpaceFromFilepath(filepath)
@@ -362,12 +384,7 @@ def _get_display_view_colorspace_name(config_path, display, view):
     Returns:
         view color space name (str) e.g. "Output - sRGB"
     """
-    config_path = Path(config_path).resolve()
-    if not config_path.is_file():
-        raise IOError(
-            "Input path `{}` should be `config.ocio` file".format(str(config_path)))
-
-    ocio_config = ocio.Config.CreateFromFile(str(config_path))
+    ocio_config = _get_ocio_config(config_path)
     colorspace_name = ocio_config.getDisplayViewColorSpaceName(display, view)
 
     return colorspace_name
@@ -406,7 +423,7 @@ def get_display_view_colorspace_name(in_path, out_path,
         view (str): view name e.g. "sRGB"
 
     Example of use:
-    > pyton.exe ./ocio_wrapper.py config \
+    > python.exe ./ocio_wrapper.py config \
         get_display_view_colorspace_name --in_path=<path> \
         --out_path=<path> --display=<display> --view=<view>
     """
@@ -422,5 +439,88 @@ def get_display_view_colorspace_name(in_path, out_path,
     print("Display view colorspace saved to '{}'.".format(str(out_path)))
 
 
+SERVER_COMMANDS = {
+    ("config", "get_colorspace"): (
+        lambda in_path: _get_colorspace_data(in_path)
+    ),
+    ("config", "get_views"): (
+        lambda in_path: _get_views_data(in_path)
+    ),
+    ("config", "get_version"): (
+        lambda config_path: _get_version_data(config_path)
+    ),
+    ("config", "get_display_view_colorspace_name"): (
+        lambda in_path, display, view: _get_display_view_colorspace_name(
+            in_path, display, view
+        )
+    ),
+    ("colorspace", "get_config_file_rules_colorspace_from_filepath"): (
+        lambda config_path, filepath: (
+            _get_config_file_rules_colorspace_from_filepath(
+                config_path, filepath
+            )
+        )
+    ),
+}
+
+
+def _process_server_request(request):
+    """Process single request received by server.
+
+    Args:
+        request (dict[str, Any]): Request with 'command_group', 'command'
+            and 'kwargs' keys.
+
+    Returns:
+        dict[str, Any]: Response with 'result' or 'error' key.
+    """
+    command_key = (request.get("command_group"), request.get("command"))
+    func = SERVER_COMMANDS.get(command_key)
+    if func is None:
+        return {"error": "Unknown command \"{}\"".format(
+            " ".join(str(part) for part in command_key)
+        )}
+
+    try:
+        return {"result": func(**request.get("kwargs", {}))}
+    except Exception as exc:
+        return {"error": "{}: {}".format(exc.__class__.__name__, exc)}
+
+
+@main.command(
+    name="server",
+    help=(
+        "run long-lived helper answering queries from stdin, "
+        "one json request per line"
+    )
+)
+def server():
+    """Answer OCIO queries received on stdin until it is closed.
+
+    Each request is a json line with 'command_group', 'command' and
+    'kwargs' keys matching the console commands. Response is written to
+    stdout as json line prefixed with `SERVER_RESPONSE_PREFIX`.
+
+    Example of use:
+    > python.exe ./ocio_wrapper.py server
+    """
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            request = json.loads(line)
+        except ValueError as exc:
+            response = {"error": "Invalid request: {}".format(exc)}
+        else:
+            response = _process_server_request(request)
+
+        sys.stdout.write(
+            "{}{}\n".format(SERVER_RESPONSE_PREFIX, json.dumps(response))
+        )
+        sys.stdout.flush()
+
+
 if __name__ == '__main__':
     main()
@@ -48,6 +48,16 @@ DATABASE_GLOBAL_SETTINGS_VERSIONED_KEY = GLOBAL_SETTINGS_KEY + _DATABASE_SUFFIX
 DATABASE_PROJECT_SETTINGS_VERSIONED_KEY = PROJECT_SETTINGS_KEY + _DATABASE_SUFFIX
 DATABASE_PROJECT_ANATOMY_VERSIONED_KEY = PROJECT_ANATOMY_KEY + _DATABASE_SUFFIX
 
+# Fully merged settings (defaults with overrides) without metadata
+_DATABASE_MATERIALIZED_SUFFIX = "_materialized"
+
+DATABASE_GLOBAL_SETTINGS_MATERIALIZED_KEY = (
+    GLOBAL_SETTINGS_KEY + _DATABASE_MATERIALIZED_SUFFIX
+)
+DATABASE_PROJECT_SETTINGS_MATERIALIZED_KEY = (
+    PROJECT_SETTINGS_KEY + _DATABASE_MATERIALIZED_SUFFIX
+)
+
 
 CORE_KEYS = {
     "remote_sources",
@@ -90,6 +100,8 @@ __all__ = (
     "DATABASE_GLOBAL_SETTINGS_VERSIONED_KEY",
     "DATABASE_PROJECT_SETTINGS_VERSIONED_KEY",
     "DATABASE_PROJECT_ANATOMY_VERSIONED_KEY",
+    "DATABASE_GLOBAL_SETTINGS_MATERIALIZED_KEY",
+    "DATABASE_PROJECT_SETTINGS_MATERIALIZED_KEY",
 
     "CORE_KEYS"
 )
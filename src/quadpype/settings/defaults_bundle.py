@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""Precompiled bundle of QuadPype default settings.
+
+Default settings are stored as a hierarchy of json files in 'defaults'
+directory. Build writes all of them into a single pickle file so a process
+doesn't have to parse each file. Bundle contains sha256 of the pickled
+defaults which is validated when the bundle is read.
+
+Bundle also stores signature of the source json files. When the json files
+differ from the files the bundle was created from, e.g. they were edited
+in a version directory or saved from settings UI, the bundle is ignored.
+Size and modification time of files are compared first, content hash is
+used when they differ (e.g. modification times changed on extraction).
+
+Module uses only standard library so it can be used by build scripts
+without importing QuadPype.
+"""
+import os
+import json
+import pickle
+import hashlib
+
+DEFAULTS_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "defaults"
+)
+DEFAULTS_BUNDLE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "defaults.pickle"
+)
+# Version of the bundle structure
+DEFAULTS_BUNDLE_VERSION = 2
+# Pickle protocol readable by Python interpreters of all supported DCCs
+_PICKLE_PROTOCOL = 4
+
+
+def _get_defaults_files(defaults_dir):
+    """Json files in defaults directory.
+
+    Returns:
+        list[tuple[str, str]]: Relative path with '/' separators and full
+            path of each json file sorted by relative path.
+    """
+    output = []
+    base_len = len(defaults_dir) + 1
+    for base, _directories, filenames in os.walk(defaults_dir):
+        for filename in filenames:
+            if os.path.splitext(filename)[1] != ".json":
+                continue
+            path = os.path.join(base, filename)
+            rel_path = path[base_len:].replace(os.path.sep, "/")
+            output.append((rel_path, path))
+    output.sort()
+    return output
+
+
+def _get_files_stats(files):
+    output = []
+    for rel_path, path in files:
+        stat = os.stat(path)
+        output.append((rel_path, stat.st_size, stat.st_mtime_ns))
+    return output
+
+
+def _get_files_hash(files):
+    content_hash = hashlib.sha256()
+    for rel_path, path in files:
+        content_hash.update(rel_path.encode("utf-8"))
+        with open(path, "rb") as stream:
+            content_hash.update(stream.read())
+    return content_hash.hexdigest()
+
+
+def _load_defaults_from_files(files):
+    output = {}
+    for rel_path, path in files:
+        with open(path, "r") as stream:
+            value = json.load(stream)
+
+        path_items = rel_path.split("/")
+        subdict = output
+        for key in path_items[:-1]:
+            subdict = subdict.setdefault(key, {})
+        subdict[os.path.splitext(path_items[-1])[0]] = value
+    return output
+
+
+def _is_source_matching(bundle, defaults_dir):
+    """Json files are the same as files the bundle was created from."""
+    if not os.path.isdir(defaults_dir):
+        # Nothing to compare with, bundle is the only source of defaults
+        return True
+
+    try:
+        files = _get_defaults_files(defaults_dir)
+        if [
+            tuple(item) for item in bundle.get("source_stats") or []
+        ] == _get_files_stats(files):
+            return True
+        return _get_files_hash(files) == bundle.get("source_hash")
+    except OSError:
+        return False
+
+
+def create_defaults_bundle(defaults_dir=None):
+    """Create content of defaults bundle.
+
+    Args:
+        defaults_dir (Optional[str]): Directory with default settings json
+            files.
+
+    Returns:
+        bytes: Content of bundle file.
+    """
+    if defaults_dir is None:
+        defaults_dir = DEFAULTS_DIR
+    files = _get_defaults_files(os.path.normpath(defaults_dir))
+    defaults_data = pickle.dumps(
+        _load_defaults_from_files(files), protocol=_PICKLE_PROTOCOL
+    )
+    return pickle.dumps(
+        {
+            "version": DEFAULTS_BUNDLE_VERSION,
+            "hash": hashlib.sha256(defaults_data).hexdigest(),
+            "defaults": defaults_data,
+            "source_stats": _get_files_stats(files),
+            "source_hash": _get_files_hash(files),
+        },
+        protocol=_PICKLE_PROTOCOL
+    )
+
+
+def write_defaults_bundle(bundle_path=None, defaults_dir=None):
+    """Write defaults bundle file.
+
+    Args:
+        bundle_path (Optional[str]): Path to output file.
+        defaults_dir (Optional[str]): Directory with default settings json
+            files.
+
+    Returns:
+        str: Path to written bundle.
+    """
+    if bundle_path is None:
+        bundle_path = DEFAULTS_BUNDLE_PATH
+
+    content = create_defaults_bundle(defaults_dir)
+    tmp_path = "{}.{}.tmp".format(bundle_path, os.getpid())
+    with open(tmp_path, "wb") as stream:
+        stream.write(content)
+    os.replace(tmp_path, bundle_path)
+    return bundle_path
+
+
+def read_defaults_bundle(bundle_path=None, defaults_dir=None):
+    """Read pickled defaults from bundle file.
+
+    Args:
+        bundle_path (Optional[str]): Path to bundle file.
+        defaults_dir (Optional[str]): Directory with default settings json
+            files the bundle is validated against.
+
+    Returns:
+        Union[bytes, None]: Pickled default settings or None if the bundle
+            does not exist, is invalid or json files were changed.
+    """
+    if bundle_path is None:
+        bundle_path = DEFAULTS_BUNDLE_PATH
+
+    if defaults_dir is None:
+        defaults_dir = DEFAULTS_DIR
+
+    try:
+        with open(bundle_path, "rb") as stream:
+            bundle = pickle.load(stream)
+    except Exception:  # noqa
+        return None
+
+    if (
+        not isinstance(bundle, dict)
+        or bundle.get("version") != DEFAULTS_BUNDLE_VERSION
+    ):
+        return None
+
+    defaults_data = bundle.get("defaults")
+    if (
+        not isinstance(defaults_data, bytes)
+        or hashlib.sha256(defaults_data).hexdigest() != bundle.get("hash")
+    ):
+        return None
+
+    if not _is_source_matching(bundle, os.path.normpath(defaults_dir)):
+        return None
+    return defaults_data
@@ -2,10 +2,13 @@ import os
 import re
 import json
 import copy
+import pickle
 import inspect
 import collections
 import contextlib
 
+import appdirs
+
 from .exceptions import (
     SchemaTemplateMissingKeys
 )
@@ -36,6 +39,9 @@ SCHEMA_EXTEND_TYPES = (
 
 template_key_pattern = re.compile(r"(\{.*?[^{0]*\})")
 
+# Version of the structure of schemas cache file
+SCHEMAS_CACHE_VERSION = 1
+
 
 class OverrideStateItem:
     """Object used as item for `OverrideState` enum.
@@ -412,23 +418,75 @@ class SchemasHub:
                 _gui_types.append(item)
         self._gui_types = tuple(_gui_types)
 
-    def _load_schemas(self):
-        """Load schema definitions from json files."""
+    def _get_schemas_cache_path(self):
+        return os.path.join(
+            appdirs.user_cache_dir("quadpype", "quad"),
+            "settings_schemas",
+            "{}.pickle".format(self.schema_type)
+        )
 
-        # Refresh all affecting variables
-        self._crashed_on_load = {}
-        self._loaded_templates = {}
-        self._loaded_schemas = {}
-        self._dynamic_schemas_by_id = {}
+    @staticmethod
+    def _get_schema_files_signature(dirpath):
+        """Signature of schema json files based on their modification time.
 
-        dirpath = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)),
-            "schemas",
-            self.schema_type
-        )
+        Returns:
+            list[tuple[str, int, int]]: Relative path, modification time
+                and size of each file.
+        """
+        signature = []
+        for root, _, filenames in os.walk(dirpath):
+            for filename in filenames:
+                if os.path.splitext(filename)[1] != ".json":
+                    continue
+                filepath = os.path.join(root, filename)
+                stat = os.stat(filepath)
+                signature.append((
+                    os.path.relpath(filepath, dirpath),
+                    stat.st_mtime_ns,
+                    stat.st_size
+                ))
+        signature.sort()
+        return signature
+
+    def _read_schemas_cache(self, dirpath, signature):
+        try:
+            with open(self._get_schemas_cache_path(), "rb") as stream:
+                cache_data = pickle.load(stream)
+        except Exception:  # noqa
+            return None
+
+        if (
+            not isinstance(cache_data, dict)
+            or cache_data.get("version") != SCHEMAS_CACHE_VERSION
+            or cache_data.get("dirpath") != dirpath
+            or cache_data.get("signature") != signature
+        ):
+            return None
+        return cache_data["schemas"], cache_data["templates"]
+
+    def _write_schemas_cache(self, dirpath, signature, schemas, templates):
+        cache_path = self._get_schemas_cache_path()
+        tmp_path = "{}.{}.tmp".format(cache_path, os.getpid())
+        cache_data = {
+            "version": SCHEMAS_CACHE_VERSION,
+            "dirpath": dirpath,
+            "signature": signature,
+            "schemas": schemas,
+            "templates": templates,
+        }
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(tmp_path, "wb") as stream:
+                pickle.dump(cache_data, stream)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # Cache is optional
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _load_schemas_from_dir(self, dirpath):
         loaded_schemas = {}
         loaded_templates = {}
-        dynamic_schemas_by_id = {}
         for root, _, filenames in os.walk(dirpath):
             for filename in filenames:
                 basename, ext = os.path.splitext(filename)
@@ -477,7 +535,41 @@ class SchemasHub:
                             )
                         )
                     loaded_schemas[basename] = schema_data
+        return loaded_schemas, loaded_templates
+
+    def _load_schemas(self):
+        """Load schema definitions from json files.
+
+        Parsed json files are cached on disk and cache is used until any of
+        the files is changed, added or removed.
+        """
+
+        # Refresh all affecting variables
+        self._crashed_on_load = {}
+        self._loaded_templates = {}
+        self._loaded_schemas = {}
+        self._dynamic_schemas_by_id = {}
 
+        dirpath = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            "schemas",
+            self.schema_type
+        )
+        signature = self._get_schema_files_signature(dirpath)
+        cached = self._read_schemas_cache(dirpath, signature)
+        if cached is not None:
+            loaded_schemas, loaded_templates = cached
+        else:
+            loaded_schemas, loaded_templates = self._load_schemas_from_dir(
+                dirpath
+            )
+            # Crashed files must be reported on each load
+            if not self._crashed_on_load:
+                self._write_schemas_cache(
+                    dirpath, signature, loaded_schemas, loaded_templates
+                )
+
+        dynamic_schemas_by_id = {}
         defs_iter = self._dynamic_schemas_defs_by_id.items()
         for def_id, module_settings_def in defs_iter:
             dynamic_schemas_by_id[def_id] = (
@@ -6,19 +6,26 @@ import platform
 from datetime import datetime, timezone
 from abc import ABC, abstractmethod
 
+from pymongo import UpdateOne, InsertOne, ReplaceOne
+
 import quadpype.version
 from quadpype.client.mongo import (
     QuadPypeMongoConnection,
     get_project_connection,
 )
-from quadpype.client import get_project, save_project_timestamp
+from quadpype.client import (
+    get_project,
+    get_projects,
+    save_project_timestamp
+)
 from quadpype.lib import (
     get_user_workstation_info,
     get_user_id,
     CoreSettingsCacheValues,
     GlobalSettingsCacheValues,
     ProjectSettingsCacheValues,
-    ProjectAnatomyCacheValues
+    ProjectAnatomyCacheValues,
+    MaterializedSettingsCacheValues
 )
 from quadpype.lib.version import PackageVersion, get_package
 from .constants import (
@@ -29,21 +36,30 @@ from .constants import (
     PROJECT_SETTINGS_KEY,
     PROJECT_ANATOMY_KEY,
     M_OVERRIDDEN_KEY,
+    METADATA_KEYS,
 
     APPS_SETTINGS_KEY,
 
     DATABASE_GLOBAL_SETTINGS_VERSIONED_KEY,
     DATABASE_PROJECT_SETTINGS_VERSIONED_KEY,
-    DATABASE_PROJECT_ANATOMY_VERSIONED_KEY
+    DATABASE_PROJECT_ANATOMY_VERSIONED_KEY,
+    DATABASE_GLOBAL_SETTINGS_MATERIALIZED_KEY,
+    DATABASE_PROJECT_SETTINGS_MATERIALIZED_KEY
 )
 from .lib import (
     apply_core_settings,
+    calculate_settings_diff,
     check_version_order,
     get_versions_order_doc,
     find_closest_settings_id,
     find_closest_settings,
+    get_default_settings_hash,
     get_global_settings_overrides_doc,
-    get_global_settings_overrides_for_version_doc
+    get_global_settings_overrides_for_version_doc,
+    is_materialized_settings_enabled,
+    resolve_global_settings,
+    resolve_default_project_settings,
+    resolve_project_settings
 )
 
 
@@ -577,6 +593,7 @@ class MongoSettingsHandler(SettingsHandler):
         self.global_settings_cache = GlobalSettingsCacheValues()
         self.project_settings_cache = collections.defaultdict(ProjectSettingsCacheValues)
         self.project_anatomy_cache = collections.defaultdict(ProjectAnatomyCacheValues)
+        self.materialized_settings_cache = {}
 
     def _prepare_project_settings_keys(self):
         from .entities import ProjectSettingsEntity
@@ -661,6 +678,12 @@ class MongoSettingsHandler(SettingsHandler):
         Args:
             data(dict): Data of studio overrides with override metadata.
         """
+        previous_data = self._get_previous_cache_data(
+            self.global_settings_cache
+        )
+        if previous_data is not None:
+            self._extract_core_settings(previous_data)
+
         # Update cache
         self.global_settings_cache.update_data(data, self._current_version)
 
@@ -704,36 +727,35 @@ class MongoSettingsHandler(SettingsHandler):
             "data": global_settings_data,
             "last_saved_info": last_saved_info.to_document_data()
         }
-        if not global_settings_doc:
-            self.collection.insert_one(new_global_settings_doc)
-        else:
-            self.collection.update_one(
-                {"_id": global_settings_doc["_id"]},
-                {"$set": new_global_settings_doc}
+        operations = [
+            self._get_settings_doc_operation(
+                global_settings_doc,
+                new_global_settings_doc,
+                previous_data
+            ),
+            # Add or update the core settings in the database
+            ReplaceOne(
+                {"type": CORE_SETTINGS_DOC_KEY},
+                {
+                    "type": CORE_SETTINGS_DOC_KEY,
+                    "data": core_settings
+                },
+                upsert=True
             )
+        ]
+        self.collection.bulk_write(operations)
 
         save_project_timestamp(
             project_name='global',
             updated_entity='settings'
         )
-
-        # Add or update the core settings in the database
-        self.collection.replace_one(
-            {
-                "type": CORE_SETTINGS_DOC_KEY
-            },
-            {
-                "type": CORE_SETTINGS_DOC_KEY,
-                "data": core_settings
-            },
-            upsert=True
-        )
-
         save_project_timestamp(
             project_name='core',
             updated_entity='settings'
         )
 
+        self._materialize_global_settings()
+
     def save_project_settings(self, project_name, overrides):
         """Save studio overrides of project settings.
 
@@ -751,6 +773,7 @@ class MongoSettingsHandler(SettingsHandler):
             overrides(dict): Data of project overrides with override metadata.
         """
         data_cache = self.project_settings_cache[project_name]
+        previous_data = self._get_previous_cache_data(data_cache)
         data_cache.update_data(overrides, self._current_version)
 
         last_saved_info = SettingsStateInfo.create_new(
@@ -765,7 +788,8 @@ class MongoSettingsHandler(SettingsHandler):
             project_name,
             DATABASE_PROJECT_SETTINGS_VERSIONED_KEY,
             data_cache,
-            last_saved_info
+            last_saved_info,
+            previous_data
         )
 
         save_project_timestamp(
@@ -773,6 +797,8 @@ class MongoSettingsHandler(SettingsHandler):
             updated_entity='settings'
         )
 
+        self._materialize_project_settings(project_name)
+
     def save_project_anatomy(self, project_name, anatomy_data):
         """Save studio overrides of project anatomy data.
 
@@ -782,6 +808,7 @@ class MongoSettingsHandler(SettingsHandler):
             anatomy_data(dict): Data of project overrides with override metadata.
         """
         data_cache = self.project_anatomy_cache[project_name]
+        previous_data = self._get_previous_cache_data(data_cache)
         data_cache.update_data(anatomy_data, self._current_version)
 
         if project_name is not None:
@@ -797,7 +824,8 @@ class MongoSettingsHandler(SettingsHandler):
                 project_name,
                 DATABASE_PROJECT_ANATOMY_VERSIONED_KEY,
                 data_cache,
-                last_saved_info
+                last_saved_info,
+                previous_data
             )
 
         save_project_timestamp(
@@ -805,20 +833,244 @@ class MongoSettingsHandler(SettingsHandler):
             updated_entity='settings'
         )
 
+    def _get_materialized_settings_cache(self, doc_type, project_name):
+        key = (doc_type, project_name)
+        cache = self.materialized_settings_cache.get(key)
+        if cache is None:
+            # Use names of the timestamps stored on save
+            if doc_type == DATABASE_GLOBAL_SETTINGS_MATERIALIZED_KEY:
+                name = "global"
+            else:
+                name = project_name or "default_project"
+            cache = MaterializedSettingsCacheValues(name)
+            self.materialized_settings_cache[key] = cache
+        return cache
+
+    def _get_materialized_settings_filter(self, doc_type, project_name):
+        # Defaults of addons are merged in materialized settings so they must
+        #   match too, not just the QuadPype version
+        return {
+            "type": doc_type,
+            "project_name": project_name,
+            "version": self._current_version,
+            "defaults_hash": get_default_settings_hash()
+        }
+
+    def get_materialized_settings(self, doc_type, project_name=None):
+        """Fully merged settings stored on save for current version.
+
+        Args:
+            doc_type (str): Type of materialized settings document.
+            project_name (Optional[str]): Project name or None for global
+                settings and default project settings.
+
+        Returns:
+            Union[dict, None]: Settings without metadata or None if document
+                for current version is not stored.
+        """
+        cache = self._get_materialized_settings_cache(doc_type, project_name)
+        if cache.is_outdated:
+            document = self.collection.find_one(
+                self._get_materialized_settings_filter(doc_type, project_name)
+            )
+            cache.update_from_document(document, self._current_version)
+
+        if not cache.data:
+            return None
+        return cache.data_copy()
+
+    def _store_materialized_settings(self, doc_type, project_name, data):
+        query_filter = self._get_materialized_settings_filter(
+            doc_type, project_name
+        )
+        # Documents of other versions or addons may be merged from previous
+        #   overrides
+        self.collection.delete_many({
+            "type": doc_type,
+            "project_name": project_name,
+            "$or": [
+                {"version": {"$ne": query_filter["version"]}},
+                {"defaults_hash": {"$ne": query_filter["defaults_hash"]}}
+            ]
+        })
+        self.collection.replace_one(
+            query_filter,
+            {**query_filter, "data": data},
+            upsert=True
+        )
+
+        cache = self._get_materialized_settings_cache(doc_type, project_name)
+        cache.update_data(data, self._current_version)
+
+    def _materialize_global_settings(self):
+        doc_type = DATABASE_GLOBAL_SETTINGS_MATERIALIZED_KEY
+        # Decide from saved settings, value set on bootstrap of this process
+        #   may be already changed
+        global_settings = resolve_global_settings()
+        if not is_materialized_settings_enabled(global_settings):
+            # Stored documents would be outdated
+            self.collection.delete_many({
+                "type": {"$in": [
+                    doc_type,
+                    DATABASE_PROJECT_SETTINGS_MATERIALIZED_KEY
+                ]}
+            })
+            return
+
+        self._store_materialized_settings(doc_type, None, global_settings)
+
+    def _materialize_project_settings(self, project_name):
+        doc_type = DATABASE_PROJECT_SETTINGS_MATERIALIZED_KEY
+        enabled = is_materialized_settings_enabled(resolve_global_settings())
+        if project_name:
+            if not enabled:
+                self.collection.delete_many({
+                    "type": doc_type,
+                    "project_name": project_name
+                })
+                return
+
+            self._store_materialized_settings(
+                doc_type,
+                project_name,
+                resolve_project_settings(project_name)
+            )
+            return
+
+        # Default project overrides are used by all projects
+        self.collection.delete_many({"type": doc_type})
+        if not enabled:
+            return
+
+        self._store_materialized_settings(
+            doc_type, None, resolve_default_project_settings()
+        )
+        for project_doc in get_projects(fields=["name"]):
+            project_name = project_doc["name"]
+            # Overrides may have been changed by another process
+            self.project_settings_cache[project_name].set_outdated()
+            self._store_materialized_settings(
+                doc_type,
+                project_name,
+                resolve_project_settings(project_name)
+            )
+            save_project_timestamp(
+                project_name=project_name,
+                updated_entity='settings'
+            )
+
+    def _get_previous_cache_data(self, data_cache):
+        """Copy of cached data which are stored for current version.
+
+        Returns:
+            Union[dict, None]: Cached data or None if cache is empty or
+                data are from a different version.
+        """
+        if (
+            data_cache.data is None
+            or data_cache.version != self._current_version
+        ):
+            return None
+        return data_cache.data_copy()
+
+    @staticmethod
+    def _get_field_key_path(key_path):
+        # Keys with '.' or starting with '$' can't be used in field path
+        for idx, key in enumerate(key_path):
+            if "." in key or key.startswith("$"):
+                return key_path[:idx]
+        # Metadata lists describe values of their parent dictionary, the
+        #   parent is written as a whole so they're always in sync
+        if key_path and key_path[-1] in METADATA_KEYS:
+            return key_path[:-1]
+        return key_path
+
     @classmethod
-    def prepare_mongo_update_dict(cls, in_data):
-        data = {}
-        for key, value in in_data.items():
-            if not isinstance(value, dict):
-                data[key] = value
+    def get_settings_update(cls, old_data, new_data, field_name="data"):
+        """Update operators with minimal changes of settings data.
+
+        Values of keys which can't be part of field path and dictionaries
+        with changed metadata are replaced as a whole.
+
+        Args:
+            old_data (dict): Data stored in document.
+            new_data (dict): New data.
+            field_name (str): Document field where data are stored.
+
+        Returns:
+            dict: Update with '$set' and '$unset' operators.
+        """
+        to_set, to_unset = calculate_settings_diff(old_data, new_data)
+        set_paths = {
+            cls._get_field_key_path(key_path)
+            for key_path in to_set
+        }
+        unset_paths = set()
+        for key_path in to_unset:
+            field_key_path = cls._get_field_key_path(key_path)
+            if field_key_path == key_path:
+                unset_paths.add(key_path)
+            else:
+                set_paths.add(field_key_path)
+
+        def _is_covered(key_path):
+            return any(
+                key_path[:idx] in set_paths
+                for idx in range(len(key_path))
+            )
+
+        update_set = {}
+        for key_path in set_paths:
+            if _is_covered(key_path):
                 continue
+            value = new_data
+            for key in key_path:
+                value = value[key]
+            update_set[".".join((field_name, ) + key_path)] = value
+
+        update_unset = {
+            ".".join((field_name, ) + key_path): ""
+            for key_path in unset_paths
+            if not _is_covered(key_path)
+        }
 
-            new_value = cls.prepare_mongo_update_dict(value)
-            for _key, _value in new_value.items():
-                new_key = ".".join((key, _key))
-                data[new_key] = _value
+        update = {}
+        if update_set:
+            update["$set"] = update_set
+        if update_unset:
+            update["$unset"] = update_unset
+        return update
 
-        return data
+    def _get_settings_doc_operation(self, document, new_document, previous_data):
+        """Database operation storing settings document.
+
+        Only changes of data are written when stored data of current version
+        are known, so concurrent changes of other keys are kept.
+
+        Args:
+            document (Union[dict, None]): Stored document with '_id' or None
+                if document does not exist.
+            new_document (dict): Full new document.
+            previous_data (Union[dict, None]): Data stored in the document.
+        """
+        if not document:
+            return InsertOne(new_document)
+
+        if previous_data is None:
+            return UpdateOne(
+                {"_id": document["_id"]},
+                {"$set": new_document}
+            )
+
+        update = self.get_settings_update(
+            previous_data, new_document["data"]
+        )
+        update.setdefault("$set", {}).update({
+            key: value
+            for key, value in new_document.items()
+            if key != "data"
+        })
+        return UpdateOne({"_id": document["_id"]}, update)
 
     def save_change_log(self, project_name, changes, settings_type):
         """Log all settings changes to separate collection"""
@@ -859,17 +1111,18 @@ class MongoSettingsHandler(SettingsHandler):
 
         collection = get_project_connection(project_name)
         # Project's data
-        update_dict_data = {}
         project_doc_data = project_doc.get("data") or {}
         attributes = new_data.pop("attributes", {})
         _applications = attributes.pop(APPS_SETTINGS_KEY, None) or []
-        for key, value in attributes.items():
-            if (
-                key in project_doc_data
-                and project_doc_data[key] == value
-            ):
-                continue
-            update_dict_data[key] = value
+        # Other keys of project data are not part of anatomy attributes
+        update_data = self.get_settings_update(
+            {
+                key: project_doc_data[key]
+                for key in attributes.keys()
+                if key in project_doc_data
+            },
+            attributes
+        )
 
         update_dict_config = {}
 
@@ -888,28 +1141,26 @@ class MongoSettingsHandler(SettingsHandler):
                 continue
             update_dict_config[key] = value
 
-        if not update_dict_data and not update_dict_config:
+        if not update_data and not update_dict_config:
             return
 
-        data_changes = self.prepare_mongo_update_dict(update_dict_data)
-
         # Update dictionary of changes that will be changed in mongo
-        update_dict = {}
-        for key, value in data_changes.items():
-            new_key = "data.{}".format(key)
-            update_dict[new_key] = value
-
         for key, value in update_dict_config.items():
             new_key = "config.{}".format(key)
-            update_dict[new_key] = value
+            update_data.setdefault("$set", {})[new_key] = value
 
         collection.update_one(
             {"type": "project"},
-            {"$set": update_dict}
+            update_data
         )
 
     def _save_project_data(
-        self, project_name, doc_type, data_cache, last_saved_info
+        self,
+        project_name,
+        doc_type,
+        data_cache,
+        last_saved_info,
+        previous_data=None
     ):
         is_default = bool(project_name is None)
         query_filter = {
@@ -934,13 +1185,13 @@ class MongoSettingsHandler(SettingsHandler):
             query_filter,
             {"_id": True}
         )
-        if project_settings_doc:
-            self.collection.update_one(
-                {"_id": project_settings_doc["_id"]},
-                {"$set": new_project_settings_doc}
+        self.collection.bulk_write([
+            self._get_settings_doc_operation(
+                project_settings_doc,
+                new_project_settings_doc,
+                previous_data
             )
-        else:
-            self.collection.insert_one(new_project_settings_doc)
+        ])
 
     def _apply_core_settings_changes_to_package_instance(self, new_core_settings):
         """Apply the new changes of the core settings to the QuadPype package instance."""
@@ -1297,6 +1548,9 @@ class MongoSettingsHandler(SettingsHandler):
             "type": DATABASE_GLOBAL_SETTINGS_VERSIONED_KEY,
             "version": version
         })
+        self.collection.delete_many({
+            "type": DATABASE_GLOBAL_SETTINGS_MATERIALIZED_KEY
+        })
 
     def clear_studio_project_settings_overrides_for_version(self, version):
         self.collection.delete_one({
@@ -1304,6 +1558,9 @@ class MongoSettingsHandler(SettingsHandler):
             "version": version,
             "is_default": True
         })
+        self.collection.delete_many({
+            "type": DATABASE_PROJECT_SETTINGS_MATERIALIZED_KEY
+        })
 
     def clear_studio_project_anatomy_overrides_for_version(self, version):
         self.collection.delete_one({
@@ -1319,6 +1576,10 @@ class MongoSettingsHandler(SettingsHandler):
             "version": version,
             "project_name": project_name
         })
+        self.collection.delete_many({
+            "type": DATABASE_PROJECT_SETTINGS_MATERIALIZED_KEY,
+            "project_name": project_name
+        })
 
     def _sort_versions(self, versions):
         """Sort versions.
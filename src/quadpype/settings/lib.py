@@ -1,5 +1,8 @@
 import os
+import sys
 import json
+import pickle
+import hashlib
 import functools
 import logging
 import platform
@@ -17,6 +20,7 @@ from semver import VersionInfo
 from .exceptions import (
     SaveWarningExc
 )
+from .defaults_bundle import read_defaults_bundle
 from .constants import (
     M_OVERRIDDEN_KEY,
 
@@ -39,7 +43,9 @@ from .constants import (
 
     DATABASE_ALL_VERSIONS_KEY,
     DATABASE_VERSIONS_ORDER,
-    DATABASE_GLOBAL_SETTINGS_VERSIONED_KEY
+    DATABASE_GLOBAL_SETTINGS_VERSIONED_KEY,
+    DATABASE_GLOBAL_SETTINGS_MATERIALIZED_KEY,
+    DATABASE_PROJECT_SETTINGS_MATERIALIZED_KEY
 )
 
 log = logging.getLogger(__name__)
@@ -49,27 +55,66 @@ JSON_EXC = getattr(json.decoder, "JSONDecodeError", ValueError)
 
 # Variable where cache of default settings are stored
 _DEFAULT_SETTINGS = None
+_DEFAULT_SETTINGS_HASH = None
+
+# Pickled QuadPype default settings, unpickling is faster than deepcopy
+_QUADPYPE_DEFAULT_SETTINGS_DATA = None
 
 # Handler for studio overrides
 _SETTINGS_HANDLER = None
 
 
-def calculate_changes(old_value, new_value):
-    changes = {}
+def _calculate_settings_diff(old_value, new_value, path, to_set, to_unset):
     for key, value in new_value.items():
+        key_path = path + (key,)
         if key not in old_value:
-            changes[key] = value
+            to_set[key_path] = value
             continue
 
         _value = old_value[key]
         if isinstance(value, dict) and isinstance(_value, dict):
-            _changes = calculate_changes(_value, value)
-            if _changes:
-                changes[key] = _changes
-            continue
+            _calculate_settings_diff(_value, value, key_path, to_set, to_unset)
+
+        elif _value != value:
+            to_set[key_path] = value
+
+    for key in old_value:
+        if key not in new_value:
+            to_unset.append(path + (key,))
+
+
+def calculate_settings_diff(old_value, new_value):
+    """Minimal changes which transform old settings value to new value.
+
+    Dictionaries are compared recursively, any other values are compared
+    as a whole.
+
+    Args:
+        old_value (dict): Previous value.
+        new_value (dict): New value.
+
+    Returns:
+        tuple[dict[tuple[str, ...], Any], list[tuple[str, ...]]]: New values
+            by key path and key paths which were removed.
+    """
+    to_set = {}
+    to_unset = []
+    _calculate_settings_diff(old_value, new_value, tuple(), to_set, to_unset)
+    return to_set, to_unset
+
 
-        if _value != value:
-            changes[key] = value
+def calculate_changes(old_value, new_value):
+    """Changed values of settings in hierarchy of the settings.
+
+    Removed keys are not part of the output.
+    """
+    to_set, _ = calculate_settings_diff(old_value, new_value)
+    changes = {}
+    for key_path, value in to_set.items():
+        subdict = changes
+        for key in key_path[:-1]:
+            subdict = subdict.setdefault(key, {})
+        subdict[key_path[-1]] = value
     return changes
 
 
@@ -490,9 +535,11 @@ def clear_project_settings_overrides_for_version(
 
 
 def reset_default_settings():
-    """Reset cache of default settings. Can't be used now."""
+    """Reset cache of default settings."""
     global _DEFAULT_SETTINGS
+    global _QUADPYPE_DEFAULT_SETTINGS_DATA
     _DEFAULT_SETTINGS = None
+    _QUADPYPE_DEFAULT_SETTINGS_DATA = None
 
 
 def _get_default_settings():
@@ -546,6 +593,25 @@ def get_default_settings():
     return copy.deepcopy(_DEFAULT_SETTINGS)
 
 
+def get_default_settings_hash():
+    """Hash of default settings including defaults of addons.
+
+    Defaults are part of materialized settings so documents stored by a
+    process with different addons must not be used.
+
+    Returns:
+        str: Hash of default settings.
+    """
+    global _DEFAULT_SETTINGS_HASH
+    if _DEFAULT_SETTINGS_HASH is None:
+        get_default_settings()
+        content = json.dumps(_DEFAULT_SETTINGS, sort_keys=True, default=str)
+        _DEFAULT_SETTINGS_HASH = hashlib.sha256(
+            content.encode("utf-8")
+        ).hexdigest()
+    return _DEFAULT_SETTINGS_HASH
+
+
 def _apply_applications_settings_override(global_settings, user_settings):
     current_platform = platform.system().lower()
     apps_settings = global_settings[APPS_SETTINGS_KEY]
@@ -768,8 +834,37 @@ def apply_user_settings_on_project_settings(
         sync_server_config["remote_site"] = remote_site
 
 
-def get_global_settings(clear_metadata=True, exclude_locals=None):
-    """Global settings with applied studio overrides."""
+def is_materialized_settings_enabled(global_settings=None):
+    """Materialized settings documents are stored and used.
+
+    Value for running process is set on bootstrap based on core settings.
+
+    Args:
+        global_settings (Optional[dict]): Global settings which decide
+            instead of value set on bootstrap, e.g. settings being saved.
+
+    Returns:
+        bool: Materialized settings are enabled.
+    """
+    if global_settings is not None:
+        core_settings = global_settings.get(CORE_SETTINGS_KEY) or {}
+        projects_settings = core_settings.get("projects") or {}
+        return bool(projects_settings.get("use_materialized_settings"))
+    return os.getenv("QUADPYPE_USE_MATERIALIZED_SETTINGS") == "1"
+
+
+@require_settings_handler
+def _get_materialized_settings(doc_type, project_name=None):
+    if not is_materialized_settings_enabled():
+        return None
+    return _SETTINGS_HANDLER.get_materialized_settings(doc_type, project_name)
+
+
+def resolve_global_settings(clear_metadata=True):
+    """Global settings merged from defaults and studio overrides.
+
+    Materialized settings and user settings are not used.
+    """
     default_values = get_default_settings()[GLOBAL_SETTINGS_KEY]
     studio_values = get_studio_global_settings_overrides()
     result = apply_overrides(default_values, studio_values)
@@ -777,6 +872,19 @@ def get_global_settings(clear_metadata=True, exclude_locals=None):
     # Clear overrides metadata from settings
     if clear_metadata:
         clear_metadata_from_settings(result)
+    return result
+
+
+def get_global_settings(clear_metadata=True, exclude_locals=None):
+    """Global settings with applied studio overrides."""
+    result = None
+    if clear_metadata:
+        result = _get_materialized_settings(
+            DATABASE_GLOBAL_SETTINGS_MATERIALIZED_KEY
+        )
+
+    if result is None:
+        result = resolve_global_settings(clear_metadata)
 
     # Apply user settings
     # Default behavior is based on `clear_metadata` value
@@ -792,14 +900,30 @@ def get_global_settings(clear_metadata=True, exclude_locals=None):
     return result
 
 
-def get_default_project_settings(clear_metadata=True, exclude_locals=None):
-    """Project settings with applied studio's default project overrides."""
+def resolve_default_project_settings(clear_metadata=True):
+    """Project settings merged from defaults and default project overrides.
+
+    Materialized settings and user settings are not used.
+    """
     default_values = get_default_settings()[PROJECT_SETTINGS_KEY]
     studio_values = get_studio_project_settings_overrides()
     result = apply_overrides(default_values, studio_values)
     # Clear overrides metadata from settings
     if clear_metadata:
         clear_metadata_from_settings(result)
+    return result
+
+
+def get_default_project_settings(clear_metadata=True, exclude_locals=None):
+    """Project settings with applied studio's default project overrides."""
+    result = None
+    if clear_metadata:
+        result = _get_materialized_settings(
+            DATABASE_PROJECT_SETTINGS_MATERIALIZED_KEY
+        )
+
+    if result is None:
+        result = resolve_default_project_settings(clear_metadata)
 
     # Apply user settings
     if exclude_locals is None:
@@ -874,17 +998,18 @@ def get_anatomy_settings(
     return result
 
 
-def _get_project_settings(
-    project_name, clear_metadata=True, exclude_locals=None
-):
-    """Project settings with applied studio and project overrides."""
+def resolve_project_settings(project_name, clear_metadata=True):
+    """Project settings merged from defaults, studio and project overrides.
+
+    Materialized settings and user settings are not used.
+    """
     if not project_name:
         raise ValueError(
             "Must enter project name."
-            " Call `get_default_project_settings` to get project defaults."
+            " Call `resolve_default_project_settings` to get project defaults."
         )
 
-    studio_overrides = get_default_project_settings(False)
+    studio_overrides = resolve_default_project_settings(False)
     project_overrides = get_project_settings_overrides(
         project_name
     )
@@ -894,6 +1019,27 @@ def _get_project_settings(
     # Clear overrides metadata from settings
     if clear_metadata:
         clear_metadata_from_settings(result)
+    return result
+
+
+def _get_project_settings(
+    project_name, clear_metadata=True, exclude_locals=None
+):
+    """Project settings with applied studio and project overrides."""
+    if not project_name:
+        raise ValueError(
+            "Must enter project name."
+            " Call `get_default_project_settings` to get project defaults."
+        )
+
+    result = None
+    if clear_metadata:
+        result = _get_materialized_settings(
+            DATABASE_PROJECT_SETTINGS_MATERIALIZED_KEY, project_name
+        )
+
+    if result is None:
+        result = resolve_project_settings(project_name, clear_metadata)
 
     # Apply user settings
     if exclude_locals is None:
@@ -1076,9 +1222,41 @@ def subkey_merge(_dict, value, keys):
     return _dict
 
 
+def _is_defaults_bundle_used():
+    # Bundle is shipped only with frozen builds and version zips, both have
+    #   'checksums' file next to 'quadpype' package
+    if getattr(sys, "frozen", False):
+        return True
+    quadpype_root = os.path.dirname(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )
+    return os.path.exists(os.path.join(quadpype_root, "checksums"))
+
+
 def load_quadpype_default_settings():
-    """Load QuadPype default settings."""
-    return load_jsons_from_dir(DEFAULTS_DIR)
+    """Load QuadPype default settings.
+
+    Builds load defaults from precompiled bundle, json files are used by
+    live code or when json files differ from files the bundle was created
+    from. Defaults are loaded once per process, each call returns new copy
+    which can be modified.
+
+    Returns:
+        dict: Loaded default settings.
+    """
+    global _QUADPYPE_DEFAULT_SETTINGS_DATA
+    if _QUADPYPE_DEFAULT_SETTINGS_DATA is None:
+        defaults_data = None
+        if _is_defaults_bundle_used():
+            defaults_data = read_defaults_bundle(defaults_dir=DEFAULTS_DIR)
+
+        if defaults_data is None:
+            defaults_data = pickle.dumps(
+                load_jsons_from_dir(DEFAULTS_DIR),
+                protocol=pickle.HIGHEST_PROTOCOL
+            )
+        _QUADPYPE_DEFAULT_SETTINGS_DATA = defaults_data
+    return pickle.loads(_QUADPYPE_DEFAULT_SETTINGS_DATA)
 
 
 def clear_metadata_from_settings(values):
@@ -0,0 +1,96 @@
+# Import time regression tests of packages with lazy exports
+import os
+import sys
+import subprocess
+
+import pytest
+
+# Budget of cumulative import time in microseconds
+IMPORT_TIME_BUDGETS = {
+    "quadpype.client": 50000,
+    "quadpype.pipeline": 150000,
+    "quadpype.lib": 1000000,
+}
+# Budgets can be scaled on slow machines
+BUDGET_SCALE = float(os.getenv("QUADPYPE_IMPORT_TIME_BUDGET_SCALE") or 1.0)
+
+# Submodules which must not be imported by importing the package
+HEAVY_SUBMODULES = (
+    "quadpype.lib.applications",
+    "quadpype.lib.transcoding",
+    "quadpype.lib.attribute_definitions",
+    "quadpype.pipeline.anatomy",
+    "quadpype.pipeline.create",
+    "quadpype.pipeline.load",
+    "quadpype.client.mongo.entities",
+)
+
+
+def _run_python(code, *args):
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        capture_output=True,
+        text=True
+    )
+
+
+def _get_cumulative_import_time(package_name):
+    """Cumulative import time of package in microseconds."""
+    result = _run_python("import {}".format(package_name), "-X", "importtime")
+    if result.returncode != 0:
+        pytest.skip("'{}' can't be imported: {}".format(
+            package_name, result.stderr.strip().splitlines()[-1]
+        ))
+
+    # Line format: 'import time: <self> | <cumulative> | <indent><name>'
+    for line in result.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == package_name:
+            return int(parts[1].strip())
+    raise AssertionError(
+        "Import time of '{}' was not reported".format(package_name)
+    )
+
+
+@pytest.mark.parametrize("package_name", sorted(IMPORT_TIME_BUDGETS))
+def test_import_time_budget(package_name):
+    budget = IMPORT_TIME_BUDGETS[package_name] * BUDGET_SCALE
+    import_time = _get_cumulative_import_time(package_name)
+    assert import_time <= budget, (
+        "Import of '{}' took {}us, budget is {}us".format(
+            package_name, import_time, int(budget)
+        )
+    )
+
+
+def test_heavy_submodules_are_lazy():
+    code = (
+        "import sys\n"
+        "import quadpype.lib, quadpype.pipeline, quadpype.client\n"
+        "print('\\n'.join(sys.modules))\n"
+    )
+    result = _run_python(code)
+    if result.returncode != 0:
+        pytest.skip("QuadPype packages can't be imported")
+
+    imported = set(result.stdout.splitlines())
+    for module_name in HEAVY_SUBMODULES:
+        assert module_name not in imported, (
+            "'{}' is imported eagerly".format(module_name)
+        )
+
+
+def test_lazy_exports_are_available():
+    from quadpype import client, pipeline
+
+    for package in (client, pipeline):
+        for name in package.__all__:
+            # Access the attribute so the lazy import is processed
+            try:
+                getattr(package, name)
+            except ModuleNotFoundError as exc:
+                if (exc.name or "").startswith("quadpype"):
+                    raise
+                pytest.skip("'{}.{}' can't be imported: {}".format(
+                    package.__name__, name, exc
+                ))
@@ -0,0 +1,120 @@
+import time
+
+import pytest
+
+control = pytest.importorskip("quadpype.tools.publisher.control")
+
+
+class _StubHost:
+    """Host without any creation or publishing logic."""
+
+    name = "test"
+
+
+class _PublishReport:
+    def __init__(self):
+        self.results = []
+
+    def add_result(self, result):
+        self.results.append(result)
+
+
+@pytest.fixture
+def create_controller(monkeypatch):
+    from quadpype.pipeline import register_host, deregister_host
+
+    register_host(_StubHost())
+    controllers = []
+
+    def _create_controller(max_workers, process_func):
+        monkeypatch.setattr(control, "process_plugin_in_thread", process_func)
+        monkeypatch.setattr(
+            control, "get_publish_instance_label", lambda instance: instance
+        )
+
+        controller = control.PublisherController(headless=True)
+        controllers.append(controller)
+        controller._publish_max_workers = max_workers
+        controller._publish_report = _PublishReport()
+
+        finished = []
+        monkeypatch.setattr(
+            controller,
+            "_publish_next_process",
+            lambda: finished.append(True)
+        )
+        controller.publish_is_running = True
+        return controller, finished
+
+    yield _create_controller
+
+    for controller in controllers:
+        controller._shutdown_publish_executor()
+    deregister_host()
+
+
+def _get_result_instances(controller):
+    return [
+        result["instance"] for result in controller._publish_report.results
+    ]
+
+
+def test_results_are_handled_in_instance_order(create_controller):
+    instances = ["instance_{}".format(idx) for idx in range(6)]
+
+    def _process(plugin, context, instance):
+        # First instances finish last
+        time.sleep(0.05 * (len(instances) - instances.index(instance)))
+        return {"instance": instance, "error": None}
+
+    controller, finished = create_controller(3, _process)
+    controller._process_in_threads_and_continue(None, instances)
+
+    assert _get_result_instances(controller) == instances
+    assert finished == [True]
+
+
+def test_waiting_instances_are_cancelled_after_crash(create_controller):
+    instances = ["instance_{}".format(idx) for idx in range(6)]
+    processed = []
+
+    def _process(plugin, context, instance):
+        processed.append(instance)
+        if instance == "instance_1":
+            return {"instance": instance, "error": ValueError("crash")}
+        time.sleep(0.2)
+        return {"instance": instance, "error": None}
+
+    controller, finished = create_controller(1, _process)
+    executor = controller._get_publish_executor()
+    controller._process_in_threads_and_continue(None, instances)
+    executor.shutdown(wait=True)
+
+    assert controller.publish_has_crashed
+    assert _get_result_instances(controller) == ["instance_0", "instance_1"]
+    # Only instance which was already running when crash happened
+    assert processed[:2] == ["instance_0", "instance_1"]
+    assert len(processed) <= 3
+    assert finished == [True]
+
+
+def test_stopped_publishing_continues_on_start(create_controller):
+    instances = ["instance_{}".format(idx) for idx in range(4)]
+    controller = None
+
+    def _process(plugin, context, instance):
+        if instance == "instance_0":
+            controller.stop_publish()
+        return {"instance": instance, "error": None}
+
+    controller, finished = create_controller(1, _process)
+    controller._process_in_threads_and_continue(None, instances)
+
+    assert not controller.publish_is_running
+    assert _get_result_instances(controller) == ["instance_0"]
+    assert finished == []
+
+    controller._start_publish()
+
+    assert _get_result_instances(controller) == instances
+    assert finished == [True]
@@ -0,0 +1,50 @@
+import threading
+from concurrent.futures import Future
+
+import pytest
+
+thumbnail = pytest.importorskip("quadpype.pipeline.thumbnail")
+
+
+class _ImmediateExecutor:
+    """Executor finishing futures before they're returned."""
+
+    def submit(self, func, *args, **kwargs):
+        future = Future()
+        future.set_result(func(*args, **kwargs))
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+
+def _run_with_timeout(func, timeout=5):
+    thread = threading.Thread(target=func, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "Call did not finish (deadlock)"
+
+
+@pytest.mark.parametrize("immediate", [True, False])
+def test_cached_thumbnail_requested_twice(tmp_path, immediate):
+    cache = thumbnail.ThumbnailDiskCache(root=str(tmp_path))
+    cache.set("project", "thumbnail_id", b"content")
+
+    service = thumbnail.ThumbnailService(cache=cache)
+    if immediate:
+        service._executor.shutdown()
+        service._executor = _ImmediateExecutor()
+
+    results = []
+
+    def _get_twice():
+        for _ in range(2):
+            future = service.get_thumbnail("project", "thumbnail_id")
+            results.append(future.result(timeout=5))
+
+    try:
+        _run_with_timeout(_get_twice)
+    finally:
+        service.shutdown()
+
+    assert results == [b"content", b"content"]
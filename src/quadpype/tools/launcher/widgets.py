@@ -144,6 +144,9 @@ class LauncherAssetsWidget(SingleSelectAssetsWidget):
     def refresh(self):
         self._launcher_model.refresh_assets(force=True)
 
+    def _on_refresh_clicked(self):
+        self.refresh()
+
     def stop_refresh(self):
         raise ValueError("bug stop_refresh called")
 
@@ -169,6 +169,9 @@ class LibraryLoaderWindow(BaseToolDialog):
         subsets_widget.active_changed.connect(self.on_subsetschanged)
         subsets_widget.version_changed.connect(self.on_versionschanged)
         subsets_widget.refreshed.connect(self._on_subset_refresh)
+        subsets_widget.visible_thumbnails_changed.connect(
+            thumbnail_widget.prefetch_thumbnails
+        )
         projects_combobox.currentTextChanged.connect(self.on_project_change)
 
         self.sync_server = sync_server
@@ -463,6 +466,8 @@ class LibraryLoaderWindow(BaseToolDialog):
             print("Force quitted..")
             self.setAttribute(QtCore.Qt.WA_DeleteOnClose)
 
+        self._thumbnail_widget.shutdown()
+
         print("Good bye")
         return super(LibraryLoaderWindow, self).closeEvent(event)
 
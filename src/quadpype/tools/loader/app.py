@@ -169,6 +169,9 @@ class LoaderWindow(BaseToolDialog):
         subsets_widget.active_changed.connect(self.on_subsetschanged)
         subsets_widget.version_changed.connect(self.on_versionschanged)
         subsets_widget.refreshed.connect(self._on_subset_refresh)
+        subsets_widget.visible_thumbnails_changed.connect(
+            thumbnail_widget.prefetch_thumbnails
+        )
 
         subsets_widget.load_started.connect(self._on_load_start)
         subsets_widget.load_ended.connect(self._on_load_end)
@@ -433,6 +436,8 @@ class LoaderWindow(BaseToolDialog):
             print("Force quit..")
             self.setAttribute(QtCore.Qt.WA_DeleteOnClose)
 
+        self._thumbnail_widget.shutdown()
+
         print("Good bye")
         return super(LoaderWindow, self).closeEvent(event)
 
@@ -2,6 +2,8 @@ import copy
 import re
 import math
 import time
+import functools
+import collections
 from uuid import uuid4
 
 from qtpy import QtCore, QtGui
@@ -134,6 +136,7 @@ class BaseRepresentationModel(object):
 class SubsetsModel(BaseRepresentationModel, TreeModel):
     doc_fetched = QtCore.Signal()
     refreshed = QtCore.Signal(bool)
+    repre_info_fetched = QtCore.Signal(int, object)
 
     Columns = [
         "subset",
@@ -181,6 +184,14 @@ class SubsetsModel(BaseRepresentationModel, TreeModel):
     ]
     not_last_hero_brush = QtGui.QBrush(QtGui.QColor(254, 121, 121))
 
+    # Top level rows created at once, rest is created when view needs them
+    fetch_batch_size = 200
+    # Columns by which top level rows can be created in view's sort order,
+    #   all rows are created at once when view is sorted by other column
+    fetch_sort_columns = ("subset", "asset")
+    # Delay of sync server status query of rows requested by view
+    repre_info_fetch_delay = 50
+
     # Should be minimum of required asset document keys
     asset_doc_projection = {
         "name": 1,
@@ -244,6 +255,23 @@ class SubsetsModel(BaseRepresentationModel, TreeModel):
         self._doc_fetching_stop = False
         self._doc_payload = {}
 
+        # Callbacks creating top level rows which were not fetched yet
+        self._pending_rows = collections.deque()
+        self._sort_column = 0
+        self._sort_order = QtCore.Qt.AscendingOrder
+
+        # Sync server status is queried only for rows shown in view
+        self._repre_info_generation = 0
+        self._repre_info_queue = set()
+        self._repre_info_requested = set()
+        self._repre_info_threads = []
+        self._item_ids_by_version_id = collections.defaultdict(set)
+        repre_info_timer = QtCore.QTimer()
+        repre_info_timer.setSingleShot(True)
+        repre_info_timer.setInterval(self.repre_info_fetch_delay)
+        repre_info_timer.timeout.connect(self._on_repre_info_timer)
+        self._repre_info_timer = repre_info_timer
+
         self._host = registered_host()
         self._loaded_representation_ids = set()
 
@@ -252,6 +280,7 @@ class SubsetsModel(BaseRepresentationModel, TreeModel):
         self._host_loaded_refresh_time = 0
 
         self.doc_fetched.connect(self._on_doc_fetched)
+        self.repre_info_fetched.connect(self._on_repre_info_fetched)
         self.refresh()
 
     def get_item_by_id(self, item_id):
@@ -263,6 +292,82 @@ class SubsetsModel(BaseRepresentationModel, TreeModel):
         self._items_by_id[item_id] = new_item
         super(SubsetsModel, self).add_child(new_item, *args, **kwargs)
 
+    def canFetchMore(self, parent):
+        if parent.isValid():
+            return False
+        return bool(self._pending_rows)
+
+    def fetchMore(self, parent):
+        if parent.isValid():
+            return
+        self._fetch_pending_rows(self.fetch_batch_size)
+
+    def _fetch_pending_rows(self, count=None):
+        if not self._pending_rows:
+            return
+
+        if count is None:
+            count = len(self._pending_rows)
+        count = min(count, len(self._pending_rows))
+        parent = QtCore.QModelIndex()
+        start_row = self._root_item.childCount()
+        self.beginInsertRows(parent, start_row, start_row + count - 1)
+        self._create_pending_rows(count)
+        self.endInsertRows()
+
+    def _create_pending_rows(self, count):
+        for _ in range(count):
+            create_row = self._pending_rows.popleft()
+            create_row()
+
+    def set_sort_order(self, column, order):
+        """Sort order of view in which top level rows are created.
+
+        Args:
+            column (int): Sorted column.
+            order (QtCore.Qt.SortOrder): Sort order.
+        """
+        if column == self._sort_column and order == self._sort_order:
+            return
+        self._sort_column = column
+        self._sort_order = order
+        # Created rows are ordered by previous sorting
+        self._fetch_pending_rows()
+
+    def _sort_pending_rows(self, pending_rows):
+        """Sort top level rows as view would sort them.
+
+        Args:
+            pending_rows (List[Tuple[str, Dict[str, Any], Callable]]): Sort
+                prefix used for ascending order, values by column and
+                callback creating the row.
+
+        Returns:
+            Union[List[Callable], None]: Callbacks creating rows in sort
+                order or None when view is sorted by unknown values.
+        """
+        column_key = None
+        if 0 <= self._sort_column < len(self.Columns):
+            column_key = self.Columns[self._sort_column]
+        if column_key not in self.fetch_sort_columns:
+            return None
+
+        # Keys match values of 'SortAscendingRole' and 'SortDescendingRole'
+        descending = self._sort_order == QtCore.Qt.DescendingOrder
+        sort_keys = []
+        for prefix, values, _ in pending_rows:
+            value = values.get("order", values.get(column_key))
+            if descending:
+                prefix = str(2 - int(prefix))
+            sort_keys.append(prefix + str(value))
+
+        indexes = sorted(
+            range(len(pending_rows)),
+            key=sort_keys.__getitem__,
+            reverse=descending
+        )
+        return [pending_rows[idx][2] for idx in indexes]
+
     def set_assets(self, asset_ids):
         self._asset_ids = asset_ids
         self.refresh()
@@ -289,20 +394,7 @@ class SubsetsModel(BaseRepresentationModel, TreeModel):
                     project_name, value, subset_id
                 )
 
-                # update availability on active site when version changes
-                if self.sync_server_enabled and version_doc:
-                    repres_info = list(
-                        self.sync_server.get_repre_info_for_versions(
-                            project_name,
-                            [version_doc["_id"]],
-                            self.active_site,
-                            self.remote_site
-                        )
-                    )
-                    if repres_info:
-                        version_doc["data"].update(
-                            self._get_repre_dict(repres_info[0]))
-
+            # Availability of new version is fetched when row is painted
             self.set_version(index, version_doc)
 
         return super(SubsetsModel, self).setData(index, value, role)
@@ -349,8 +441,9 @@ class SubsetsModel(BaseRepresentationModel, TreeModel):
         if not index.isValid():
             return
 
-        item = index.internalPointer()
+        self._set_item_version(index.internalPointer(), version)
 
+    def _set_item_version(self, item, version):
         assert version["parent"] == item["_id"], (
             "Version does not belong to subset"
         )
@@ -399,6 +492,13 @@ class SubsetsModel(BaseRepresentationModel, TreeModel):
 
         family_config = self.family_config_cache.family_config(family)
 
+        previous_version = item.get("version_document")
+        if previous_version and previous_version["_id"] != version["_id"]:
+            item.pop("repre_info_local", None)
+            item.pop("repre_info_remote", None)
+            # Query again when previous version is selected back
+            self._repre_info_requested.discard(previous_version["_id"])
+
         item.update({
             "version": version["name"],
             "version_document": version,
@@ -420,6 +520,9 @@ class SubsetsModel(BaseRepresentationModel, TreeModel):
         if repre_info:
             item["repre_info"] = repre_info
 
+        if "id" in item:
+            self._item_ids_by_version_id[version["_id"]].add(item["id"])
+
     def _fetch(self):
         project_name = self.dbcon.active_project()
         asset_docs = get_assets(
@@ -514,34 +617,12 @@ class SubsetsModel(BaseRepresentationModel, TreeModel):
         if self._doc_fetching_stop:
             return
 
-        repre_info_by_version_id = {}
-        if self.sync_server_enabled:
-            versions_by_id = {}
-            for _subset_id, doc in last_versions_by_subset_id.items():
-                versions_by_id[doc["_id"]] = doc
-
-            repres_info = self.sync_server.get_repre_info_for_versions(
-                project_name,
-                list(versions_by_id.keys()),
-                self.active_site,
-                self.remote_site
-            )
-            for repre_info in repres_info:
-                if self._doc_fetching_stop:
-                    return
-
-                version_id = repre_info["_id"]
-                doc = versions_by_id[version_id]
-                doc["active_provider"] = self.active_provider
-                doc["remote_provider"] = self.remote_provider
-                repre_info_by_version_id[version_id] = repre_info
-
+        # Sync server status is fetched when rows are shown in view
         self._doc_payload = {
             "asset_docs_by_id": asset_docs_by_id,
             "subset_docs_by_id": subset_docs_by_id,
             "subset_families": subset_families,
             "last_versions_by_subset_id": last_versions_by_subset_id,
-            "repre_info_by_version_id": repre_info_by_version_id,
             "subsets_loaded_by_id": loaded_subset_ids
         }
 
@@ -566,8 +647,10 @@ class SubsetsModel(BaseRepresentationModel, TreeModel):
 
     def refresh(self):
         self.stop_fetch_thread()
+        self._pending_rows.clear()
         self.clear()
         self._items_by_id = {}
+        self._reset_repre_info()
         self.reset_sync_server()
 
         if not self._asset_ids:
@@ -591,8 +674,10 @@ class SubsetsModel(BaseRepresentationModel, TreeModel):
         self.fetch_subset_and_version()
 
     def _on_doc_fetched(self):
+        self._pending_rows.clear()
         self.clear()
         self._items_by_id = {}
+        self._reset_repre_info()
         self.beginResetModel()
 
         asset_docs_by_id = self._doc_payload.get(
@@ -605,10 +690,6 @@ class SubsetsModel(BaseRepresentationModel, TreeModel):
             "last_versions_by_subset_id"
         )
 
-        repre_info_by_version_id = self._doc_payload.get(
-            "repre_info_by_version_id"
-        )
-
         subsets_loaded_by_id = self._doc_payload.get(
             "subsets_loaded_by_id"
         )
@@ -623,13 +704,23 @@ class SubsetsModel(BaseRepresentationModel, TreeModel):
             self.refreshed.emit(False)
             return
 
-        self._fill_subset_items(
+        pending_rows = self._fill_subset_items(
             asset_docs_by_id,
             subset_docs_by_id,
             last_versions_by_subset_id,
-            repre_info_by_version_id,
             subsets_loaded_by_id
         )
+        create_row_callbacks = self._sort_pending_rows(pending_rows)
+        if create_row_callbacks is None:
+            # Fetched rows would be sorted without rows which are not
+            #   created yet
+            count = len(pending_rows)
+            create_row_callbacks = [row[2] for row in pending_rows]
+        else:
+            # Create first batch of rows with reset, rest is fetched by view
+            count = min(self.fetch_batch_size, len(pending_rows))
+        self._pending_rows.extend(create_row_callbacks)
+        self._create_pending_rows(count)
         self.endResetModel()
         self.refreshed.emit(True)
 
@@ -660,32 +751,23 @@ class SubsetsModel(BaseRepresentationModel, TreeModel):
         asset_docs_by_id,
         subset_docs_by_id,
         last_versions_by_subset_id,
-        repre_info_by_version_id,
         subsets_loaded_by_id
     ):
+        """Prepare creation of top level rows.
+
+        Rows are created in batches when view requires them.
+
+        Returns:
+            List[Tuple[str, Dict[str, Any], Callable]]: Sort prefix used for
+                ascending order, values by column and callback creating
+                the row.
+        """
         _groups_tuple = self.groups_config.split_subsets_for_groups(
             subset_docs_by_id.values(), self._grouping
         )
         groups, subset_docs_without_group, subset_docs_by_group = _groups_tuple
 
-        group_item_by_name = {}
-        for group_data in groups:
-            group_name = group_data["name"]
-            group_item = Item()
-            group_item.update({
-                "subset": group_name,
-                "isGroup": True
-            })
-            group_item.update(group_data)
-
-            self.add_child(group_item)
-
-            group_item_by_name[group_name] = {
-                "item": group_item,
-                "index": self.index(group_item.row(), 0)
-            }
-
-        def _add_subset_item(subset_doc, parent_item, parent_index):
+        def _add_subset_item(subset_doc, parent_item):
             last_version = last_versions_by_subset_id.get(
                 subset_doc["_id"]
             )
@@ -702,60 +784,83 @@ class SubsetsModel(BaseRepresentationModel, TreeModel):
             data["last_version"] = last_version
             data["loaded_in_scene"] = subset_doc["_id"] in subsets_loaded_by_id
 
-            # Sync server data
-            data.update(
-                self._get_last_repre_info(repre_info_by_version_id,
-                                          last_version["_id"]))
-
             item = Item()
             item.update(data)
             self.add_child(item, parent_item)
-
-            index = self.index(item.row(), 0, parent_index)
-            self.set_version(index, last_version)
+            self._set_item_version(item, last_version)
 
         subset_counter = 0
-        for group_name, subset_docs_by_name in subset_docs_by_group.items():
-            parent_item = group_item_by_name[group_name]["item"]
-            parent_index = group_item_by_name[group_name]["index"]
+
+        def _add_subset_items(subset_docs_by_name, parent_item):
+            nonlocal subset_counter
             for subset_name in sorted(subset_docs_by_name.keys()):
                 subset_docs = subset_docs_by_name[subset_name]
                 asset_ids = [
                     subset_doc["parent"] for subset_doc in subset_docs
                 ]
+                _parent_item = parent_item
                 if len(subset_docs) > 1:
                     _parent_item = self.create_multiasset_group(
                         subset_name, asset_ids, subset_counter, parent_item
                     )
-                    _parent_index = self.index(
-                        _parent_item.row(), 0, parent_index
-                    )
                     subset_counter += 1
-                else:
-                    _parent_item = parent_item
-                    _parent_index = parent_index
 
                 for subset_doc in subset_docs:
-                    _add_subset_item(subset_doc,
-                                     parent_item=_parent_item,
-                                     parent_index=_parent_index)
+                    _add_subset_item(subset_doc, _parent_item)
+
+        def _add_group_item(group_data):
+            group_name = group_data["name"]
+            group_item = Item()
+            group_item.update({
+                "subset": group_name,
+                "isGroup": True
+            })
+            group_item.update(group_data)
+
+            self.add_child(group_item)
+            _add_subset_items(
+                subset_docs_by_group.get(group_name) or {}, group_item
+            )
+
+        pending_rows = []
+        for group_data in groups:
+            pending_rows.append((
+                "0",
+                {"order": group_data["order"]},
+                functools.partial(_add_group_item, group_data)
+            ))
 
         for subset_name in sorted(subset_docs_without_group.keys()):
-            subset_docs = subset_docs_without_group[subset_name]
-            asset_ids = [subset_doc["parent"] for subset_doc in subset_docs]
-            parent_item = None
-            parent_index = None
-            if len(subset_docs) > 1:
-                parent_item = self.create_multiasset_group(
-                    subset_name, asset_ids, subset_counter
-                )
-                parent_index = self.index(parent_item.row(), 0)
-                subset_counter += 1
+            subset_docs = [
+                subset_doc
+                for subset_doc in subset_docs_without_group[subset_name]
+                if subset_doc["_id"] in last_versions_by_subset_id
+            ]
+            # Multi-asset group is created even if some subsets are
+            #   without version
+            if len(subset_docs_without_group[subset_name]) > 1:
+                subset_docs = subset_docs_without_group[subset_name]
+                prefix = "1"
+                values = {
+                    "subset": "{} ({})".format(
+                        subset_name, len(subset_docs)
+                    ),
+                    "asset": None
+                }
+            elif subset_docs:
+                asset_id = subset_docs[0]["parent"]
+                prefix = "2"
+                values = {
+                    "subset": subset_name,
+                    "asset": asset_docs_by_id[asset_id]["name"]
+                }
+            else:
+                continue
 
-            for subset_doc in subset_docs:
-                _add_subset_item(subset_doc,
-                                 parent_item=parent_item,
-                                 parent_index=parent_index)
+            pending_rows.append((prefix, values, functools.partial(
+                _add_subset_items, {subset_name: subset_docs}, None
+            )))
+        return pending_rows
 
     def data(self, index, role):
         if not index.isValid():
@@ -821,12 +926,14 @@ class SubsetsModel(BaseRepresentationModel, TreeModel):
 
         elif role == LOCAL_AVAILABILITY_ROLE:
             if not item.get("isGroup"):
+                self._ensure_repre_info(item)
                 return item.get("repre_info_local")
             else:
                 return None
 
         elif role == REMOTE_AVAILABILITY_ROLE:
             if not item.get("isGroup"):
+                self._ensure_repre_info(item)
                 return item.get("repre_info_remote")
             else:
                 return None
@@ -857,13 +964,99 @@ class SubsetsModel(BaseRepresentationModel, TreeModel):
 
         super(TreeModel, self).headerData(section, orientation, role)
 
-    def _get_last_repre_info(self, repre_info_by_version_id, last_version_id):
-        data = {}
-        if repre_info_by_version_id:
-            repre_info = repre_info_by_version_id.get(last_version_id)
-            return self._get_repre_dict(repre_info)
+    def _reset_repre_info(self):
+        # Results of running queries are ignored
+        self._repre_info_generation += 1
+        self._repre_info_timer.stop()
+        self._repre_info_queue = set()
+        self._repre_info_requested = set()
+        self._item_ids_by_version_id.clear()
+
+    def _ensure_repre_info(self, item):
+        """Queue sync server status query of item's version."""
+        if not self.sync_server_enabled or item.get("isMerged"):
+            return
 
-        return data
+        version_doc = item.get("version_document")
+        if not version_doc:
+            return
+
+        version_id = version_doc["_id"]
+        if (
+            "repre_info_local" in item
+            or version_id in self._repre_info_requested
+        ):
+            return
+
+        self._repre_info_requested.add(version_id)
+        self._repre_info_queue.add(version_id)
+        if not self._repre_info_timer.isActive():
+            self._repre_info_timer.start()
+
+    def _on_repre_info_timer(self):
+        version_ids = list(self._repre_info_queue)
+        self._repre_info_queue = set()
+        if not version_ids or not self.sync_server_enabled:
+            return
+
+        # Remove references to finished threads
+        self._repre_info_threads = [
+            thread
+            for thread in self._repre_info_threads
+            if thread.isRunning()
+        ]
+        thread = lib.create_qthread(
+            self._fetch_repre_info,
+            self._repre_info_generation,
+            self.dbcon.active_project(),
+            version_ids,
+            self.active_site,
+            self.remote_site
+        )
+        self._repre_info_threads.append(thread)
+        thread.start()
+
+    def _fetch_repre_info(
+        self, generation, project_name, version_ids, active_site, remote_site
+    ):
+        repre_info_by_version_id = {
+            version_id: None
+            for version_id in version_ids
+        }
+        repres_info = self.sync_server.get_repre_info_for_versions(
+            project_name,
+            version_ids,
+            active_site,
+            remote_site
+        )
+        for repre_info in repres_info:
+            repre_info_by_version_id[repre_info["_id"]] = repre_info
+        self.repre_info_fetched.emit(generation, repre_info_by_version_id)
+
+    def _on_repre_info_fetched(self, generation, repre_info_by_version_id):
+        if generation != self._repre_info_generation:
+            return
+
+        column = self.columns_index["repre_info"]
+        for version_id, repre_info in repre_info_by_version_id.items():
+            repre_data = self._get_repre_dict(repre_info)
+            # Mark version as fetched even without representations
+            repre_data.setdefault("repre_info_local", None)
+            repre_data.setdefault("repre_info_remote", None)
+            for item_id in self._item_ids_by_version_id.get(version_id, []):
+                item = self._items_by_id.get(item_id)
+                if item is None:
+                    continue
+                version_doc = item["version_document"]
+                if version_doc["_id"] != version_id:
+                    continue
+
+                if repre_info:
+                    version_doc["active_provider"] = self.active_provider
+                    version_doc["remote_provider"] = self.remote_provider
+                item.update(repre_data)
+                index = self.createIndex(item.row(), column, item)
+                self.dataChanged.emit(index, index)
 
     def _get_repre_dict(self, repre_info):
         """Returns str representation of availability"""
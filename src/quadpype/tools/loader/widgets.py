@@ -14,13 +14,11 @@ from quadpype.client import (
     get_version_by_id,
     get_versions,
     get_representations,
-    get_thumbnail_id_from_source,
-    get_thumbnail,
 )
 from quadpype.client.operations import OperationsSession, REMOVED_VALUE
 from quadpype.pipeline import HeroVersionType, Anatomy
 from quadpype.lib import get_user_profile
-from quadpype.pipeline.thumbnail import get_thumbnail_binary
+from quadpype.pipeline.thumbnail import ThumbnailService
 from quadpype.pipeline.load import (
     discover_loader_plugins,
     SubsetLoaderPlugin,
@@ -160,6 +158,8 @@ class SubsetWidget(QtWidgets.QWidget):
     load_started = QtCore.Signal()
     load_ended = QtCore.Signal()
     refreshed = QtCore.Signal(bool)
+    # Thumbnail ids of versions visible in the view
+    visible_thumbnails_changed = QtCore.Signal(list)
 
     default_widths = (
         ("subset", 200),
@@ -224,6 +224,12 @@ class SubsetWidget(QtWidgets.QWidget):
         view.setSortingEnabled(True)
         view.sortByColumn(1, QtCore.Qt.AscendingOrder)
         view.setAlternatingRowColors(True)
+        # Model creates rows lazily in order of the view
+        header = view.header()
+        model.set_sort_order(
+            header.sortIndicatorSection(), header.sortIndicatorOrder()
+        )
+        header.sortIndicatorChanged.connect(model.set_sort_order)
 
         # Set view delegates
         version_delegate = VersionDelegate(self.dbcon, view)
@@ -270,6 +276,20 @@ class SubsetWidget(QtWidgets.QWidget):
 
         model.refreshed.connect(self.refreshed)
 
+        # Collect visible thumbnails when scrolling stops
+        visible_thumbnails_timer = QtCore.QTimer(self)
+        visible_thumbnails_timer.setSingleShot(True)
+        visible_thumbnails_timer.setInterval(100)
+        visible_thumbnails_timer.timeout.connect(
+            self._on_visible_thumbnails_timer
+        )
+        view.verticalScrollBar().valueChanged.connect(
+            visible_thumbnails_timer.start
+        )
+        model.refreshed.connect(visible_thumbnails_timer.start)
+
+        self._visible_thumbnails_timer = visible_thumbnails_timer
+
         self.proxy = proxy
         self.family_proxy = family_proxy
 
@@ -419,6 +439,39 @@ class SubsetWidget(QtWidgets.QWidget):
 
         return output
 
+    def get_visible_thumbnail_ids(self):
+        """Thumbnail ids of versions in rows visible in the view."""
+        viewport_height = self.view.viewport().height()
+        index = self.view.indexAt(QtCore.QPoint(0, 0))
+        thumbnail_ids = []
+        while index.isValid():
+            if self.view.visualRect(index).top() > viewport_height:
+                break
+
+            item_id = index.data(ITEM_ID_ROLE)
+            item = None
+            if item_id is not None:
+                item = self.model.get_item_by_id(item_id)
+            index = self.view.indexBelow(index)
+
+            if (
+                item is None
+                or item.get("isGroup")
+                or item.get("isMerged")
+            ):
+                continue
+
+            version_doc = item.get("version_document") or {}
+            thumbnail_id = version_doc.get("data", {}).get("thumbnail_id")
+            if thumbnail_id:
+                thumbnail_ids.append(thumbnail_id)
+        return thumbnail_ids
+
+    def _on_visible_thumbnails_timer(self):
+        self.visible_thumbnails_changed.emit(
+            self.get_visible_thumbnail_ids()
+        )
+
     def get_selected_subsets(self):
         output = []
         items = collections.deque(self.get_selected_items())
@@ -822,12 +875,16 @@ class ThumbnailWidget(QtWidgets.QLabel):
     aspect_ratio = (16, 9)
     max_width = 300
 
+    # Emitted from worker threads with request key and decoded image
+    _thumbnail_loaded = QtCore.Signal(object, object)
+
     def __init__(self, dbcon, parent=None):
         super().__init__(parent)
         self.dbcon = dbcon
 
-        self.current_thumb_id = None
         self.current_thumbnail = None
+        self._current_request = None
+        self._thumbnail_service = None
 
         self.setAlignment(QtCore.Qt.AlignCenter)
 
@@ -840,6 +897,8 @@ class ThumbnailWidget(QtWidgets.QLabel):
         self.default_pix = QtGui.QPixmap(default_pix_path)
         self.set_pixmap()
 
+        self._thumbnail_loaded.connect(self._on_thumbnail_loaded)
+
     def height(self):
         width = self.width()
         asp_w, asp_h = self.aspect_ratio
@@ -855,7 +914,6 @@ class ThumbnailWidget(QtWidgets.QLabel):
     def set_pixmap(self, pixmap=None):
         if not pixmap:
             pixmap = self.default_pix
-            self.current_thumb_id = None
 
         self.current_thumbnail = pixmap
 
@@ -868,6 +926,19 @@ class ThumbnailWidget(QtWidgets.QLabel):
         cur_pix = self.scale_pixmap(self.current_thumbnail)
         self.setPixmap(cur_pix)
 
+    def _get_thumbnail_service(self):
+        if self._thumbnail_service is None:
+            self._thumbnail_service = ThumbnailService(self.dbcon)
+        return self._thumbnail_service
+
+    def shutdown(self):
+        """Stop resolving of thumbnails, e.g. when window is closed."""
+        thumbnail_service = self._thumbnail_service
+        self._thumbnail_service = None
+        self._current_request = None
+        if thumbnail_service is not None:
+            thumbnail_service.shutdown()
+
     def scale_pixmap(self, pixmap):
         return pixmap.scaled(
             self.width(),
@@ -878,44 +949,65 @@ class ThumbnailWidget(QtWidgets.QLabel):
 
     def set_thumbnail(self, src_type, doc_ids):
         if not doc_ids:
+            self._current_request = None
             self.set_pixmap()
             return
 
         src_id = doc_ids[0]
+        request_key = (src_type, src_id)
+        if request_key == self._current_request:
+            return
 
+        self._current_request = request_key
         project_name = self.dbcon.active_project()
-        thumbnail_id = get_thumbnail_id_from_source(
-            project_name,
-            src_type,
-            src_id,
+        future = self._get_thumbnail_service().get_source_thumbnail(
+            project_name, src_type, src_id
+        )
+        future.add_done_callback(
+            lambda _future: self._on_future_done(request_key, _future)
         )
-        if thumbnail_id == self.current_thumb_id:
-            if self.current_thumbnail is None:
-                self.set_pixmap()
-            return
 
-        self.current_thumb_id = thumbnail_id
-        if not thumbnail_id:
-            self.set_pixmap()
-            return
+    def prefetch_thumbnails(self, thumbnail_ids):
+        """Resolve and cache thumbnails in background before they're shown.
 
-        thumbnail_ent = get_thumbnail(
-            project_name, thumbnail_id, src_type, src_id
-        )
-        if not thumbnail_ent:
+        Args:
+            thumbnail_ids (Iterable[Union[str, ObjectId]]): Thumbnail ids.
+        """
+        project_name = self.dbcon.active_project()
+        if project_name:
+            self._get_thumbnail_service().prefetch(
+                project_name, thumbnail_ids
+            )
+
+    def _on_future_done(self, request_key, future):
+        # Called in worker thread - decode image here and pass it to
+        #   main thread by signal
+        image = None
+        try:
+            content = future.result()
+        except Exception:
+            content = None
+            traceback.print_exc()
+
+        if content:
+            image = QtGui.QImage.fromData(content)
+            if image.isNull():
+                image = None
+
+        try:
+            self._thumbnail_loaded.emit(request_key, image)
+        except RuntimeError:
+            # Widget was already destroyed
+            pass
+
+    def _on_thumbnail_loaded(self, request_key, image):
+        if request_key != self._current_request:
             return
 
-        thumbnail_bin = get_thumbnail_binary(
-            thumbnail_ent, "thumbnail", self.dbcon
-        )
-        if not thumbnail_bin:
+        if image is None:
             self.set_pixmap()
             return
-
-        thumbnail = QtGui.QPixmap()
-        thumbnail.loadFromData(thumbnail_bin)
-
-        self.set_pixmap(thumbnail)
+        self.set_pixmap(QtGui.QPixmap.fromImage(image))
 
 
 class VersionWidget(QtWidgets.QWidget):
@@ -15,6 +15,7 @@ from quadpype.client import (
 )
 from quadpype.client.operations import CURRENT_ASSET_DOC_SCHEMA
 from quadpype.lib import Logger
+from quadpype.pipeline.hierarchy_import import AssetHierarchyImport
 
 from .constants import (
     IDENTIFIER_ROLE,
@@ -1335,12 +1336,20 @@ class HierarchyModel(QtCore.QAbstractItemModel):
         self._reset_root_item()
         self.endResetModel()
 
-    def save(self):
+    def save(self, progress_callback=None):
         """Save all changes from current project manager session.
 
         Will create new asset documents, update existing and asset documents
         marked for deletion are removed from mongo if has published content or
         their type is changed to `archived_asset` to not loose their data.
+
+        New assets keep their ids if save fails, so next save overrides
+        documents which were already written instead of duplicating them.
+
+        Args:
+            progress_callback (Optional[Callable[[int, int], None]]): Called
+                after each written chunk with number of written and all
+                changes.
         """
         # Check if all items are valid before save
         all_valid = True
@@ -1361,21 +1370,32 @@ class HierarchyModel(QtCore.QAbstractItemModel):
             return
 
         project_name = project_item.name
-        project_col = self.dbcon.database[project_name]
+
+        # Index of assets is created from current state of hierarchy
+        asset_docs = [
+            item.to_doc()
+            for item in self._items_by_id.values()
+            if (
+                isinstance(item, AssetItem)
+                and not item.is_new
+                and not item.data(REMOVED_ROLE)
+            )
+        ]
+        hierarchy_import = AssetHierarchyImport(
+            project_name, asset_docs=asset_docs
+        )
 
         # Process asset items per one hierarchical level.
-        # - new assets are inserted per one parent
-        # - update and delete data are stored and processed at once at the end
+        # - new assets get their ids before their children are processed so
+        #   all changes can be written at once in any order
         to_process = collections.deque()
         to_process.append(project_item)
 
-        created_count = 0
         updated_count = 0
         removed_count = 0
         bulk_writes = []
         while to_process:
             parent = to_process.popleft()
-            insert_list = []
             for item in parent.children():
                 if not isinstance(item, AssetItem):
                     continue
@@ -1383,7 +1403,21 @@ class HierarchyModel(QtCore.QAbstractItemModel):
                 to_process.append(item)
 
                 if item.is_new:
-                    insert_list.append(item)
+                    asset_data = item.to_doc()["data"]
+                    tasks = asset_data.pop("tasks")
+                    asset_data.pop("parents")
+                    asset_data.pop("visualParent")
+                    parent_name = None
+                    if isinstance(parent, AssetItem):
+                        parent_name = parent.name
+                    # Id from previous failed save is reused
+                    item.mongo_id = hierarchy_import.add_asset(
+                        item.name,
+                        parent_name,
+                        asset_data,
+                        tasks,
+                        asset_id=item.mongo_id
+                    )
 
                 elif item.data(REMOVED_ROLE):
                     removed_count += 1
@@ -1406,22 +1440,12 @@ class HierarchyModel(QtCore.QAbstractItemModel):
                             update_data
                         ))
 
-            if insert_list:
-                new_docs = []
-                for item in insert_list:
-                    new_docs.append(item.to_doc())
-
-                result = project_col.insert_many(new_docs)
-                for idx, mongo_id in enumerate(result.inserted_ids):
-                    created_count += 1
-                    insert_list[idx].mongo_id = mongo_id
-
-        if sum([created_count, updated_count, removed_count]) == 0:
+        created_count = len(hierarchy_import)
+        if not created_count and not bulk_writes:
             self.log.info("Nothing has changed")
             return
 
-        if bulk_writes:
-            project_col.bulk_write(bulk_writes)
+        hierarchy_import.commit(progress_callback, bulk_writes)
 
         self.log.info((
             "Save finished."
@@ -1877,6 +1901,7 @@ class AssetItem(BaseItem):
         if not asset_doc:
             asset_doc = {}
         self.mongo_id = asset_doc.get("_id")
+        self._is_new = self.mongo_id is None
         self._project_id = None
         self._edited_columns = {
             column_name: False
@@ -1916,7 +1941,7 @@ class AssetItem(BaseItem):
     @property
     def is_new(self):
         """Item was created during current project manager session."""
-        return self.asset_id is None
+        return self._is_new
 
     @property
     def is_valid(self):
@@ -232,7 +232,12 @@ class ProjectManagerWindow(QtWidgets.QWidget):
         self.refresh_projects()
 
     def _on_save_click(self):
-        self.hierarchy_model.save()
+        self.hierarchy_model.save(progress_callback=self._on_save_progress)
+
+    def _on_save_progress(self, done, total):
+        self.show_message("Saving changes {}/{}".format(done, total))
+        # Show progress while save is blocking main thread
+        QtWidgets.QApplication.processEvents()
 
     def _on_add_asset(self):
         self.hierarchy_view.add_asset()
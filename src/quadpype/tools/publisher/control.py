@@ -7,17 +7,19 @@ import uuid
 import tempfile
 import shutil
 import inspect
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, wait
 
 import arrow
 import pyblish.api
 
 from quadpype.client import (
-    get_assets,
     get_asset_by_id,
     get_subsets
 )
 from quadpype.lib.events import EventSystem
+from quadpype.settings import get_project_settings
 from quadpype.lib.attribute_definitions import (
     UIDef,
     serialize_attr_defs,
@@ -40,7 +42,11 @@ from quadpype.pipeline.create.context import (
     CreatorsOperationFailed,
     ConvertorsOperationFailed,
 )
-from quadpype.pipeline.publish import get_publish_instance_label
+from quadpype.pipeline.publish import (
+    get_publish_instance_label,
+    process_plugin_in_thread,
+)
+from quadpype.pipeline.asset_hierarchy import get_asset_hierarchy
 
 # Define constant for plugin orders offset
 PLUGIN_ORDER_OFFSET = 0.5
@@ -65,58 +71,48 @@ class MainThreadItem:
 
 
 class AssetDocsCache:
-    """Cache asset documents for creation part."""
+    """Cache asset documents for creation part.
 
-    projection = {
-        "_id": True,
-        "name": True,
-        "data.visualParent": True,
-        "data.tasks": True
-    }
+    Asset hierarchy is shared with other tools in the process. Returned
+    values are not copied and must not be modified.
+    """
 
     def __init__(self, controller):
         self._controller = controller
+        self._hierarchy = None
+        self._force_fetch = False
         self._asset_docs = None
         self._asset_docs_hierarchy = None
-        self._task_names_by_asset_name = {}
-        self._asset_docs_by_name = {}
         self._full_asset_docs_by_name = {}
 
     def reset(self):
+        self._hierarchy = None
+        # Query assets on reset even if shared hierarchy is cached
+        self._force_fetch = True
         self._asset_docs = None
         self._asset_docs_hierarchy = None
-        self._task_names_by_asset_name = {}
-        self._asset_docs_by_name = {}
         self._full_asset_docs_by_name = {}
 
-    def _query(self):
-        if self._asset_docs is not None:
-            return
-
-        project_name = self._controller.project_name
-        asset_docs = list(get_assets(
-            project_name, fields=self.projection.keys()
-        ))
-        asset_docs_by_name = {}
-        task_names_by_asset_name = {}
-        for asset_doc in asset_docs:
-            if "data" not in asset_doc:
-                asset_doc["data"] = {"tasks": {}, "visualParent": None}
-            elif "tasks" not in asset_doc["data"]:
-                asset_doc["data"]["tasks"] = {}
-
-            asset_name = asset_doc["name"]
-            asset_tasks = asset_doc["data"]["tasks"]
-            task_names_by_asset_name[asset_name] = list(asset_tasks.keys())
-            asset_docs_by_name[asset_name] = asset_doc
-
-        self._asset_docs = asset_docs
-        self._asset_docs_by_name = asset_docs_by_name
-        self._task_names_by_asset_name = task_names_by_asset_name
+    def _get_hierarchy(self):
+        if self._hierarchy is None:
+            self._hierarchy = get_asset_hierarchy(
+                self._controller.project_name, force=self._force_fetch
+            )
+            self._force_fetch = False
+        return self._hierarchy
 
     def get_asset_docs(self):
-        self._query()
-        return copy.deepcopy(self._asset_docs)
+        """Asset documents with '_id', 'name' and 'data.visualParent'."""
+        if self._asset_docs is None:
+            self._asset_docs = [
+                {
+                    "_id": node.id,
+                    "name": node.name,
+                    "data": {"visualParent": node.parent_id}
+                }
+                for node in self._get_hierarchy()
+            ]
+        return self._asset_docs
 
     def get_asset_hierarchy(self):
         """Prepare asset documents into hierarchy.
@@ -130,37 +126,40 @@ class AssetDocsCache:
         """
 
         if self._asset_docs_hierarchy is None:
-            _queue = collections.deque(self.get_asset_docs())
-
             output = collections.defaultdict(list)
-            while _queue:
-                asset_doc = _queue.popleft()
-                asset_doc["_id"] = str(asset_doc["_id"])
-                parent_id = asset_doc["data"]["visualParent"]
+            for node in self._get_hierarchy():
+                parent_id = node.parent_id
                 if parent_id is not None:
                     parent_id = str(parent_id)
-                    asset_doc["data"]["visualParent"] = parent_id
-                output[parent_id].append(asset_doc)
+                output[parent_id].append({
+                    "_id": str(node.id),
+                    "name": node.name,
+                    "data": {"visualParent": parent_id}
+                })
             self._asset_docs_hierarchy = output
-        return copy.deepcopy(self._asset_docs_hierarchy)
+        return self._asset_docs_hierarchy
 
-    def get_task_names_by_asset_name(self):
-        self._query()
-        return copy.deepcopy(self._task_names_by_asset_name)
+    def get_task_names(self, asset_name):
+        node = self._get_hierarchy().get_node_by_name(asset_name)
+        if node is None:
+            return ()
+        return node.task_names
 
     def get_asset_by_name(self, asset_name):
-        self._query()
-        asset_doc = self._asset_docs_by_name.get(asset_name)
-        if asset_doc is None:
+        node = self._get_hierarchy().get_node_by_name(asset_name)
+        if node is None:
             return None
-        return copy.deepcopy(asset_doc)
+        return {
+            "_id": node.id,
+            "name": node.name,
+            "data": {"visualParent": node.parent_id}
+        }
 
     def get_full_asset_by_name(self, asset_name):
-        self._query()
         if asset_name not in self._full_asset_docs_by_name:
-            asset_doc = self._asset_docs_by_name.get(asset_name)
+            node = self._get_hierarchy().get_node_by_name(asset_name)
             project_name = self._controller.project_name
-            full_asset_doc = get_asset_by_id(project_name, asset_doc["_id"])
+            full_asset_doc = get_asset_by_id(project_name, node.id)
             self._full_asset_docs_by_name[asset_name] = full_asset_doc
         return copy.deepcopy(self._full_asset_docs_by_name[asset_name])
 
@@ -1729,6 +1728,18 @@ class PublisherController(BasePublisherController):
         # Plugin iterator
         self._main_thread_iter = None
 
+        # Threads processing instance plugins
+        # - disabled when number of workers is 0
+        self._publish_max_workers = 0
+        self._publish_executor = None
+        # Futures of instances of currently processed plugin
+        self._publish_futures = []
+        # Threads don't start processing of instances when publishing stops
+        self._publish_stop_event = threading.Event()
+        # Continues processing of instances in threads when publishing
+        #   is started again after stop
+        self._publish_threads_resume_item = None
+
         # State flags to prevent executing method which is already in progress
         self._resetting_plugins = False
         self._resetting_instances = False
@@ -1816,13 +1827,10 @@ class PublisherController(BasePublisherController):
 
     def get_task_names_by_asset_names(self, asset_names):
         """Prepare task names by asset name."""
-        task_names_by_asset_name = (
-            self._asset_docs_cache.get_task_names_by_asset_name()
-        )
         result = {}
         for asset_name in asset_names:
             result[asset_name] = set(
-                task_names_by_asset_name.get(asset_name) or []
+                self._asset_docs_cache.get_task_names(asset_name)
             )
         return result
 
@@ -2237,6 +2245,8 @@ class PublisherController(BasePublisherController):
         self._publish_comment_is_set = False
 
         self._main_thread_iter = self._publish_iterator()
+        self._shutdown_publish_executor()
+        self._publish_max_workers = self._get_publish_max_workers()
         self._publish_context = pyblish.api.Context()
         # Make sure "comment" is set on publish context
         self._publish_context.data["comment"] = ""
@@ -2257,6 +2267,46 @@ class PublisherController(BasePublisherController):
 
         self._emit_event("publish.reset.finished")
 
+    def _get_publish_max_workers(self):
+        """Number of threads processing instance plugins.
+
+        Returns:
+            int: Number of threads or 0 if instance plugins are processed
+                in main thread.
+        """
+
+        project_name = self.project_name
+        if not project_name:
+            return 0
+
+        project_settings = get_project_settings(project_name)
+        parallel_settings = (
+            project_settings["global"]["tools"]["publish"]
+            .get("parallel_instances")
+        ) or {}
+        if (
+            not parallel_settings.get("enabled")
+            or self._create_context.host_name
+            not in (parallel_settings.get("hosts") or [])
+        ):
+            return 0
+        return max(1, int(parallel_settings.get("max_workers") or 1))
+
+    def _get_publish_executor(self):
+        if self._publish_executor is None:
+            self._publish_executor = ThreadPoolExecutor(
+                max_workers=self._publish_max_workers,
+                thread_name_prefix="PublishInstances"
+            )
+        return self._publish_executor
+
+    def _shutdown_publish_executor(self):
+        self._publish_futures = []
+        self._publish_threads_resume_item = None
+        if self._publish_executor is not None:
+            self._publish_executor.shutdown(wait=False, cancel_futures=True)
+            self._publish_executor = None
+
     def set_comment(self, comment):
         """Set comment from ui to pyblish context.
 
@@ -2298,14 +2348,26 @@ class PublisherController(BasePublisherController):
 
         self.publish_is_running = True
         self.publish_has_started = True
+        self._publish_stop_event.clear()
 
         self._emit_event("publish.process.started")
 
-        self._publish_next_process()
+        # Continue with instances which were not processed in threads
+        resume_item = self._publish_threads_resume_item
+        self._publish_threads_resume_item = None
+        if resume_item is not None:
+            self._process_main_thread_item(resume_item)
+        else:
+            self._publish_next_process()
 
     def _stop_publish(self):
         """Stop or pause publishing."""
         self.publish_is_running = False
+        # Instances which are not processed yet are submitted again when
+        #   publishing continues
+        self._publish_stop_event.set()
+        for future in self._publish_futures:
+            future.cancel()
 
         self._emit_event("publish.process.stopped")
 
@@ -2347,6 +2409,11 @@ class PublisherController(BasePublisherController):
         self.emit_card_message("Action finished.")
 
     def _publish_next_process(self):
+        # Instances of plugin are processed in threads, next item is
+        #   processed after all of them are finished
+        if self._publish_futures:
+            return
+
         # Validations of progress before using iterator
         # - same conditions may be inside iterator but they may be used
         #   only in specific cases (e.g. when it happens for a first time)
@@ -2371,7 +2438,7 @@ class PublisherController(BasePublisherController):
         self._process_main_thread_item(item)
 
     def _process_main_thread_item(self, item):
-        item()
+        item.process()
 
     def _is_publish_plugin_active(self, plugin):
         """Decide if publish plugin is active.
@@ -2463,6 +2530,20 @@ class PublisherController(BasePublisherController):
                     self._publish_report.set_plugin_skipped()
                     continue
 
+                if self._can_process_in_threads(plugin):
+                    instances = [
+                        instance
+                        for instance in instances
+                        if instance.data.get("publish") is not False
+                    ]
+                    if instances:
+                        yield MainThreadItem(
+                            self._process_in_threads_and_continue,
+                            plugin,
+                            instances
+                        )
+                    continue
+
                 for instance in instances:
                     if instance.data.get("publish") is False:
                         continue
@@ -2515,11 +2596,113 @@ class PublisherController(BasePublisherController):
             result["instance"]
         )
 
+    def _can_process_in_threads(self, plugin):
+        """Instances of plugin can be processed in threads."""
+        return (
+            self._publish_max_workers > 0
+            and getattr(plugin, "parallel_instances", True)
+        )
+
+    def _process_in_threads_and_continue(self, plugin, instances):
+        """Process instances of instance plugin in threads.
+
+        Results are handled in main thread in order of instances. Next
+        plugin is processed after all instances are processed.
+        """
+
+        self._publish_futures = [
+            self._submit_publish_instance(plugin, instance)
+            for instance in instances
+        ]
+        self._emit_threaded_instance_changed(instances[0])
+        self._wait_for_threads_and_continue(plugin, instances, 0)
+
+    def _submit_publish_instance(self, plugin, instance):
+        return self._get_publish_executor().submit(
+            self._process_instance_in_thread,
+            plugin,
+            self._publish_context,
+            instance
+        )
+
+    def _process_instance_in_thread(self, plugin, context, instance):
+        # Publishing was stopped after the instance was submitted
+        if self._publish_stop_event.is_set():
+            return None
+        return process_plugin_in_thread(plugin, context, instance)
+
+    def _emit_threaded_instance_changed(self, instance):
+        self._emit_event(
+            "publish.process.instance.changed",
+            {"instance_label": get_publish_instance_label(instance)}
+        )
+
+    def _wait_for_threaded_result(self, future):
+        # Main thread is blocked until result is available. Qt controller
+        #   does not wait so UI is responsive.
+        wait([future])
+
+    def _wait_for_threads_and_continue(self, plugin, instances, index):
+        futures = self._publish_futures
+        if not futures:
+            # Publishing was reset
+            return
+
+        self._wait_for_threaded_result(futures[index])
+
+        while index < len(futures) and futures[index].done():
+            future = futures[index]
+            result = None
+            if not future.cancelled():
+                result = future.result()
+
+            # Instance was not processed because publishing was stopped
+            if result is None and not self.publish_has_crashed:
+                if not self.publish_is_running:
+                    # Instance is submitted again on publish start
+                    self._publish_threads_resume_item = MainThreadItem(
+                        self._wait_for_threads_and_continue,
+                        plugin,
+                        instances,
+                        index
+                    )
+                    return
+                futures[index] = self._submit_publish_instance(
+                    plugin, instances[index]
+                )
+                continue
+
+            index += 1
+            if index < len(futures):
+                self._emit_threaded_instance_changed(instances[index])
+
+            # Results of instances finished after crash are not used
+            if result is None or self.publish_has_crashed:
+                continue
+
+            self._handle_publish_result(result)
+            # Don't start processing of waiting instances after crash
+            if self.publish_has_crashed:
+                for _future in futures[index:]:
+                    _future.cancel()
+
+        if index < len(futures):
+            self._process_main_thread_item(MainThreadItem(
+                self._wait_for_threads_and_continue, plugin, instances, index
+            ))
+            return
+
+        self._publish_futures = []
+        self._publish_next_process()
+
     def _process_and_continue(self, plugin, instance):
         result = pyblish.plugin.process(
             plugin, self._publish_context, instance
         )
+        self._handle_publish_result(result)
+        self._publish_next_process()
 
+    def _handle_publish_result(self, result):
         exception = result.get("error")
         if exception:
             has_validation_error = False
@@ -2545,8 +2728,6 @@ class PublisherController(BasePublisherController):
 
         self._publish_report.add_result(result)
 
-        self._publish_next_process()
-
 
 def collect_families_from_instances(instances, only_active=False):
     """Collect all families for passed publish instances.
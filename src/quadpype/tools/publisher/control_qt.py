@@ -89,6 +89,10 @@ class QtPublisherController(PublisherController):
     def _process_main_thread_item(self, item):
         self._main_thread_processor.add_item(item)
 
+    def _wait_for_threaded_result(self, future):
+        # Don't block UI, result is checked again by next main thread item
+        pass
+
     def _qt_on_publish_start(self):
         self._main_thread_processor.start()
 
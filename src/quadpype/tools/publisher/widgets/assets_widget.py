@@ -85,7 +85,7 @@ class CreateWidgetAssetsWidget(SingleSelectAssetsWidget):
     def _create_source_model(self):
         return AssetsHierarchyModel(self._controller)
 
-    def _refresh_model(self):
+    def _refresh_model(self, force_fetch=False):
         self._model.reset()
         self._on_model_refresh(self._model.rowCount() > 0)
 
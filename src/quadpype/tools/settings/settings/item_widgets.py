@@ -48,6 +48,7 @@ class DictImmutableKeysWidget(BaseWidget):
         self._direct_children_widgets = []
         self._parent_widget_by_entity_id = {}
         self._added_wrapper_ids = set()
+        self._children_created = False
 
         super().__init__(category_widget, entity, entity_widget)
 
@@ -84,6 +85,31 @@ class DictImmutableKeysWidget(BaseWidget):
             self.entity.gui_layout, self.content_widget
         )
 
+        # Widgets of collapsed content are created on first expand
+        if (
+            self.body_widget is not None
+            and self.entity.collapsible
+            and self.checkbox_child is None
+            and self.entity.children
+            and not self.body_widget.is_expanded()
+        ):
+            self.body_widget.button_toggle.toggled.connect(
+                self._on_content_toggle
+            )
+        else:
+            self._create_children_ui()
+
+        if (
+            self._children_created
+            and self.entity.use_label_wrap
+            and self.content_layout.count() == 0
+        ):
+            self.body_widget.hide_toolbox(True)
+
+        self.entity_widget.add_widget_to_layout(self, label)
+
+    def _create_children_ui(self):
+        self._children_created = True
         for child_obj in self.entity.children:
             input_field = self.create_ui_for_entity(
                 self.category_widget, child_obj, self
@@ -92,10 +118,22 @@ class DictImmutableKeysWidget(BaseWidget):
                 input_field.set_read_only(self._read_only)
             self.input_fields.append(input_field)
 
-        if self.entity.use_label_wrap and self.content_layout.count() == 0:
-            self.body_widget.hide_toolbox(True)
+    def _on_content_toggle(self, expanded):
+        if expanded and not self._children_created:
+            self._create_lazy_children_ui()
 
-        self.entity_widget.add_widget_to_layout(self, label)
+    def _create_lazy_children_ui(self):
+        self.body_widget.button_toggle.toggled.disconnect(
+            self._on_content_toggle
+        )
+        self._create_children_ui()
+
+        # Values of the hierarchy were already set by category widget
+        ignoring_changes = bool(self.ignore_input_changes)
+        self.ignore_input_changes.set_ignore(True)
+        self.set_entity_value()
+        if not ignoring_changes:
+            self.ignore_input_changes.set_ignore(False)
 
     def _prepare_entity_layouts(self, children, widget):
         for child in children:
@@ -228,6 +266,9 @@ class DictImmutableKeysWidget(BaseWidget):
         if not path.startswith(entity_path):
             return False
 
+        if not self._children_created:
+            self._create_lazy_children_ui()
+
         is_checkbox_child = False
         changed = False
         for direct_child in self._direct_children_widgets:
@@ -5,9 +5,10 @@ import qtpy
 from qtpy import QtWidgets, QtCore, QtGui
 import qtawesome
 
-from quadpype.client import (
-    get_project,
-    get_assets,
+from quadpype.client import get_project
+from quadpype.pipeline.asset_hierarchy import (
+    AssetHierarchy,
+    get_asset_hierarchy,
 )
 from quadpype.style import (
     get_objected_colors,
@@ -23,7 +24,7 @@ from .widgets import PlaceholderLineEdit
 from .models import RecursiveSortFilterProxyModel
 from .lib import (
     DynamicQThread,
-    get_asset_icon
+    get_asset_icon_by_name
 )
 
 if qtpy.API == "pyside":
@@ -279,6 +280,8 @@ class AssetModel(QtGui.QStandardItemModel):
 
     Asset document may have defined label, icon or icon color.
 
+    Assets are taken from asset hierarchy shared by tools in the process.
+
     Loading of data for model happens in thread which means that refresh
     is not sequential. When refresh is triggered it is required to listen for
     'refreshed' signal.
@@ -291,16 +294,6 @@ class AssetModel(QtGui.QStandardItemModel):
     _doc_fetched = QtCore.Signal()
     refreshed = QtCore.Signal(bool)
 
-    # Asset document projection
-    _asset_projection = {
-        "name": 1,
-        "parent": 1,
-        "data.visualParent": 1,
-        "data.label": 1,
-        "data.icon": 1,
-        "data.color": 1
-    }
-
     def __init__(self, dbcon, parent=None):
         super().__init__(parent=parent)
         self.dbcon = dbcon
@@ -308,7 +301,8 @@ class AssetModel(QtGui.QStandardItemModel):
         self._refreshing = False
         self._doc_fetching_thread = None
         self._doc_fetching_stop = False
-        self._doc_payload = []
+        self._doc_payload = None
+        self._force_fetch = False
 
         self._doc_fetched.connect(self._on_docs_fetched)
 
@@ -358,11 +352,13 @@ class AssetModel(QtGui.QStandardItemModel):
 
         return self.get_indexes_by_asset_ids(asset_ids)
 
-    def refresh(self, force=False):
+    def refresh(self, force=False, force_fetch=False):
         """Refresh the data for the model.
 
         Args:
             force (bool): Stop currently running refresh start new refresh.
+            force_fetch (bool): Query assets even if asset hierarchy shared
+                in the process is cached.
         """
         # Skip fetch if there is already other thread fetching documents
         if self._refreshing:
@@ -382,7 +378,8 @@ class AssetModel(QtGui.QStandardItemModel):
         # Fetch documents from mongo
         # Restart payload
         self._refreshing = True
-        self._doc_payload = []
+        self._doc_payload = None
+        self._force_fetch = force_fetch
         self._doc_fetching_thread = DynamicQThread(self._threaded_fetch)
         self._doc_fetching_thread.start()
 
@@ -420,29 +417,27 @@ class AssetModel(QtGui.QStandardItemModel):
             self._clear_items()
             return
 
-        self._fill_assets(self._doc_payload)
+        self._fill_asset_hierarchy(self._doc_payload)
 
         self.refreshed.emit(bool(self._items_by_asset_id))
 
         self._stop_fetch_thread()
 
     def _fill_assets(self, asset_docs):
-        # Collect asset documents as needed
-        asset_ids = set()
-        asset_docs_by_id = {}
-        asset_ids_by_parents = collections.defaultdict(set)
-        for asset_doc in asset_docs:
-            asset_id = asset_doc["_id"]
-            asset_data = asset_doc.get("data") or {}
-            parent_id = asset_data.get("visualParent")
-            asset_ids.add(asset_id)
-            asset_docs_by_id[asset_id] = asset_doc
-            asset_ids_by_parents[parent_id].add(asset_id)
+        self._fill_asset_hierarchy(
+            AssetHierarchy.from_docs(self._last_project_name, asset_docs)
+        )
+
+    def _fill_asset_hierarchy(self, hierarchy):
+        if hierarchy is None:
+            hierarchy = AssetHierarchy(self._last_project_name, [])
 
         # Prepare removed asset ids
-        removed_asset_ids = (
-            set(self._items_by_asset_id.keys()) - set(asset_docs_by_id.keys())
-        )
+        removed_asset_ids = {
+            asset_id
+            for asset_id in self._items_by_asset_id.keys()
+            if hierarchy.get_node(asset_id) is None
+        }
 
         # Prepare queue for adding new items
         asset_items_queue = collections.deque()
@@ -454,8 +449,10 @@ class AssetModel(QtGui.QStandardItemModel):
         while asset_items_queue:
             # Get item from queue
             parent_id, parent_item = asset_items_queue.popleft()
-            # Skip if there are no children
-            children_ids = asset_ids_by_parents[parent_id]
+            if parent_id is None:
+                children_ids = set(hierarchy.root_ids)
+            else:
+                children_ids = set(hierarchy.get_node(parent_id).children_ids)
 
             # Go through current children of parent item
             # - find out items that were deleted and skip creation of already
@@ -503,45 +500,41 @@ class AssetModel(QtGui.QStandardItemModel):
         # Refresh data
         # - all items refresh all data except id
         for asset_id, item in self._items_by_asset_id.items():
-            asset_doc = asset_docs_by_id[asset_id]
+            node = hierarchy.get_node(asset_id)
 
-            asset_name = asset_doc["name"]
+            asset_name = node.name
             if item.data(ASSET_NAME_ROLE) != asset_name:
                 item.setData(asset_name, ASSET_NAME_ROLE)
 
-            asset_data = asset_doc.get("data") or {}
-            asset_label = asset_data.get("label") or asset_name
+            asset_label = node.label or asset_name
             if item.data(ASSET_LABEL_ROLE) != asset_label:
                 item.setData(asset_label, QtCore.Qt.DisplayRole)
                 item.setData(asset_label, ASSET_LABEL_ROLE)
 
             has_children = item.rowCount() > 0
-            icon = get_asset_icon(asset_doc, has_children)
+            icon = get_asset_icon_by_name(node.icon, node.color, has_children)
             item.setData(icon, QtCore.Qt.DecorationRole)
 
     def _threaded_fetch(self):
-        asset_docs = self._fetch_asset_docs()
+        hierarchy = self._fetch_asset_hierarchy()
         if not self._refreshing:
             return
 
-        self._doc_payload = asset_docs
+        self._doc_payload = hierarchy
 
         # Emit doc fetched only if was not stopped
         self._doc_fetched.emit()
 
-    def _fetch_asset_docs(self):
+    def _fetch_asset_hierarchy(self):
         project_name = self.dbcon.current_project()
         if not project_name:
-            return []
+            return None
 
         project_doc = get_project(project_name, fields=["_id"])
         if not project_doc:
-            return []
+            return None
 
-        # Get all assets sorted by name
-        return list(
-            get_assets(project_name, fields=self._asset_projection.keys())
-        )
+        return get_asset_hierarchy(project_name, force=self._force_fetch)
 
     def _stop_fetch_thread(self):
         self._refreshing = False
@@ -639,7 +632,7 @@ class AssetsWidget(QtWidgets.QWidget):
 
         selection_model = view.selectionModel()
         selection_model.selectionChanged.connect(self._on_selection_change)
-        refresh_btn.clicked.connect(self.refresh)
+        refresh_btn.clicked.connect(self._on_refresh_clicked)
         current_asset_btn.clicked.connect(self._on_current_asset_click)
         view.doubleClicked.connect(self.double_clicked)
 
@@ -682,6 +675,9 @@ class AssetsWidget(QtWidgets.QWidget):
     def stop_refresh(self):
         self._model.stop_refresh()
 
+    def _on_refresh_clicked(self):
+        self._refresh_model(force_fetch=True)
+
     def _get_current_session_asset(self):
         return self.dbcon.Session.get("AVALON_ASSET")
 
@@ -752,14 +748,14 @@ class AssetsWidget(QtWidgets.QWidget):
         self._set_loading_state(loading=False, empty=not has_item)
         self.refreshed.emit()
 
-    def _refresh_model(self):
+    def _refresh_model(self, force_fetch=False):
         # Store selection
         self._set_loading_state(loading=True, empty=True)
 
         # Trigger signal before refresh is called
         self.refresh_triggered.emit()
         # Refresh model
-        self._model.refresh()
+        self._model.refresh(force_fetch=force_fetch)
 
     def _set_loading_state(self, loading, empty):
         self._view.set_loading_state(loading, empty)
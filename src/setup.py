@@ -4,6 +4,7 @@ import os
 import re
 import platform
 import hashlib
+import importlib.util
 from pathlib import Path
 from typing import List
 
@@ -303,8 +304,28 @@ def generate_checksums_file(root_path, included_paths, dest_file_path):
     print(f">>> Checksum Written to {dest_file_path}")
 
 
-# Generate the checksums file
+def write_defaults_bundle(quadpype_dir_path: Path):
+    """Write precompiled bundle of default settings into the build."""
+    spec = importlib.util.spec_from_file_location(
+        "quadpype_defaults_bundle",
+        quadpype_dir_path.joinpath("settings", "defaults_bundle.py")
+    )
+    defaults_bundle = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(defaults_bundle)
+
+    bundle_path = defaults_bundle.write_defaults_bundle(
+        str(quadpype_dir_path.joinpath("settings", "defaults.pickle")),
+        str(quadpype_dir_path.joinpath("settings", "defaults"))
+    )
+    print(f">>> Default settings bundle written to {bundle_path}")
+
+
 build_dir_path = app_root.joinpath(build_exe_options.get("build_exe"))
+
+# Generate the default settings bundle (must be included in checksums)
+write_defaults_bundle(build_dir_path.joinpath("quadpype"))
+
+# Generate the checksums file
 input_paths = [
     build_dir_path.joinpath("quadpype"),
     build_dir_path.joinpath("LICENSE")
@@ -290,6 +290,7 @@ if "--use-staging" in sys.argv:
     os.environ["QUADPYPE_USE_STAGING"] = "1"
 
 import igniter
+from igniter.module_importer import load_quadpype_module  # noqa: E402
 from igniter.version_classes import (
     PackageHandler,
     PackageVersion
@@ -305,6 +306,14 @@ from igniter.zxp_utils import (
 silent_commands = {"run", "igniter", "standalonepublisher",
                    "extractenvironments", "version"}
 
+# Phase profiler of bootstrap, enabled by 'QUADPYPE_BOOT_PROFILE'
+# - module is loaded directly because QuadPype modules are reloaded from the
+#   running version during the boot
+boot_profiling = load_quadpype_module(
+    "quadpype/lib/profiling.py", "quadpype.lib.profiling"
+)
+boot_profiler = boot_profiling.get_phase_profiler()
+
 
 def list_versions(quadpype_versions: list, local_version=None) -> None:
     """Print list of detected versions."""
@@ -783,12 +792,59 @@ def _initialize_package_manager(database_url, version_str, is_dev_mode):
     return package_manager
 
 
-def boot():
-    """Bootstrap QuadPype."""
-    global silent_mode
-    if any(arg in silent_commands for arg in sys.argv):
-        silent_mode = True
+def _run_in_daemon() -> None:
+    """Run command in warm-start daemon and exit if daemon is available.
+
+    Daemon is used only when `QUADPYPE_DAEMON_SOCKET` is set. Regular boot
+    continues when the daemon is not running or rejected the command.
+    """
+    from igniter.daemon_client import (
+        DAEMON_SOCKET_ENV_KEY,
+        get_command_name,
+        run_in_daemon,
+    )
 
+    if not os.getenv(DAEMON_SOCKET_ENV_KEY):
+        return
+
+    args = sys.argv[1:]
+    if (
+        not args
+        or get_command_name(args) == "daemon"
+        or "--use-version" in args
+    ):
+        return
+
+    exit_code = run_in_daemon(args)
+    if exit_code is not None:
+        sys.exit(exit_code)
+    _print("*** QuadPype daemon is not available, starting regularly.")
+
+
+def _export_projects_core_settings(projects_settings: dict) -> None:
+    """Export projects core settings to environment variables."""
+    env_keys_by_setting = {
+        "use_active_projects_collection": (
+            "QUADPYPE_USE_ACTIVE_PROJECTS_COLLECTION"
+        ),
+        "use_materialized_settings": "QUADPYPE_USE_MATERIALIZED_SETTINGS",
+    }
+    for setting_key, env_key in env_keys_by_setting.items():
+        if projects_settings.get(setting_key, False):
+            os.environ[env_key] = "1"
+        else:
+            os.environ.pop(env_key, None)
+
+
+def _boot_version():
+    """Resolve version of QuadPype and prepare its environment.
+
+    Commands 'validate' and 'print_versions' exit the process.
+
+    Returns:
+        tuple[PackageManager, dict, bool]: Package manager, global settings
+            and if staging is used.
+    """
     # ------------------------------------------------------------------------
     # Set environment to QuadPype root path
     # ------------------------------------------------------------------------
@@ -801,7 +857,8 @@ def boot():
     # ------------------------------------------------------------------------
     # Do necessary startup validations
     # ------------------------------------------------------------------------
-    validate_thirdparty_binaries()
+    with boot_profiler.phase("boot.validate_binaries"):
+        validate_thirdparty_binaries()
 
     # ------------------------------------------------------------------------
     # Process arguments
@@ -830,7 +887,8 @@ def boot():
     # ------------------------------------------------------------------------
 
     try:
-        quadpype_mongo = _determine_mongodb()
+        with boot_profiler.phase("boot.mongodb"):
+            quadpype_mongo = _determine_mongodb()
     except RuntimeError as e:
         # without mongodb url we are done.
         _print(f"!!! {e}", True)
@@ -856,22 +914,27 @@ def boot():
 
     if not use_version:
         # Check if a specific version as been saved in the core settings
-        use_version = get_expected_studio_version_str(use_staging)
+        with boot_profiler.phase("boot.studio_version"):
+            use_version = get_expected_studio_version_str(use_staging)
 
     # Create the Package Manager and add the QuadPype package & the registered AddOns
-    package_manager = _initialize_package_manager(quadpype_mongo, use_version, is_dev_mode)
+    # - includes retrieving and validating of the version archive
+    with boot_profiler.phase("boot.version_resolution"):
+        package_manager = _initialize_package_manager(quadpype_mongo, use_version, is_dev_mode)
 
     # Ensure the settings will be retrieved from the correct running version
     running_version = package_manager["quadpype"].running_version
 
     # Get the full settings with the final version that will be used
-    global_settings = get_global_settings_no_handler(
-        quadpype_mongo,
-        str(running_version)
-    )
+    with boot_profiler.phase("boot.settings"):
+        global_settings = get_global_settings_no_handler(
+            quadpype_mongo,
+            str(running_version)
+        )
 
     _print(">>> Run disk mapping command ...")
-    run_disk_mapping_commands(global_settings)
+    with boot_profiler.phase("boot.disk_mapping"):
+        run_disk_mapping_commands(global_settings)
 
     # Logging to server enabled/disabled
     log_to_server = global_settings.get("log_to_server", True)
@@ -884,7 +947,8 @@ def boot():
     _print(f">>> Logging to server is turned {log_to_server_msg}")
 
     if "validate" in commands:
-        valid = package_manager["quadpype"].validate_checksums(QUADPYPE_ROOT)[0]
+        with boot_profiler.phase("boot.checksum"):
+            valid = package_manager["quadpype"].validate_checksums(QUADPYPE_ROOT)[0]
         sys.exit(0 if valid else 1)
 
     if not package_manager["quadpype"].remote_sources:
@@ -894,12 +958,7 @@ def boot():
         os.environ["QUADPYPE_PATH"] = str(package_manager["quadpype"].get_accessible_remote_source())
 
     core_settings = global_settings.get('core', {})
-    projects_settings = core_settings.get('projects', {})
-    use_active_projects_collection = projects_settings.get('use_active_projects_collection', False)
-    if use_active_projects_collection:
-        os.environ["QUADPYPE_USE_ACTIVE_PROJECTS_COLLECTION"] = "1"
-    else:
-        os.environ.pop("QUADPYPE_USE_ACTIVE_PROJECTS_COLLECTION", None)
+    _export_projects_core_settings(core_settings.get('projects', {}))
 
     if "print_versions" in commands:
         _boot_print_versions(package_manager["quadpype"])
@@ -911,6 +970,27 @@ def boot():
 
     _initialize_environment(running_version)
 
+    return package_manager, global_settings, use_staging
+
+
+def boot():
+    """Bootstrap QuadPype."""
+    global silent_mode
+    if any(arg in silent_commands for arg in sys.argv):
+        silent_mode = True
+
+    # ------------------------------------------------------------------------
+    # Skip bootstrap if the command can run in warm-start daemon
+    # ------------------------------------------------------------------------
+    _run_in_daemon()
+
+    boot_phase = boot_profiler.start_phase("boot")
+    try:
+        package_manager, global_settings, use_staging = _boot_version()
+    finally:
+        # Phase is closed also when command exits during the boot
+        boot_profiler.end_phase(boot_phase)
+
     # delete QuadPype module and it's submodules from cache so it is used from
     # specific version
     modules_to_del = [
@@ -932,19 +1012,31 @@ def boot():
     from quadpype.lib.version import set_package_manager
     set_package_manager(package_manager)
 
+    # Continue with profiler of the running version
+    try:
+        from quadpype.lib.profiling import get_phase_profiler
+        phase_profiler = get_phase_profiler()
+        phase_profiler.merge(boot_profiler)
+    except (ImportError, AttributeError):
+        # Running version is older than the bootstrap
+        phase_profiler = boot_profiler
+
     from quadpype.lib.user import update_user_profile_on_startup
 
     # Do the program display popups to the users regarding updates or incompatibilities
     _print(">>> Loading user profile ...")
-    update_user_profile_on_startup()
+    with phase_profiler.phase("boot.user_profile"):
+        update_user_profile_on_startup()
     _print(">>> Loading environments ...")
     # Avalon environments must be set before avalon module is imported
     _print("  - for Avalon ...")
     set_avalon_environments()
     _print("  - global QuadPype ...")
-    set_quadpype_global_environments()
+    with phase_profiler.phase("boot.global_environments"):
+        set_quadpype_global_environments()
     _print("  - for addons ...")
-    set_addons_environments()
+    with phase_profiler.phase("boot.addons"):
+        set_addons_environments()
 
     running_version = package_manager["quadpype"].running_version
     running_version_fullpath = running_version.location.resolve()
@@ -953,7 +1045,8 @@ def boot():
     allowed_apps = ['photoshop', 'aftereffects']
     if not current_app or re.match(rf'^({"|".join(allowed_apps)})[/\\\-_]', current_app):
         _print(">>> Check ZXP extensions ...")
-        _update_zxp_extensions(running_version_fullpath, global_settings)
+        with phase_profiler.phase("boot.zxp_extensions"):
+            _update_zxp_extensions(running_version_fullpath, global_settings)
 
     # print info when not running scripts defined in 'silent commands'
     if all(arg not in silent_commands for arg in sys.argv):
@@ -976,6 +1069,9 @@ def boot():
         for i in info:
             t.echo(i)
 
+    # Long-running commands (e.g. tray) write the report again at exit
+    phase_profiler.write_report()
+
     from quadpype import cli
     try:
         cli.main(obj={}, prog_name="quadpype")
@@ -6,6 +6,7 @@ import shutil
 import hashlib
 import platform
 import tempfile
+import importlib.util
 
 from typing import Union, List
 from zipfile import ZipFile
@@ -26,7 +27,9 @@ INCLUSION_LIST = [
 ]
 EXCLUSION_LIST = [
     ".pyc",
-    "__pycache__"
+    "__pycache__",
+    # Generated when the archive is created
+    "defaults.pickle"
 ]
 
 
@@ -124,6 +127,14 @@ def get_included_files_list(root_path: Path) -> List[Path]:
     return included_files
 
 
+def _load_source_module(module_path: Path, module_name: str):
+    """Load module from QuadPype sources without its package."""
+    spec = importlib.util.spec_from_file_location(module_name, module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
 def create_quadpype_zip(zip_path: Path, quadpype_path: Path) -> None:
     """Pack repositories and QuadPype into zip.
 
@@ -165,6 +176,19 @@ def create_quadpype_zip(zip_path: Path, quadpype_path: Path) -> None:
                 file, file.resolve().relative_to(quadpype_root))
             progress_bar.update()
 
+        # Add precompiled bundle of default settings
+        defaults_bundle = _load_source_module(
+            quadpype_root.joinpath("quadpype", "settings", "defaults_bundle.py"),
+            "quadpype_defaults_bundle"
+        )
+        bundle_content = defaults_bundle.create_defaults_bundle(
+            str(quadpype_root.joinpath("quadpype", "settings", "defaults")))
+        bundle_arcname = "quadpype/settings/defaults.pickle"
+        checksums.append(
+            (hashlib.sha256(bundle_content).hexdigest(), Path(bundle_arcname))
+        )
+        zip_file.writestr(bundle_arcname, bundle_content)
+
         # Add License file
         zip_file.write(quadpype_root.parent / "LICENSE", "LICENSE")
 
@@ -211,6 +235,25 @@ def move_zip_to_dir(zip_file, out_dir_path) -> Union[None, Path]:
         _print(str(e), 1)
 
 
+def update_versions_index(src_root: Path, out_dir_path: Path) -> None:
+    """Update index of archives read by clients discovering versions.
+
+    Version module is loaded from the sources without its package, the same
+    way as Igniter does.
+
+    Args:
+        src_root (Path): Path to QuadPype sources.
+        out_dir_path (Path): Directory containing the patch archives.
+
+    """
+    version_module = _load_source_module(
+        src_root.joinpath("quadpype", "lib", "version.py"),
+        "quadpype_lib_version"
+    )
+    version_module.PackageHandler.write_versions_index(
+        "quadpype", out_dir_path)
+
+
 def create_version_from_live_code(out_dir_path):
     # Determine source directory and current version
     src_root = Path(__file__)
@@ -242,6 +285,13 @@ def create_version_from_live_code(out_dir_path):
 
         move_zip_to_dir(temp_zip, out_dir_path)
 
+    _print(f"Updating versions index in {out_dir_path}")
+    try:
+        update_versions_index(src_root, out_dir_path)
+    except Exception as e:  # noqa
+        # Clients fall back to scanning the archives
+        _print(f"Failed to update versions index: {e}", 1)
+
     return semver.VersionInfo.parse(version=version_str)
 
 